@@ -0,0 +1,191 @@
+##
+# \file image_geometry.py
+# \brief      Class holding the geometry of an image without its pixel data
+#
+# \author     Michael Ebner (michael.ebner.14@ucl.ac.uk)
+# \date       October 2026
+#
+
+import numpy as np
+
+
+##
+# Immutable and hashable description of an image grid, i.e. size, spacing,
+# origin and direction.
+#
+# The homogeneous index-to-physical affine [[R S, o], [0, 1]] and its inverse
+# are computed once at construction. The getters of sitk.Image (GetSize,
+# GetSpacing, GetOrigin, GetDirection, GetDimension) are provided so that
+# geometry objects can be used wherever only the image header is required.
+# Since objects are hashable they can serve as (cheap) cache keys.
+# \date       2026-10-17 19:40:12+0100
+#
+class ImageGeometry(object):
+
+    __slots__ = [
+        "_size",
+        "_spacing",
+        "_origin",
+        "_direction",
+        "_affine",
+        "_affine_inverse",
+        "_hash",
+    ]
+
+    ##
+    # Store image geometry
+    # \date       2026-10-17 19:42:30+0100
+    #
+    # \param      self       The object
+    # \param      size       size of image as obtained via GetSize
+    # \param      spacing    spacing of image as obtained via GetSpacing
+    # \param      origin     origin of image as obtained via GetOrigin
+    # \param      direction  flattened direction matrix as obtained via
+    #                        GetDirection
+    #
+    def __init__(self, size, spacing, origin, direction):
+        self._size = tuple(int(s) for s in size)
+        self._spacing = tuple(float(s) for s in spacing)
+        self._origin = tuple(float(o) for o in origin)
+        self._direction = tuple(float(d) for d in np.ravel(direction))
+
+        dim = len(self._size)
+        if len(self._spacing) != dim or len(self._origin) != dim \
+                or len(self._direction) != dim * dim:
+            raise ValueError("Dimensions of image geometry are not consistent")
+
+        affine = np.eye(dim + 1)
+        affine[0:dim, 0:dim] = np.reshape(
+            self._direction, (dim, dim)) * self._spacing
+        affine[0:dim, dim] = self._origin
+        affine_inverse = np.linalg.inv(affine)
+
+        affine.flags.writeable = False
+        affine_inverse.flags.writeable = False
+        self._affine = affine
+        self._affine_inverse = affine_inverse
+
+        self._hash = hash(
+            (self._size, self._spacing, self._origin, self._direction))
+
+    ##
+    # Create geometry of an image
+    # \date       2026-10-17 19:45:03+0100
+    #
+    # \param      cls         The cls
+    # \param      image_sitk  sitk.Image object or any object providing
+    #                         GetSize, GetSpacing, GetOrigin and GetDirection
+    #
+    # \return     ImageGeometry object
+    #
+    @classmethod
+    def from_sitk(cls, image_sitk):
+        return cls(image_sitk.GetSize(),
+                   image_sitk.GetSpacing(),
+                   image_sitk.GetOrigin(),
+                   image_sitk.GetDirection())
+
+    def __eq__(self, other):
+        if not isinstance(other, ImageGeometry):
+            return NotImplemented
+        return self._hash == other._hash \
+            and self._size == other._size \
+            and self._spacing == other._spacing \
+            and self._origin == other._origin \
+            and self._direction == other._direction
+
+    def __ne__(self, other):
+        equal = self.__eq__(other)
+        if equal is NotImplemented:
+            return equal
+        return not equal
+
+    def __hash__(self):
+        return self._hash
+
+    def __repr__(self):
+        return "ImageGeometry(size=%s, spacing=%s, origin=%s, " \
+            "direction=%s)" % (
+                self._size, self._spacing, self._origin, self._direction)
+
+    def GetSize(self):
+        return self._size
+
+    def GetSpacing(self):
+        return self._spacing
+
+    def GetOrigin(self):
+        return self._origin
+
+    def GetDirection(self):
+        return self._direction
+
+    def GetDimension(self):
+        return len(self._size)
+
+    def GetNumberOfPixels(self):
+        return int(np.prod(self._size))
+
+    ##
+    # Gets the homogeneous index-to-physical affine.
+    # \date       2026-10-17 19:47:21+0100
+    #
+    # \param      self  The object
+    #
+    # \return     read-only (dim+1 x dim+1)-numpy array
+    #
+    def get_affine(self):
+        return self._affine
+
+    ##
+    # Gets the homogeneous physical-to-index affine.
+    # \date       2026-10-17 19:48:02+0100
+    #
+    # \param      self  The object
+    #
+    # \return     read-only (dim+1 x dim+1)-numpy array
+    #
+    def get_affine_inverse(self):
+        return self._affine_inverse
+
+    ##
+    # Gets the matrix R S of the index-to-physical affine.
+    # \date       2026-10-17 19:48:40+0100
+    #
+    # \param      self  The object
+    #
+    # \return     read-only (dim x dim)-numpy array
+    #
+    def get_matrix(self):
+        dim = len(self._size)
+        return self._affine[0:dim, 0:dim]
+
+    ##
+    # Map many (continuous) voxel indices to physical points
+    # \date       2026-10-17 19:50:16+0100
+    #
+    # \param      self     The object
+    # \param      indices  (N x dim)-numpy array of indices in (i, j, k)-order
+    #                      or single index of length dim
+    #
+    # \return     (N x dim)-numpy array (or point of length dim)
+    #
+    def transform_indices_to_physical_points(self, indices):
+        dim = len(self._size)
+        return np.asarray(indices, dtype=np.float64).dot(
+            self._affine[0:dim, 0:dim].T) + self._affine[0:dim, dim]
+
+    ##
+    # Map many physical points to continuous voxel indices
+    # \date       2026-10-17 19:51:33+0100
+    #
+    # \param      self    The object
+    # \param      points  (N x dim)-numpy array or single point of length dim
+    #
+    # \return     (N x dim)-numpy array (or index of length dim)
+    #
+    def transform_physical_points_to_indices(self, points):
+        dim = len(self._size)
+        return np.asarray(points, dtype=np.float64).dot(
+            self._affine_inverse[0:dim, 0:dim].T) + \
+            self._affine_inverse[0:dim, dim]
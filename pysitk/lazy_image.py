@@ -0,0 +1,185 @@
+##
+# \file lazy_image.py
+# \brief      Class to represent an image file whose pixel data are only read
+#             on first access
+#
+# \author     Michael Ebner (michael.ebner.14@ucl.ac.uk)
+# \date       October 2026
+#
+
+import os
+import SimpleITK as sitk
+
+from pysitk.image_geometry import ImageGeometry
+
+
+##
+# Proxy of an image file which reads the image header immediately but defers
+# reading the pixel data until they are accessed.
+#
+# The header is read via sitk.ImageFileReader.ReadImageInformation, so that
+# size, spacing, origin, direction, pixel type and the (NIfTI) header fields
+# stored as meta data are available at the cost of reading the header only.
+# The getters of sitk.Image are provided so that proxies can be used wherever
+# only the image header is required, e.g. by the geometry helpers in
+# simple_itk_helper.
+#
+# Pixel data are read on the first call of get_sitk. Without cache, the image
+# is kept by the proxy until unload is called. With cache (e.g. an LRUCache
+# bounded by max_bytes), the image is kept by the cache only, so that memory
+# stays bounded when iterating over many proxies.
+# \date       2026-10-18 00:52:17+0100
+#
+class LazyImage(object):
+
+    ##
+    # Read image header
+    # \date       2026-10-18 00:54:02+0100
+    #
+    # \param      self          The object
+    # \param      path_to_file  path to image file
+    # \param      pixel_type    pixel type of image as sitk object; pixel type
+    #                           of file if sitk.sitkUnknown
+    # \param      cache         cache providing get(key) and put(key, value,
+    #                           nbytes), e.g. LRUCache; pixel data are kept by
+    #                           the proxy if None
+    #
+    def __init__(self,
+                 path_to_file,
+                 pixel_type=sitk.sitkUnknown,
+                 cache=None):
+
+        self._path_to_file = os.path.abspath(str(path_to_file))
+        self._pixel_type = pixel_type
+        self._cache = cache
+        self._image_sitk = None
+
+        reader = sitk.ImageFileReader()
+        reader.SetFileName(self._path_to_file)
+        reader.ReadImageInformation()
+
+        self._geometry = ImageGeometry(
+            reader.GetSize(),
+            reader.GetSpacing(),
+            reader.GetOrigin(),
+            reader.GetDirection())
+
+        self._pixel_id = reader.GetPixelID() \
+            if pixel_type == sitk.sitkUnknown else pixel_type
+        self._number_of_components = reader.GetNumberOfComponents()
+        self._meta_data = dict(
+            (k, reader.GetMetaData(k)) for k in reader.GetMetaDataKeys())
+
+        # Nanosecond resolution (Python 3) so that rewrites within the
+        # resolution of st_mtime yield a different cache key
+        stat = os.stat(self._path_to_file)
+        self._key = (self._path_to_file,
+                     getattr(stat, "st_mtime_ns", stat.st_mtime),
+                     stat.st_size,
+                     pixel_type)
+
+    def __repr__(self):
+        return "LazyImage('%s', loaded=%s)" % (
+            self._path_to_file, self.is_loaded())
+
+    def get_path_to_file(self):
+        return self._path_to_file
+
+    ##
+    # Gets the geometry of the image.
+    # \date       2026-10-18 00:56:33+0100
+    #
+    # \param      self  The object
+    #
+    # \return     ImageGeometry object
+    #
+    def get_geometry(self):
+        return self._geometry
+
+    def GetSize(self):
+        return self._geometry.GetSize()
+
+    def GetSpacing(self):
+        return self._geometry.GetSpacing()
+
+    def GetOrigin(self):
+        return self._geometry.GetOrigin()
+
+    def GetDirection(self):
+        return self._geometry.GetDirection()
+
+    def GetDimension(self):
+        return self._geometry.GetDimension()
+
+    def GetNumberOfPixels(self):
+        return self._geometry.GetNumberOfPixels()
+
+    def GetPixelID(self):
+        return self._pixel_id
+
+    def GetPixelIDValue(self):
+        return self._pixel_id
+
+    def GetPixelIDTypeAsString(self):
+        return sitk.GetPixelIDValueAsString(self._pixel_id)
+
+    def GetNumberOfComponentsPerPixel(self):
+        return self._number_of_components
+
+    def GetMetaDataKeys(self):
+        return tuple(sorted(self._meta_data.keys()))
+
+    def HasMetaDataKey(self, key):
+        return key in self._meta_data
+
+    def GetMetaData(self, key):
+        return self._meta_data[key]
+
+    ##
+    # Check whether pixel data are available without reading the file.
+    # \date       2026-10-18 00:58:10+0100
+    #
+    # \param      self  The object
+    #
+    # \return     True if image is held by proxy or cache, False otherwise
+    #
+    def is_loaded(self):
+        if self._image_sitk is not None:
+            return True
+        return self._cache is not None and self._key in self._cache
+
+    ##
+    # Gets the image including its pixel data; the file is read on first
+    # access (or if the image was evicted from the cache).
+    # \date       2026-10-18 01:00:45+0100
+    #
+    # \param      self  The object
+    #
+    # \return     sitk.Image object (shallow copy)
+    #
+    def get_sitk(self):
+        image_sitk = self._image_sitk
+        if image_sitk is None and self._cache is not None:
+            image_sitk = self._cache.get(self._key)
+
+        if image_sitk is None:
+            image_sitk = sitk.ReadImage(self._path_to_file, self._pixel_type)
+
+            if self._cache is None:
+                self._image_sitk = image_sitk
+            else:
+                self._cache.put(
+                    self._key, image_sitk,
+                    sitk.GetArrayViewFromImage(image_sitk).nbytes)
+
+        # Shallow copy so that header changes do not alter the held image
+        return sitk.Image(image_sitk)
+
+    ##
+    # Release the pixel data held by the proxy (not by the cache).
+    # \date       2026-10-18 01:02:11+0100
+    #
+    # \param      self  The object
+    #
+    def unload(self):
+        self._image_sitk = None
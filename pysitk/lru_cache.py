@@ -0,0 +1,120 @@
+##
+# \file lru_cache.py
+# \brief      Thread-safe least-recently-used cache bounded by number of items
+#             and/or memory size
+#
+# \author     Michael Ebner (michael.ebner.14@ucl.ac.uk)
+# \date       October 2026
+#
+
+import threading
+import collections
+
+
+##
+# Least-recently-used cache.
+#
+# Items are evicted in least-recently-used order as soon as either the number
+# of items exceeds max_items or the accumulated size exceeds max_bytes. The
+# size of an item is provided when it is stored.
+# \date       2026-10-17 15:02:44+0100
+#
+class LRUCache(object):
+
+    ##
+    # Set cache limits
+    # \date       2026-10-17 15:03:30+0100
+    #
+    # \param      self       The object
+    # \param      max_items  maximum number of items; unbounded if None
+    # \param      max_bytes  maximum accumulated size of items in bytes;
+    #                        unbounded if None
+    #
+    def __init__(self, max_items=None, max_bytes=None):
+        self._max_items = max_items
+        self._max_bytes = max_bytes
+
+        self._items = collections.OrderedDict()
+        self._nbytes = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._items)
+
+    def __contains__(self, key):
+        return key in self._items
+
+    def get_nbytes(self):
+        return self._nbytes
+
+    def get_max_items(self):
+        return self._max_items
+
+    def set_max_items(self, max_items):
+        with self._lock:
+            self._max_items = max_items
+            self._evict()
+
+    def get_max_bytes(self):
+        return self._max_bytes
+
+    def set_max_bytes(self, max_bytes):
+        with self._lock:
+            self._max_bytes = max_bytes
+            self._evict()
+
+    ##
+    # Get cached item and mark it as most recently used
+    # \date       2026-10-17 15:05:12+0100
+    #
+    # \param      self     The object
+    # \param      key      hashable key
+    # \param      default  returned if key is not cached
+    #
+    # \return     cached item or default
+    #
+    def get(self, key, default=None):
+        with self._lock:
+            try:
+                value, nbytes = self._items.pop(key)
+            except KeyError:
+                return default
+            self._items[key] = (value, nbytes)
+            return value
+
+    ##
+    # Store item as most recently used one
+    # \date       2026-10-17 15:06:40+0100
+    #
+    # \param      self    The object
+    # \param      key     hashable key
+    # \param      value   item to cache
+    # \param      nbytes  size of item in bytes; only required if cache is
+    #                     bounded by max_bytes
+    #
+    def put(self, key, value, nbytes=0):
+        with self._lock:
+            if key in self._items:
+                self._nbytes -= self._items.pop(key)[1]
+
+            # Do not flush entire cache for a single item that does not fit
+            if self._max_bytes is not None and nbytes > self._max_bytes:
+                return
+
+            self._items[key] = (value, nbytes)
+            self._nbytes += nbytes
+            self._evict()
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+            self._nbytes = 0
+
+    def _evict(self):
+        while len(self._items) > 0 and (
+            (self._max_items is not None and
+             len(self._items) > self._max_items) or
+            (self._max_bytes is not None and
+             self._nbytes > self._max_bytes)
+        ):
+            self._nbytes -= self._items.popitem(last=False)[1][1]
@@ -12,14 +12,27 @@ import os
 import itk
 import six
 import fnmatch
+import hashlib
 import datetime
+import threading
+import collections
 import subprocess
+import multiprocessing
+import multiprocessing.pool
 import numpy as np
 import nibabel as nib
 import SimpleITK as sitk
 import matplotlib.pyplot as plt
 
 import pysitk.python_helper as ph
+import pysitk.transform_registry as tr
+from pysitk.lru_cache import LRUCache
+from pysitk.lazy_image import LazyImage
+from pysitk.image_geometry import ImageGeometry
+from pysitk.transform_batch import TransformBatch
+from pysitk.transform_batch import TRANSLATION_FREE_TRANSFORM_TYPES
+from pysitk.transform_chain import TransformChain
+from pysitk.transform_bulk_file import TransformBulkFile
 from pysitk.definitions import VIEWER
 from pysitk.definitions import DIR_TMP
 from pysitk.definitions import ITKSNAP_EXE, FSLVIEW_EXE, NIFTYVIEW_EXE
@@ -45,6 +58,18 @@ TRANSFORM_SITK_DOF_LABELS_SHORT = {
         "t_z"],
 }
 
+# Parsed transform files keyed by path, modification time and size
+TRANSFORM_FILE_CACHE = LRUCache(max_items=8192)
+
+# Number of points mapped at once through non-linear transforms
+POINTS_CHUNK_SIZE = 65536
+
+# Default budget for intermediate arrays of chunked grid evaluations
+CHUNK_MAX_BYTES = 256 * 1024 ** 2
+
+# Pyramid levels keyed by input geometry, content hash and level parameters
+IMAGE_PYRAMID_CACHE = LRUCache(max_bytes=1024 ** 3)
+
 
 ##
 # Get composite transform of two affine/euler sitk transforms
@@ -78,7 +103,7 @@ def get_composite_sitk_affine_transform(transform_outer, transform_inner):
             or transform_outer.GetName() != transform_inner.GetName():
         trafo = sitk.AffineTransform(dim)
     else:
-        trafo = eval("sitk." + transform_outer.GetName() + "()")
+        trafo = tr.get_transform_type_of_sitk(transform_outer).new_sitk()
 
     trafo.SetMatrix(A_composite.flatten())
     trafo.SetTranslation(t_composite)
@@ -117,7 +142,7 @@ def get_composite_sitk_euler_transform(transform_outer, transform_inner):
     t_composite = A_outer.dot(
         t_inner + c_inner - c_outer) + t_outer + c_outer - c_inner
 
-    euler = eval("sitk." + transform_outer.GetName() + "()")
+    euler = tr.get_transform_type_of_sitk(transform_outer).new_sitk()
     euler.SetMatrix(A_composite.flatten())
     euler.SetTranslation(t_composite)
     euler.SetCenter(c_composite)
@@ -125,6 +150,484 @@ def get_composite_sitk_euler_transform(transform_outer, transform_inner):
     return euler
 
 
+##
+# Apply function to all items using a pool of threads.
+#
+# Useful for functions that release the GIL, e.g. most SimpleITK filters and
+# file IO.
+# \date       2026-10-17 15:28:50+0100
+#
+# \param      function   function taking a single item
+# \param      items      list of items
+# \param      n_workers  number of threads; number of CPUs if None
+#
+# \return     list of results in the order of items
+#
+def _map_in_thread_pool(function, items, n_workers=None):
+    items = list(items)
+    if n_workers is None:
+        n_workers = multiprocessing.cpu_count()
+    n_workers = max(1, min(n_workers, len(items)))
+
+    if n_workers == 1:
+        return [function(item) for item in items]
+
+    pool = multiprocessing.pool.ThreadPool(n_workers)
+    try:
+        return pool.map(function, items)
+    finally:
+        pool.close()
+        pool.join()
+
+
+##
+# Gets the homogeneous matrix of an affine-type sitk transform.
+#
+# The transform T(x) = A(x - c) + t + c is expressed as the
+# (dim+1 x dim+1)-matrix [[A, t + c - Ac], [0, 1]].
+# \date       2026-10-17 10:12:31+0100
+#
+# \param      transform_sitk  affine-type transform, e.g. sitk.Euler3DTransform
+#                             or sitk.AffineTransform
+#
+# \return     (dim+1 x dim+1)-numpy array
+#
+def get_homogeneous_matrix_from_sitk_transform(transform_sitk):
+    dim = transform_sitk.GetDimension()
+
+    # Generic sitk.Transform objects do not provide GetMatrix etc.
+    if not hasattr(transform_sitk, "GetMatrix"):
+        transform_sitk = tr.get_transform_type_of_sitk(
+            transform_sitk).get_sitk(transform_sitk)
+
+    A = np.asarray(transform_sitk.GetMatrix()).reshape(dim, dim)
+    c = np.asarray(transform_sitk.GetCenter())
+
+    # VersorTransform has no translation
+    if hasattr(transform_sitk, "GetTranslation"):
+        t = np.asarray(transform_sitk.GetTranslation())
+    else:
+        t = np.zeros(dim)
+
+    matrix = np.eye(dim + 1)
+    matrix[0:dim, 0:dim] = A
+    matrix[0:dim, dim] = t + c - A.dot(c)
+
+    return matrix
+
+
+##
+# Gets the sitk transform from a homogeneous matrix.
+# \date       2026-10-17 10:20:05+0100
+#
+# \param      matrix          (dim+1 x dim+1)-numpy array
+# \param      center          center of the returned transform; zero if None
+# \param      transform_type  name of sitk transform type, e.g.
+#                             "Euler3DTransform" or "AffineTransform"
+#
+# \return     sitk transform of type transform_type
+#
+# \exception  ValueError  transform type does not support the translation
+#                         of the matrix, e.g. VersorTransform
+#
+def get_sitk_transform_from_homogeneous_matrix(matrix,
+                                               center=None,
+                                               transform_type="AffineTransform",
+                                               ):
+    dim = matrix.shape[0] - 1
+    A = matrix[0:dim, 0:dim]
+    offset = matrix[0:dim, dim]
+
+    if center is None:
+        center = np.zeros(dim)
+    center = np.asarray(center, dtype=np.float64)
+
+    transform_sitk = tr.get_transform_type(transform_type, dim).new_sitk()
+
+    transform_sitk.SetMatrix(A.flatten())
+    transform_sitk.SetCenter(center)
+
+    translation = offset - center + A.dot(center)
+    if transform_type not in TRANSLATION_FREE_TRANSFORM_TYPES:
+        transform_sitk.SetTranslation(translation)
+    elif not np.allclose(translation, 0):
+        raise ValueError(
+            "Transform type '%s' does not support a translation" %
+            transform_type)
+
+    return transform_sitk
+
+
+##
+# Compose stacked chains of homogeneous matrices via tree reduction.
+#
+# For each of the N chains the product M_0 M_1 ... M_{L-1} is computed, i.e.
+# M_0 is the outermost transform. Pairs of neighbouring matrices are
+# multiplied in one vectorized matmul per reduction level so that only
+# log2(L) numpy calls are required.
+# \date       2026-10-17 10:31:47+0100
+#
+# \param      matrices  (N x L x dim+1 x dim+1)-numpy array
+#
+# \return     (N x dim+1 x dim+1)-numpy array of composite matrices
+#
+def get_composite_homogeneous_matrices(matrices):
+    matrices = np.asarray(matrices, dtype=np.float64)
+    if matrices.ndim != 4:
+        raise ValueError(
+            "Matrices must be given as (N x L x dim+1 x dim+1)-array")
+
+    while matrices.shape[1] > 1:
+        if matrices.shape[1] % 2:
+            # Keep innermost matrix for next reduction level
+            composite = np.matmul(matrices[:, 0:-1:2], matrices[:, 1::2])
+            matrices = np.concatenate((composite, matrices[:, -1:]), axis=1)
+        else:
+            matrices = np.matmul(matrices[:, 0::2], matrices[:, 1::2])
+
+    return matrices[:, 0]
+
+
+##
+# Get composite transforms of many chains of affine/euler sitk transforms.
+#
+# Batched counterpart of get_composite_sitk_affine_transform. Each chain
+# [T_0, T_1, ..., T_{L-1}] is composed to T_0 o T_1 o ... o T_{L-1}, i.e. in
+# the same outer-to-inner order as (transform_outer, transform_inner).
+# Chains of differing lengths are padded with identities. The returned sitk
+# transform is of the same type as the chain elements if they all share the
+# same (non-affine) type and sitk.AffineTransform otherwise, as for
+# TransformBatch.compose. Its center is the one of the innermost transform.
+#
+# Alternatively, the chain can be given as list of TransformBatch objects
+# [B_0, B_1, ..., B_{L-1}] where each B_j holds the j-th transform of all
+# chains (batches of length one are broadcast).
+# \date       2026-10-17 10:48:12+0100
+#
+# \param      transform_chains  list of N lists of sitk transforms,
+#                               (N x L x dim+1 x dim+1)-numpy array of
+#                               homogeneous matrices or list of L
+#                               TransformBatch objects
+# \param      as_sitk           return sitk transforms if True, otherwise
+#                               homogeneous matrices
+#
+# \return     list of N sitk transforms or (N x dim+1 x dim+1)-numpy array
+#
+def get_composite_sitk_affine_transforms(transform_chains, as_sitk=True):
+
+    if len(transform_chains) == 0:
+        raise ValueError("At least one transform chain is required")
+
+    if isinstance(transform_chains[0], TransformBatch):
+        transform_batch = transform_chains[-1]
+        for transform_batch_outer in transform_chains[-2::-1]:
+            transform_batch = transform_batch_outer.compose(transform_batch)
+        if not as_sitk:
+            return transform_batch.get_homogeneous_matrices()
+        return transform_batch.get_sitk_transforms()
+
+    if isinstance(transform_chains, np.ndarray):
+        matrices = get_composite_homogeneous_matrices(transform_chains)
+        if not as_sitk:
+            return matrices
+        return [get_sitk_transform_from_homogeneous_matrix(m)
+                for m in matrices]
+
+    if any([len(chain) == 0 for chain in transform_chains]):
+        raise ValueError("Transform chains must not be empty")
+
+    N = len(transform_chains)
+    L = max([len(chain) for chain in transform_chains])
+    dim = transform_chains[0][0].GetDimension()
+
+    # Initialize with identities to pad chains of differing lengths
+    matrices = np.tile(np.eye(dim + 1), (N, L, 1, 1))
+    for i, chain in enumerate(transform_chains):
+        for j, transform_sitk in enumerate(chain):
+            matrices[i, j] = get_homogeneous_matrix_from_sitk_transform(
+                transform_sitk)
+
+    matrices = get_composite_homogeneous_matrices(matrices)
+    if not as_sitk:
+        return matrices
+
+    transforms_sitk = [None] * N
+    for i, chain in enumerate(transform_chains):
+        # Downcast generic sitk.Transform objects to obtain their actual type
+        names = set([tr.get_transform_type_of_sitk(transform_sitk).name
+                     for transform_sitk in chain])
+
+        # Compositions of transforms without translation parameters (e.g.
+        # rotations about different centers) generally require one
+        if len(names) == 1 \
+                and "AffineTransform" not in names \
+                and names.isdisjoint(TRANSLATION_FREE_TRANSFORM_TYPES):
+            transform_type = names.pop()
+        else:
+            transform_type = "AffineTransform"
+        transforms_sitk[i] = get_sitk_transform_from_homogeneous_matrix(
+            matrices[i],
+            center=chain[-1].GetFixedParameters()[0:dim],
+            transform_type=transform_type)
+
+    return transforms_sitk
+
+
+##
+# Gets the homogeneous matrix of a sitk transform if it is linear.
+# \date       2026-10-17 16:40:12+0100
+#
+# \param      transform_sitk  sitk transform
+#
+# \return     (dim+1 x dim+1)-numpy array or None if transform is non-linear
+#
+def _get_linear_homogeneous_matrix(transform_sitk):
+    name = transform_sitk.GetName()
+    dim = transform_sitk.GetDimension()
+
+    if name in tr.AFFINE_TRANSFORM_NAMES:
+        return get_homogeneous_matrix_from_sitk_transform(transform_sitk)
+
+    matrix = np.eye(dim + 1)
+    if name == "TranslationTransform":
+        matrix[0:dim, dim] = transform_sitk.GetOffset()
+        return matrix
+
+    if name == "ScaleTransform":
+        scale = np.asarray(transform_sitk.GetScale())
+        c = np.asarray(transform_sitk.GetCenter())
+        matrix[0:dim, 0:dim] = np.diag(scale)
+        matrix[0:dim, dim] = c - scale * c
+        return matrix
+
+    return None
+
+
+##
+# Flattens a transform chain into a list of elementary sitk transforms.
+#
+# Generic sitk.Transform objects are downcast and composite transforms are
+# expanded into their components (outermost first).
+# \date       2026-10-17 16:42:51+0100
+#
+# \param      transforms_sitk  list of sitk transforms, outermost first
+#
+# \return     list of sitk transforms, outermost first
+#
+def _get_flattened_sitk_transform_chain(transforms_sitk):
+    chain = []
+    for transform_sitk in transforms_sitk:
+        if transform_sitk.GetName() == "Transform" \
+                and hasattr(transform_sitk, "Downcast"):
+            transform_sitk = transform_sitk.Downcast()
+
+        if transform_sitk.GetName() == "CompositeTransform" \
+                and hasattr(transform_sitk, "GetNthTransform"):
+            chain.extend(_get_flattened_sitk_transform_chain([
+                transform_sitk.GetNthTransform(i)
+                for i in range(transform_sitk.GetNumberOfTransforms())]))
+        else:
+            chain.append(transform_sitk)
+
+    return chain
+
+
+##
+# Map points through a transform by calling TransformPoint for each of them.
+#
+# Fallback for non-linear transforms; points are processed in chunks to
+# bound the memory of intermediate Python objects.
+# \date       2026-10-17 16:45:27+0100
+#
+# \param      points          (N x dim)-numpy array
+# \param      transform_sitk  sitk transform
+# \param      chunk_size      number of points processed at once
+#
+# \return     (N x dim)-numpy array
+#
+def _transform_points_pointwise_sitk(points, transform_sitk, chunk_size):
+    points_transformed = np.empty_like(points)
+    for i in range(0, points.shape[0], chunk_size):
+        points_transformed[i:i + chunk_size] = [
+            transform_sitk.TransformPoint(point)
+            for point in points[i:i + chunk_size].tolist()]
+
+    return points_transformed
+
+
+##
+# Map many points through a sitk transform or a chain of transforms.
+#
+# Linear transforms (including consecutive linear transforms of a chain) are
+# applied in their matrix form using numpy. Non-linear transforms, e.g.
+# sitk.BSplineTransform or sitk.DisplacementFieldTransform, are evaluated
+# point by point in chunks of chunk_size points.
+# \date       2026-10-17 16:50:03+0100
+#
+# \param      points      (N x dim)-numpy array or single point of length dim
+# \param      transform   sitk transform, list of sitk transforms
+#                         [T_0, T_1, ..., T_{L-1}] representing
+#                         T_0 o T_1 o ... o T_{L-1}, TransformChain or
+#                         TransformBatch
+# \param      chunk_size  number of points mapped at once through non-linear
+#                         transforms
+#
+# \return     (N x dim)-numpy array (or point of length dim); for a
+#             TransformBatch of length M an (M x N x dim)-numpy array
+#
+def transform_points_sitk(points, transform, chunk_size=POINTS_CHUNK_SIZE):
+    points = np.asarray(points, dtype=np.float64)
+    is_single_point = points.ndim == 1
+    points = np.atleast_2d(points)
+
+    if isinstance(transform, TransformBatch):
+        points = transform.transform_points(points)
+        return points[:, 0] if is_single_point else points
+
+    if isinstance(transform, TransformChain):
+        points = transform.transform_points(points)
+        return points[0] if is_single_point else points
+
+    if not isinstance(transform, (list, tuple)):
+        transform = [transform]
+    chain = _get_flattened_sitk_transform_chain(transform)
+
+    # Apply transforms starting with the innermost one and accumulate
+    # consecutive linear transforms in a single matrix
+    dim = points.shape[1]
+    matrix = np.eye(dim + 1)
+    for transform_sitk in chain[::-1]:
+        matrix_transform = _get_linear_homogeneous_matrix(transform_sitk)
+        if matrix_transform is not None:
+            matrix = matrix_transform.dot(matrix)
+            continue
+
+        points = points.dot(matrix[0:dim, 0:dim].T) + matrix[0:dim, dim]
+        points = _transform_points_pointwise_sitk(
+            points, transform_sitk, chunk_size)
+        matrix = np.eye(dim + 1)
+
+    points = points.dot(matrix[0:dim, 0:dim].T) + matrix[0:dim, dim]
+
+    return points[0] if is_single_point else points
+
+
+##
+# Map many (continuous) voxel indices to physical points of an image.
+#
+# Vectorized version of image_sitk.TransformContinuousIndexToPhysicalPoint.
+# \date       2026-10-17 16:53:38+0100
+#
+# \param      indices     (N x dim)-numpy array of indices in (i, j, k)-order
+#                         or single index of length dim
+# \param      image_sitk  sitk.Image or ImageGeometry object
+#
+# \return     (N x dim)-numpy array (or point of length dim)
+#
+def transform_indices_to_physical_points_sitk(indices, image_sitk):
+    return get_image_geometry(
+        image_sitk).transform_indices_to_physical_points(indices)
+
+
+##
+# Map many physical points to (continuous) voxel indices of an image.
+#
+# Vectorized version of image_sitk.TransformPhysicalPointToContinuousIndex
+# and image_sitk.TransformPhysicalPointToIndex.
+# \date       2026-10-17 16:56:15+0100
+#
+# \param      points      (N x dim)-numpy array or single point of length dim
+# \param      image_sitk  sitk.Image or ImageGeometry object
+# \param      continuous  return continuous indices if True, otherwise the
+#                         indices of the nearest voxels (integer array)
+#
+# \return     (N x dim)-numpy array (or index of length dim)
+#
+def transform_physical_points_to_indices_sitk(points,
+                                              image_sitk,
+                                              continuous=True):
+    indices = get_image_geometry(
+        image_sitk).transform_physical_points_to_indices(points)
+    if continuous:
+        return indices
+
+    # Round half up as done by ITK
+    return np.floor(indices + 0.5).astype(np.int64)
+
+
+##
+# Bake a transform into a displacement field on the grid of a reference
+# image.
+#
+# The displacement d(x) = T(x) - x is evaluated at the physical points x of
+# all voxels using sitk.TransformToDisplacementField. The grid is processed
+# in slabs along the last image axis so that intermediate images do not
+# exceed max_bytes (in addition to the returned field itself). Resampling
+# with the returned transform is much cheaper than with the original
+# transform if, e.g., the same non-linear warp is applied to many images.
+# \date       2026-10-17 18:40:22+0100
+#
+# \param      transform       sitk transform, list of sitk transforms
+#                             (outermost first) or TransformChain
+# \param      image_ref_sitk  reference image as sitk.Image or ImageGeometry
+#                             object
+# \param      max_bytes       memory budget for intermediate images in bytes
+#
+# \return     sitk.DisplacementFieldTransform
+#
+def get_displacement_field_transform_sitk(transform,
+                                          image_ref_sitk,
+                                          max_bytes=CHUNK_MAX_BYTES):
+    if isinstance(transform, TransformChain):
+        transform = transform.get_sitk_transform()
+    elif isinstance(transform, (list, tuple)):
+        transform = sitk.CompositeTransform(list(transform))
+
+    dim = image_ref_sitk.GetDimension()
+    size = list(image_ref_sitk.GetSize())
+
+    slice_nbytes = int(np.prod(size[0:-1])) * dim * 8
+    n_slices = int(max(1, min(size[-1], max_bytes // slice_nbytes)))
+
+    # Single slab: avoid copying the field
+    if n_slices == size[-1]:
+        field_sitk = sitk.TransformToDisplacementField(
+            transform,
+            sitk.sitkVectorFloat64,
+            size,
+            image_ref_sitk.GetOrigin(),
+            image_ref_sitk.GetSpacing(),
+            image_ref_sitk.GetDirection())
+        return sitk.DisplacementFieldTransform(field_sitk)
+
+    # Write slabs directly into the buffer of the (newly allocated and hence
+    # unshared) field, i.e. (z, y, x, dim) in numpy order for 3D
+    field_sitk = sitk.Image(size, sitk.sitkVectorFloat64, dim)
+    field_sitk.SetOrigin(image_ref_sitk.GetOrigin())
+    field_sitk.SetSpacing(image_ref_sitk.GetSpacing())
+    field_sitk.SetDirection(image_ref_sitk.GetDirection())
+    field_nda = _get_array_view_from_sitk_image(field_sitk, writeable=True)
+
+    for k in range(0, size[-1], n_slices):
+        k_end = min(k + n_slices, size[-1])
+
+        index = np.zeros(dim)
+        index[-1] = k
+        field_slab_sitk = sitk.TransformToDisplacementField(
+            transform,
+            sitk.sitkVectorFloat64,
+            size[0:-1] + [k_end - k],
+            transform_indices_to_physical_points_sitk(index, image_ref_sitk),
+            image_ref_sitk.GetSpacing(),
+            image_ref_sitk.GetDirection())
+        field_nda[k:k_end] = sitk.GetArrayViewFromImage(field_slab_sitk)
+        del field_slab_sitk
+
+    del field_nda
+
+    return sitk.DisplacementFieldTransform(field_sitk)
+
+
 ##
 # Get direction for sitk.Image object from sitk.AffineTransform instance. The
 # information of the image is required to extract spacing information and
@@ -198,7 +701,7 @@ def get_sitk_image_origin_from_sitk_affine_transform(affine_transform_sitk,
 # \f$\vec{o}\f$ the image origin (via \p GetOrigin) and
 # \f$\vec{x}\f$ the final physical coordinate.
 #
-# \param      image_sitk  The image sitk
+# \param      image_sitk  The image sitk or ImageGeometry object
 #
 # \return     Transform T(i) = R*S*i + origin as sitk.AffineTransform
 #
@@ -214,6 +717,135 @@ def get_sitk_affine_transform_from_sitk_image(image_sitk):
     return sitk.AffineTransform(A, t)
 
 
+##
+# Gets the physical-space corners of the voxel grids of many images.
+#
+# Corners are the outer voxel edges, i.e. continuous indices -0.5 and
+# size - 0.5, mapped by the index-to-physical affines
+# T(i) = R*S*i + origin of all images at once.
+# \date       2026-10-17 22:05:41+0100
+#
+# \param      images_sitk  sitk.Image/ImageGeometry object or list thereof
+#
+# \return     (N x 2^dim x dim)-numpy array of corners
+#
+def get_physical_corners_sitk(images_sitk):
+    if not isinstance(images_sitk, (list, tuple)):
+        images_sitk = [images_sitk]
+    geometries = [get_image_geometry(im) for im in images_sitk]
+
+    dim = geometries[0].GetDimension()
+    affines = np.array([g.get_affine() for g in geometries])
+    sizes = np.array([g.GetSize() for g in geometries], dtype=np.float64)
+
+    # (2^dim x dim)-array of all combinations of lower (0) and upper (1)
+    bits = (np.arange(2 ** dim)[:, np.newaxis] >> np.arange(dim)) & 1
+    indices = bits[np.newaxis] * sizes[:, np.newaxis] - 0.5
+
+    return np.einsum("nij,nkj->nki", affines[:, 0:dim, 0:dim], indices) + \
+        affines[:, np.newaxis, 0:dim, dim]
+
+
+##
+# Gets the bounding box of many images in physical space.
+#
+# The box is axis-aligned with respect to the given orientation, i.e. its
+# bounds are given in the coordinates R^T x. The intersection is computed
+# from the bounding boxes of the individual images and, hence, may be larger
+# than the intersection of obliquely oriented images.
+# \date       2026-10-17 22:09:17+0100
+#
+# \param      images_sitk  sitk.Image/ImageGeometry object or list thereof
+# \param      direction    orientation R of box as flattened direction
+#                          matrix; identity if None
+# \param      mode         either "union" or "intersection"
+#
+# \return     tuple of lower and upper bounds (numpy arrays of length dim)
+#
+def get_bounding_box_sitk(images_sitk, direction=None, mode="union"):
+    corners = get_physical_corners_sitk(images_sitk)
+    dim = corners.shape[-1]
+
+    if direction is not None:
+        R = np.array(direction, dtype=np.float64).reshape(dim, dim)
+        corners = corners.dot(R)
+
+    lowers = corners.min(axis=1)
+    uppers = corners.max(axis=1)
+
+    if mode == "union":
+        lower = lowers.min(axis=0)
+        upper = uppers.max(axis=0)
+    elif mode == "intersection":
+        lower = lowers.max(axis=0)
+        upper = uppers.min(axis=0)
+        if np.any(lower >= upper):
+            raise ValueError("Images do not intersect")
+    else:
+        raise ValueError("Mode can either be 'union' or 'intersection'.")
+
+    return lower, upper
+
+
+##
+# Gets a reference grid covering the bounding box of many images.
+#
+# The grid has the requested spacing and orientation and its voxels cover the
+# union (or intersection) bounding box of the images, see
+# get_bounding_box_sitk.
+# \date       2026-10-17 22:14:02+0100
+#
+# \param      images_sitk  sitk.Image/ImageGeometry object or list thereof
+# \param      spacing      spacing of grid (scalar or tuple); spacing of
+#                          first image if None
+# \param      direction    flattened direction matrix of grid; direction of
+#                          first image if None
+# \param      mode         either "union" or "intersection"
+# \param      margin       additional margin in mm added on all sides
+# \param      pixel_type   pixel type of returned image; ImageGeometry is
+#                          returned if None
+#
+# \return     sitk.Image (zero-filled) ready for sitk.Resample or
+#             ImageGeometry object
+#
+def get_reference_grid_sitk(images_sitk,
+                            spacing=None,
+                            direction=None,
+                            mode="union",
+                            margin=0,
+                            pixel_type=sitk.sitkUInt8):
+    if not isinstance(images_sitk, (list, tuple)):
+        images_sitk = [images_sitk]
+    geometry = get_image_geometry(images_sitk[0])
+    dim = geometry.GetDimension()
+
+    if spacing is None:
+        spacing = geometry.GetSpacing()
+    spacing = np.array(spacing, dtype=np.float64) * np.ones(dim)
+    if direction is None:
+        direction = geometry.GetDirection()
+    R = np.array(direction, dtype=np.float64).reshape(dim, dim)
+
+    lower, upper = get_bounding_box_sitk(
+        images_sitk, direction=R.flatten(), mode=mode)
+    lower -= margin
+    upper += margin
+
+    # Tolerance avoids additional voxels due to round-off
+    size = np.maximum(np.ceil((upper - lower) / spacing - 1e-6), 1)
+    origin = R.dot(lower + spacing / 2.)
+
+    geometry = ImageGeometry(size, spacing, origin, R.flatten())
+    if pixel_type is None:
+        return geometry
+
+    image_sitk = sitk.Image([int(s) for s in size], pixel_type)
+    image_sitk.SetSpacing(geometry.GetSpacing())
+    image_sitk.SetOrigin(geometry.GetOrigin())
+    image_sitk.SetDirection(geometry.GetDirection())
+    return image_sitk
+
+
 ##
 # Copy sitk-type transform and return same type
 # \date       2018-04-18 22:51:51-0600
@@ -224,68 +856,486 @@ def get_sitk_affine_transform_from_sitk_image(image_sitk):
 #
 def copy_transform_sitk(transform_sitk):
 
-    name = transform_sitk.GetName()
-    transform_sitk_copy = eval("sitk.%s" % name)(transform_sitk)
-
-    return transform_sitk_copy
-
-
-def read_transform_sitk(path_to_file, inverse=False):
-    transform_types = {
-        "Euler2DTransform_double_2_2": sitk.Euler2DTransform,
-        "Euler3DTransform_double_3_3": sitk.Euler3DTransform,
-        "AffineTransform_double_2_2": sitk.AffineTransform,
-        "AffineTransform_double_3_3": sitk.AffineTransform,
-        "MatrixOffsetTransformBase_double_3_3": sitk.AffineTransform,
-    }
-
-    # Used for to/from FLIRT transform conversion
-    transform_types_dim = {
-        "MatrixOffsetTransformBase_double_3_3": 3,
-    }
-
-    # read as sitk.Transform
-    transform_sitk = sitk.ReadTransform(path_to_file)
-
-    # convert to correct type of transform, e.g. Euler3DTransform
-    transform_type = ph.read_file_line_by_line(path_to_file)[2]
-    transform_type = re.sub("\n", "", transform_type)
-    transform_type = transform_type.split(" ")[1]
-    if transform_type in ["MatrixOffsetTransformBase_double_3_3"]:
-        transform_sitk_ = sitk.AffineTransform(
-            transform_types_dim[transform_type])
-        transform_sitk_.SetParameters(transform_sitk.GetParameters())
-        transform_sitk_.SetFixedParameters(transform_sitk.GetFixedParameters())
-        transform_sitk = transform_sitk_
+    return tr.get_transform_type_of_sitk(transform_sitk).get_sitk(
+        transform_sitk)
+
+
+##
+# Parse an ITK text transform file (.tfm/.txt) in a single pass.
+# \date       2026-10-17 15:12:08+0100
+#
+# \param      path_to_file  path to transform file
+#
+# \return     list of (file type, parameters, fixed parameters)-tuples; one
+#             for each transform in the file. None if the file is not an ITK
+#             text transform file
+#
+def _parse_transform_file(path_to_file):
+    with open(path_to_file, "rb") as f:
+        lines = f.read().decode("utf-8", "replace").splitlines()
+
+    if len(lines) == 0 or not lines[0].startswith("#Insight Transform File"):
+        return None
+
+    transforms = []
+    for line in lines:
+        key, _, value = line.partition(":")
+        if key == "Transform":
+            transforms.append([value.strip(), (), ()])
+        elif key == "Parameters" and len(transforms) > 0:
+            transforms[-1][1] = tuple(float(x) for x in value.split())
+        elif key == "FixedParameters" and len(transforms) > 0:
+            transforms[-1][2] = tuple(float(x) for x in value.split())
+
+    return [tuple(transform) for transform in transforms]
+
+
+##
+# Read transform from file and return the same-type sitk transform.
+#
+# ITK text transform files (.tfm/.txt) holding a single transform are parsed
+# in a single pass; other formats or composite transforms are read via
+# sitk.ReadTransform. Parsed files are cached by path and modification time
+# so that repeatedly reading unchanged files does not touch the file system
+# beyond a stat call.
+# \date       2026-10-17 15:20:41+0100
+#
+# \param      path_to_file  path to transform file
+# \param      inverse       return inverse of transform if True
+# \param      use_cache     use cached parameters of unchanged files
+#
+# \return     sitk transform, e.g. sitk.Euler3DTransform
+#
+def read_transform_sitk(path_to_file, inverse=False, use_cache=True):
+    stat = os.stat(path_to_file)
+
+    # Nanosecond resolution (Python 3) so that rewrites within the
+    # resolution of st_mtime are detected
+    key = (os.path.abspath(path_to_file),
+           getattr(stat, "st_mtime_ns", stat.st_mtime),
+           stat.st_size)
+
+    transforms = TRANSFORM_FILE_CACHE.get(key) if use_cache else None
+    if transforms is None:
+        transforms = _parse_transform_file(path_to_file)
+        if transforms is not None and use_cache:
+            TRANSFORM_FILE_CACHE.put(key, transforms)
+
+    if transforms is not None and len(transforms) == 1:
+        file_type, parameters, fixed_parameters = transforms[0]
+        transform_type = tr.get_transform_type_from_file_type(file_type)
+        transform_sitk = transform_type.new_sitk()
+
+        # Files written by older ITK versions may lack trailing fixed
+        # parameters, e.g. the ComputeZYX flag of Euler3DTransform
+        fixed_parameters_default = transform_sitk.GetFixedParameters()
+        fixed_parameters += fixed_parameters_default[len(fixed_parameters):]
+
+        transform_sitk.SetFixedParameters(fixed_parameters)
+        transform_sitk.SetParameters(parameters)
     else:
-        transform_sitk = transform_types[transform_type](transform_sitk)
+        transform_sitk = sitk.ReadTransform(path_to_file)
+        transform_type = tr.get_transform_type_of_sitk(transform_sitk)
+        transform_sitk = transform_type.get_sitk(transform_sitk)
 
     # invert transform
     if inverse:
-        transform_sitk = transform_types[transform_type](
-            transform_sitk.GetInverse())
+        transform_sitk = transform_type.get_sitk(transform_sitk.GetInverse())
 
     return transform_sitk
 
 
+##
+# Read multiple transforms from files using a thread pool.
+# \date       2026-10-17 15:31:17+0100
+#
+# \param      paths_to_files  list of paths to transform files
+# \param      inverse         return inverse of transforms if True
+# \param      n_workers       number of threads; number of CPUs if None
+#
+# \return     list of sitk transforms in the order of paths_to_files
+#
+def read_transforms_sitk(paths_to_files, inverse=False, n_workers=None):
+    return _map_in_thread_pool(
+        lambda path_to_file: read_transform_sitk(
+            path_to_file, inverse=inverse),
+        paths_to_files,
+        n_workers=n_workers)
+
+
 def read_transform_itk(path_to_file, inverse=False, pixel_type=itk.D):
     transform_sitk = read_transform_sitk(path_to_file, inverse=inverse)
     return get_itk_from_sitk_transform(transform_sitk, pixel_type=pixel_type)
 
 
+##
+# Write many transforms to a single binary file.
+#
+# Compact alternative to writing one ITK transform file per transform. The
+# file can be memory-mapped for random access by key; see TransformBulkFile.
+# \date       2026-10-17 16:10:22+0100
+#
+# \param      transforms_sitk  list of sitk transforms
+# \param      keys             list of string keys, e.g. slice identifiers
+# \param      path_to_file     path to file
+# \param      append           append to existing file if True, otherwise an
+#                              existing file is overwritten
+# \param      verbose          The verbose
+#
+def write_transforms_bulk_sitk(transforms_sitk,
+                               keys,
+                               path_to_file,
+                               append=False,
+                               verbose=False):
+    if not append and os.path.isfile(path_to_file):
+        os.remove(path_to_file)
+
+    TransformBulkFile(path_to_file).append(transforms_sitk, keys)
+
+    if verbose:
+        ph.print_info("%d transforms written to '%s'" % (
+            len(keys), path_to_file))
+
+
+##
+# Read transforms from a binary file written by write_transforms_bulk_sitk.
+# \date       2026-10-17 16:14:51+0100
+#
+# \param      path_to_file  path to file
+# \param      keys          list of string keys to read; all if None
+#
+# \return     list of sitk transforms in the order of keys or, if keys is
+#             None, ordered dictionary of all keys and sitk transforms
+#
+def read_transforms_bulk_sitk(path_to_file, keys=None):
+    transform_bulk_file = TransformBulkFile(path_to_file)
+
+    if keys is not None:
+        return [transform_bulk_file.get_transform_sitk(k) for k in keys]
+
+    return collections.OrderedDict(
+        (k, transform_bulk_file.get_transform_sitk(k))
+        for k in transform_bulk_file.keys())
+
+
+def read_transforms_bulk_itk(path_to_file, keys=None, pixel_type=itk.D):
+    transforms_sitk = read_transforms_bulk_sitk(path_to_file, keys=keys)
+    if keys is not None:
+        return get_itk_from_sitk_transforms(
+            transforms_sitk, pixel_type=pixel_type)
+
+    return collections.OrderedDict(zip(
+        transforms_sitk.keys(),
+        get_itk_from_sitk_transforms(
+            list(transforms_sitk.values()), pixel_type=pixel_type)))
+
+
+##
+# Gets the homogeneous matrix mapping voxel indices to FSL coordinates of an
+# image.
+#
+# FSL (FLIRT) coordinates are voxel indices scaled by the spacing. The
+# x-axis is flipped if the voxel-to-world matrix has a positive determinant
+# (neurological orientation), i.e. x = (n_x - 1 - i) * s_x. Since the RAS
+# (NIfTI) and LPS (ITK) frames differ by a rotation, the determinant of
+# the sitk voxel-to-world matrix can be used.
+# \date       2026-10-17 19:05:40+0100
+#
+# \param      image_sitk  3D image as sitk.Image or ImageGeometry object
+#
+# \return     (4 x 4)-numpy array
+#
+def _get_flirt_voxel_matrix(image_sitk):
+    spacing = np.array(image_sitk.GetSpacing())
+    matrix = np.diag(np.append(spacing, 1.))
+
+    A = get_sitk_affine_matrix_from_sitk_image(image_sitk).reshape(3, 3)
+    if np.linalg.det(A) > 0:
+        matrix[0, 0] = -spacing[0]
+        matrix[0, 3] = (image_sitk.GetSize()[0] - 1) * spacing[0]
+
+    return matrix
+
+
+##
+# Gets the homogeneous matrix mapping voxel indices to physical points of an
+# image.
+# \date       2026-10-17 19:07:02+0100
+#
+# \param      image_sitk  sitk.Image or ImageGeometry object
+#
+# \return     read-only (dim+1 x dim+1)-numpy array
+#
+def _get_voxel_to_physical_matrix(image_sitk):
+    return get_image_geometry(image_sitk).get_affine()
+
+
+##
+# Gets the mappings between FSL coordinates and physical space used to
+# convert FLIRT matrices.
+# \date       2026-10-17 19:08:27+0100
+#
+# \param      images_src_sitk  source image as sitk.Image object or list of
+#                              source images
+# \param      image_ref_sitk   reference image as sitk.Image object
+#
+# \return     tuple of (N x 4 x 4)-numpy array A_src Sf_src^-1 (N = 1 for a
+#             single source image) and (4 x 4)-numpy array Sf_ref A_ref^-1
+#
+def _get_flirt_space_matrices(images_src_sitk, image_ref_sitk):
+    if isinstance(images_src_sitk, (sitk.Image, ImageGeometry)):
+        images_src_sitk = [images_src_sitk]
+
+    matrices_src = np.array([
+        _get_voxel_to_physical_matrix(image_src_sitk).dot(
+            np.linalg.inv(_get_flirt_voxel_matrix(image_src_sitk)))
+        for image_src_sitk in images_src_sitk])
+    matrix_ref = _get_flirt_voxel_matrix(image_ref_sitk).dot(
+        np.linalg.inv(_get_voxel_to_physical_matrix(image_ref_sitk)))
+
+    return matrices_src, matrix_ref
+
+
+##
+# Convert FLIRT matrices to sitk affine transforms.
+#
+# A FLIRT matrix F maps FSL coordinates of the source (input) image to FSL
+# coordinates of the reference image. The returned transform T maps physical
+# points of the reference to the source image (as expected by sitk.Resample)
+# via T = A_src Sf_src^-1 F^-1 Sf_ref A_ref^-1 where A denotes the
+# voxel-to-world and Sf the voxel-to-FSL mapping of an image. Hence,
+# sitk.Resample(image_src_sitk, image_ref_sitk, T) corresponds to
+# flirt -applyxfm.
+# \date       2026-10-17 19:10:48+0100
+#
+# \param      matrices         (N x 4 x 4)-numpy array of FLIRT matrices
+# \param      images_src_sitk  source image as sitk.Image object or list of
+#                              N source images
+# \param      image_ref_sitk   reference image as sitk.Image object
+# \param      as_sitk          return sitk.AffineTransforms if True,
+#                              otherwise homogeneous matrices
+#
+# \return     list of N sitk.AffineTransforms or (N x 4 x 4)-numpy array
+#
+def get_sitk_affine_transforms_from_flirt_matrices(matrices,
+                                                   images_src_sitk,
+                                                   image_ref_sitk,
+                                                   as_sitk=True):
+    matrices = np.array(matrices, dtype=np.float64, ndmin=3)
+    matrices_src, matrix_ref = _get_flirt_space_matrices(
+        images_src_sitk, image_ref_sitk)
+
+    matrices = np.matmul(
+        np.matmul(matrices_src, np.linalg.inv(matrices)),
+        matrix_ref)
+    if not as_sitk:
+        return matrices
+
+    return [get_sitk_transform_from_homogeneous_matrix(m) for m in matrices]
+
+
+##
+# Convert sitk affine-type transforms to FLIRT matrices, i.e. the inverse
+# operation of get_sitk_affine_transforms_from_flirt_matrices using
+# F = Sf_ref A_ref^-1 T^-1 A_src Sf_src^-1.
+# \date       2026-10-17 19:14:21+0100
+#
+# \param      transforms       list of N affine-type sitk transforms,
+#                              TransformBatch or (N x 4 x 4)-numpy array of
+#                              homogeneous matrices mapping from reference to
+#                              source space
+# \param      images_src_sitk  source image as sitk.Image object or list of
+#                              N source images
+# \param      image_ref_sitk   reference image as sitk.Image object
+#
+# \return     (N x 4 x 4)-numpy array of FLIRT matrices
+#
+def get_flirt_matrices_from_sitk_affine_transforms(transforms,
+                                                   images_src_sitk,
+                                                   image_ref_sitk):
+    if isinstance(transforms, TransformBatch):
+        matrices = transforms.get_homogeneous_matrices()
+    elif isinstance(transforms, np.ndarray):
+        matrices = np.array(transforms, dtype=np.float64, ndmin=3)
+    else:
+        matrices = np.array([get_homogeneous_matrix_from_sitk_transform(t)
+                             for t in transforms])
+
+    matrices_src, matrix_ref = _get_flirt_space_matrices(
+        images_src_sitk, image_ref_sitk)
+
+    return np.matmul(
+        np.matmul(matrix_ref, np.linalg.inv(matrices)),
+        matrices_src)
+
+
+##
+# Read FLIRT matrix as sitk.AffineTransform
+# \date       2026-10-17 19:18:36+0100
+#
+# \param      path_to_file    path to FLIRT .mat file
+# \param      image_src_sitk  source image as sitk.Image object
+# \param      image_ref_sitk  reference image as sitk.Image object
+#
+# \return     sitk.AffineTransform mapping from reference to source space
+#
+def read_transform_flirt_sitk(path_to_file, image_src_sitk, image_ref_sitk):
+    return read_transforms_flirt_sitk(
+        [path_to_file], image_src_sitk, image_ref_sitk)[0]
+
+
+##
+# Read FLIRT matrices as sitk.AffineTransforms
+# \date       2026-10-17 19:19:50+0100
+#
+# \param      paths_to_files   list of paths to FLIRT .mat files
+# \param      images_src_sitk  source image as sitk.Image object or list of
+#                              source images
+# \param      image_ref_sitk   reference image as sitk.Image object
+#
+# \return     list of sitk.AffineTransforms
+#
+def read_transforms_flirt_sitk(paths_to_files,
+                               images_src_sitk,
+                               image_ref_sitk):
+    matrices = [np.loadtxt(path_to_file) for path_to_file in paths_to_files]
+    return get_sitk_affine_transforms_from_flirt_matrices(
+        matrices, images_src_sitk, image_ref_sitk)
+
+
+##
+# Write affine-type sitk transform as FLIRT matrix
+# \date       2026-10-17 19:21:14+0100
+#
+# \param      transform_sitk  affine-type sitk transform mapping from
+#                             reference to source space
+# \param      path_to_file    path to FLIRT .mat file
+# \param      image_src_sitk  source image as sitk.Image object
+# \param      image_ref_sitk  reference image as sitk.Image object
+# \param      verbose         The verbose
+#
+def write_transform_flirt_sitk(transform_sitk,
+                               path_to_file,
+                               image_src_sitk,
+                               image_ref_sitk,
+                               verbose=False):
+    write_transforms_flirt_sitk([transform_sitk], [path_to_file],
+                                image_src_sitk, image_ref_sitk,
+                                verbose=verbose)
+
+
+##
+# Write affine-type sitk transforms as FLIRT matrices
+# \date       2026-10-17 19:22:31+0100
+#
+# \param      transforms       list of affine-type sitk transforms or
+#                              TransformBatch
+# \param      paths_to_files   list of paths to FLIRT .mat files
+# \param      images_src_sitk  source image as sitk.Image object or list of
+#                              source images
+# \param      image_ref_sitk   reference image as sitk.Image object
+# \param      verbose          The verbose
+#
+def write_transforms_flirt_sitk(transforms,
+                                paths_to_files,
+                                images_src_sitk,
+                                image_ref_sitk,
+                                verbose=False):
+    matrices = get_flirt_matrices_from_sitk_affine_transforms(
+        transforms, images_src_sitk, image_ref_sitk)
+
+    for matrix, path_to_file in zip(matrices, paths_to_files):
+        ph.create_directory(os.path.dirname(path_to_file))
+        np.savetxt(path_to_file, matrix, fmt="%.10f", delimiter="  ")
+        if verbose:
+            ph.print_info("FLIRT matrix written to '%s'" % path_to_file)
+
+
+##
+# Invert sitk transform and return same type.
+# \date       2026-10-17 12:03:37+0100
+#
+# \param      transform_sitk  Transform as sitk.Transform or TransformBatch
+#
+# \return     Same-type inverse of transform
+#
 def invert_transform_sitk(transform_sitk):
-    return getattr(sitk, transform_sitk.GetName())(transform_sitk.GetInverse())
+    if isinstance(transform_sitk, TransformBatch):
+        return transform_sitk.get_inverse()
+    return tr.get_transform_type_of_sitk(transform_sitk).get_sitk(
+        transform_sitk.GetInverse())
+
+
+##
+# Gets the geometry of an image.
+# \date       2026-10-17 19:55:20+0100
+#
+# \param      image_sitk  sitk.Image, ImageGeometry or LazyImage object
+#
+# \return     ImageGeometry object
+#
+def get_image_geometry(image_sitk):
+    if isinstance(image_sitk, ImageGeometry):
+        return image_sitk
+    if isinstance(image_sitk, LazyImage):
+        return image_sitk.get_geometry()
+    return ImageGeometry.from_sitk(image_sitk)
+
+
+##
+# Check whether two images occupy the same physical space, i.e. whether their
+# voxel grids coincide, without touching their pixel data.
+#
+# Tolerances follow the conventions of ITK (cf.
+# itk::ImageBase::GetGlobalDefaultCoordinateTolerance), i.e. spacing and
+# origin are compared relative to the spacing of the first image and the
+# direction matrices entrywise.
+# \date       2026-10-17 23:18:40+0100
+#
+# \param      image_a_sitk  sitk.Image or ImageGeometry object
+# \param      image_b_sitk  sitk.Image or ImageGeometry object
+# \param      tol           relative tolerance for spacing and origin and
+#                           absolute tolerance for direction
+#
+# \return     True if both images share the same grid, False otherwise
+#
+def same_physical_space(image_a_sitk, image_b_sitk, tol=1e-6):
+    if image_a_sitk.GetDimension() != image_b_sitk.GetDimension():
+        return False
+
+    if tuple(image_a_sitk.GetSize()) != tuple(image_b_sitk.GetSize()):
+        return False
+
+    spacing_a = np.array(image_a_sitk.GetSpacing())
+    tol_coordinate = tol * spacing_a
+
+    if np.any(np.abs(spacing_a - image_b_sitk.GetSpacing()) >
+              tol_coordinate):
+        return False
+
+    if np.any(np.abs(np.array(image_a_sitk.GetOrigin()) -
+                     image_b_sitk.GetOrigin()) > tol_coordinate):
+        return False
+
+    if np.any(np.abs(np.array(image_a_sitk.GetDirection()) -
+                     image_b_sitk.GetDirection()) > tol):
+        return False
+
+    return True
 
 
 ##
 # Gets the sitk affine matrix from sitk image.
 # \date       2016-11-06 19:07:03+0000
 #
-# \param      image_sitk  The image sitk
+# \param      image_sitk  The image sitk or ImageGeometry object
 #
 # \return     Matrix R*S as flattened data array ready for SetMatrix
 #
 def get_sitk_affine_matrix_from_sitk_image(image_sitk):
+    if isinstance(image_sitk, ImageGeometry):
+        return image_sitk.get_matrix().flatten()
+
     dim = len(image_sitk.GetSize())
     spacing_sitk = np.array(image_sitk.GetSpacing())
     S_sitk = np.diag(spacing_sitk)
@@ -378,6 +1428,70 @@ def get_inverse_of_sitk_rigid_registration_transform(
         return sitk.Euler3DTransform(center, angle_x, angle_y, angle_z, (translation_x, translation_y, translation_z))
 
 
+##
+# Get the inverses of many rigid/affine transforms given by their sitk
+# parameters.
+#
+# The inversion is computed in closed form for all transforms at once, i.e.
+# T^{-1}(x) = A^{-1}(x - c) - A^{-1}t + c with A^{-1} = A^T for rigid
+# transforms.
+# \date       2026-10-17 13:48:09+0100
+#
+# \param      parameters        (N x P)-numpy array as obtained via
+#                               GetParameters
+# \param      fixed_parameters  (N x F)-numpy array as obtained via
+#                               GetFixedParameters
+# \param      transform_type    "Euler2DTransform", "Euler3DTransform" or
+#                               "AffineTransform"
+# \param      as_sitk           return list of sitk transforms if True,
+#                               otherwise parameter arrays
+#
+# \return     list of N sitk transforms or tuple of (N x P)- and (N x
+#             F)-numpy arrays holding the parameters and fixed parameters of
+#             the inverse transforms
+#
+def get_inverse_of_sitk_transform_parameters(parameters,
+                                             fixed_parameters,
+                                             transform_type,
+                                             as_sitk=False):
+    transform_batch = TransformBatch.from_parameters(
+        parameters, fixed_parameters, transform_type).get_inverse()
+
+    if as_sitk:
+        return transform_batch.get_sitk_transforms()
+
+    return transform_batch.get_parameters(), \
+        transform_batch.get_fixed_parameters()
+
+
+##
+# Get the inverses of many rigid (or affine) registration transforms.
+#
+# Batch variant of get_inverse_of_sitk_rigid_registration_transform.
+# Transforms of different types are inverted as sitk.AffineTransform.
+# \date       2026-10-17 13:55:30+0100
+#
+# \param      rigid_registration_transforms  list of sitk transforms
+# \param      as_sitk                        return list of sitk transforms if
+#                                            True, otherwise parameter arrays
+#
+# \return     list of sitk transforms or tuple of parameter arrays, see
+#             get_inverse_of_sitk_transform_parameters
+#
+def get_inverse_of_sitk_rigid_registration_transforms(
+        rigid_registration_transforms,
+        as_sitk=True):
+
+    transform_batch = TransformBatch.from_sitk(
+        rigid_registration_transforms).get_inverse()
+
+    if as_sitk:
+        return transform_batch.get_sitk_transforms()
+
+    return transform_batch.get_parameters(), \
+        transform_batch.get_fixed_parameters()
+
+
 ##
 # Gets the altered field of view sitk image.
 # \date       2017-04-08 22:20:40+0100
@@ -401,70 +1515,51 @@ def get_altered_field_of_view_sitk_image(image_sitk,
                                          unit="mm"):
 
     size = np.array(image_sitk.GetSize()).astype("int")
-    origin = np.array(image_sitk.GetOrigin())
     spacing = np.array(image_sitk.GetSpacing())
     dimension = image_sitk.GetDimension()
 
-    # Get unit vectors of respective image dimension
-    if dimension is 2:
-        e_x = np.array([1, 0])
-        e_y = np.array([0, 1])
-    elif dimension is 3:
-        e_x = np.array([1, 0, 0])
-        e_y = np.array([0, 1, 0])
-        e_z = np.array([0, 0, 1])
+    boundary = np.array(
+        [boundary_i, boundary_j, boundary_k][0:dimension], dtype=np.float64)
 
-    # Dimension is given in mm
+    # Express boundary in voxels
     if unit == "mm":
-        boundary_i_voxel = np.round(boundary_i / spacing[0])
-        boundary_j_voxel = np.round(boundary_j / spacing[1])
-
-        # compute new shape of image
-        size[0] += 2 * boundary_i_voxel
-        size[1] += 2 * boundary_j_voxel
-
-        if dimension is 3:
-            boundary_k_voxel = np.round(boundary_k / spacing[2])
-
-            size[2] += 2 * boundary_k_voxel
-
-    # Dimension is given in voxels
+        boundary_voxel = boundary / spacing
     elif unit == "voxel":
-        # compute new shape of image
-        size[0] += 2 * boundary_i
-        size[1] += 2 * boundary_j
-
-        # express change in mm
-        boundary_i *= spacing[0]
-        boundary_j *= spacing[1]
-
-        if dimension is 3:
-            size[2] += 2 * boundary_k
-            boundary_k *= spacing[2]
-
+        boundary_voxel = boundary
     else:
         raise ValueError("Unit can either be 'mm' or 'voxel'.")
+    boundary_voxel_int = np.round(boundary_voxel).astype("int")
+
+    # Boundaries of whole voxels keep the image grid. Hence, the field of
+    # view can be changed by padding and cropping which avoids a resampling
+    # pass over all voxels (constant padding of vector images is not
+    # supported by SimpleITK)
+    pad = [int(b) for b in np.maximum(boundary_voxel_int, 0)]
+    crop = [int(b) for b in np.maximum(-boundary_voxel_int, 0)]
+    if np.allclose(boundary_voxel, boundary_voxel_int, rtol=0, atol=1e-6) \
+            and (not any(pad) or
+                 image_sitk.GetNumberOfComponentsPerPixel() == 1):
+        if any(pad):
+            image_sitk = sitk.ConstantPad(image_sitk, pad, pad, 0)
+        if any(crop):
+            image_sitk = sitk.Crop(image_sitk, crop, crop)
+        if not any(pad) and not any(crop):
+            image_sitk = sitk.Image(image_sitk)
+        return image_sitk
 
-    # Compute new origin so that image intensity information is not altered
-    # in the physical space
-    a_x = image_sitk.TransformIndexToPhysicalPoint(e_x) - origin
-    a_y = image_sitk.TransformIndexToPhysicalPoint(e_y) - origin
-
-    translation = a_x / np.linalg.norm(a_x) * boundary_i
-    translation += a_y / np.linalg.norm(a_y) * boundary_j
-
-    if dimension is 3:
-        a_z = image_sitk.TransformIndexToPhysicalPoint(e_z) - origin
-        translation += a_z / np.linalg.norm(a_z) * boundary_k
-
-    origin = origin - translation
+    # Compute new shape and origin so that image intensity information is
+    # not altered in the physical space
+    size += 2 * boundary_voxel_int
+    origin = transform_indices_to_physical_points_sitk(
+        -boundary_voxel, image_sitk)
 
     # Resample image to new space, i.e. just change shape without changing
     # the image in the physical space
     image_sitk = sitk.Resample(
         image_sitk,
-        size,
-        eval("sitk.Euler" + str(dimension) + "DTransform()"),
+        [int(s) for s in size],
+        tr.get_transform_type(
+            "Euler%dDTransform" % dimension, dimension).new_sitk(),
         sitk.sitkNearestNeighbor,
         origin,
         spacing,
@@ -478,33 +1573,74 @@ def get_altered_field_of_view_sitk_image(image_sitk,
 # Get transformed (deepcopied) image
 # \date       2017-06-26 17:06:25+0100
 #
+# Only the image header (origin and direction) is updated such that the image
+# is moved by the transform in physical space. SimpleITK images share their
+# pixel buffer on copy but any header modification of a shared image
+# triggers a deep copy of the buffer. Hence, use inplace=True to avoid the
+# copy if the original image is not needed anymore.
+#
 # \param[in]  image_init_sitk  image as sitk.Image object to be transformed
 # \param[in]  transform_sitk   transform to be applied as sitk.AffineTransform
-#                              object
+#                              object or TransformChain
+# \param[in]  inplace          update header of image_init_sitk instead of
+#                              returning a copy
 #
 # \return     transformed image as sitk.Image object
 #
-def get_transformed_sitk_image(image_init_sitk, transform_sitk):
-    image_sitk = sitk.Image(image_init_sitk)
+def get_transformed_sitk_image(image_init_sitk, transform_sitk, inplace=False):
+    return get_transformed_sitk_images(
+        [image_init_sitk], [transform_sitk], inplace=inplace)[0]
 
-    affine_transform_sitk = get_sitk_affine_transform_from_sitk_image(
-        image_sitk)
 
-    transform_sitk = get_composite_sitk_affine_transform(
-        transform_sitk, affine_transform_sitk)
-    # transform_sitk =
-    # get_composite_sitk_affine_transform(get_inverse_of_sitk_rigid_registration_transform(affine_transform_sitk),
-    # affine_transform_sitk)
+##
+# Get transformed images, i.e. update the headers of many images at once.
+#
+# Same as get_transformed_sitk_image but the image headers are computed
+# vectorized from all transforms, e.g. to update all slices of a stack after
+# slice-to-volume registration.
+# \date       2026-10-17 20:40:15+0100
+#
+# \param      images_sitk  list of N sitk.Image objects
+# \param      transforms   list of N affine-type sitk transforms or
+#                          TransformChains, TransformBatch of length N (or
+#                          1) or (N x dim+1 x dim+1)-numpy array of
+#                          homogeneous matrices
+# \param      inplace      update headers of images_sitk instead of returning
+#                          copies
+#
+# \return     list of N transformed sitk.Image objects
+#
+def get_transformed_sitk_images(images_sitk, transforms, inplace=False):
+    if isinstance(transforms, TransformBatch):
+        matrices = transforms.get_homogeneous_matrices()
+    elif isinstance(transforms, np.ndarray):
+        matrices = np.array(transforms, dtype=np.float64, ndmin=3)
+    else:
+        matrices = np.array([
+            t.get_matrix() if isinstance(t, TransformChain)
+            else get_homogeneous_matrix_from_sitk_transform(t)
+            for t in transforms])
+
+    geometries = [get_image_geometry(image_sitk)
+                  for image_sitk in images_sitk]
+    dim = geometries[0].GetDimension()
 
-    direction = get_sitk_image_direction_from_sitk_affine_transform(
-        transform_sitk, image_sitk)
-    origin = get_sitk_image_origin_from_sitk_affine_transform(
-        transform_sitk, image_sitk)
+    # Index-to-physical affines of the transformed images
+    affines = np.matmul(
+        matrices, np.array([geometry.get_affine() for geometry in geometries]))
+    spacings = np.array([geometry.GetSpacing() for geometry in geometries])
+    directions = affines[:, 0:dim, 0:dim] / spacings[:, np.newaxis, :]
+    origins = affines[:, 0:dim, dim]
 
-    image_sitk.SetOrigin(origin)
-    image_sitk.SetDirection(direction)
+    images_transformed_sitk = [None] * len(images_sitk)
+    for i, image_sitk in enumerate(images_sitk):
+        if not inplace:
+            image_sitk = sitk.Image(image_sitk)
+        image_sitk.SetOrigin(origins[i])
+        image_sitk.SetDirection(directions[i].flatten())
+        images_transformed_sitk[i] = image_sitk
 
-    return image_sitk
+    return images_transformed_sitk
 
 
 ##
@@ -525,89 +1661,204 @@ def read_itk_image(filename):
 
 
 ##
-# Reads 3D vector image and return as SimpleITK image
-# \date       2016-09-20 15:31:05+0100
+# Gets a nibabel NIfTI image from a sitk.Image without copying its data.
+#
+# The data array of the NIfTI image is a transposed (read-only) view of the
+# sitk data array, which keeps the sitk.Image alive. The header corresponds
+# to the one written by ITK, i.e. both q- and s-form are set.
+# \date       2026-10-18 00:05:31+0100
+#
+# \param      image_sitk    sitk.Image of dimension 2, 3 or 4
+# \param      vector_as_5d  Store vector images as 5D arrays (x, y, z, 1,
+#                           components) with vector intent as ITK does.
+#                           Otherwise, components are stored in the fourth
+#                           dimension (x, y, z, components).
+#
+# \return     nib.Nifti1Image object
+#
+def get_nib_from_sitk_image(image_sitk, vector_as_5d=True):
+    n_components = image_sitk.GetNumberOfComponentsPerPixel()
+    image_nib = _get_nifti_image_nib(
+        _get_array_view_from_sitk_image(image_sitk),
+        image_sitk.GetSpacing(),
+        image_sitk.GetOrigin(),
+        image_sitk.GetDirection(),
+        n_components)
+
+    if n_components > 1 and not vector_as_5d:
+        dim = image_sitk.GetDimension()
+        nda = np.asanyarray(image_nib.dataobj)
+        nda = nda.reshape(nda.shape[0:dim] + (1,) * (3 - dim) +
+                          (n_components,))
+        header = image_nib.header
+        header.set_intent("none")
+        image_nib = nib.Nifti1Image(nda, image_nib.affine, header)
+
+    return image_nib
+
+
+##
+# Gets a sitk.Image from a nibabel NIfTI image.
 #
-# \param      filename  path to file, string
-# \param      dtype     numpy data type
+# The Fortran-ordered NIfTI data array is the transpose of the C-ordered
+# (z, y, x) sitk layout, hence only a single copy into the sitk.Image buffer
+# is made. The geometry is obtained from the affine of the NIfTI image, i.e.
+# from the s-form if set and from the q-form otherwise.
+# \date       2026-10-18 00:09:48+0100
+#
+# \param      image_nib  nibabel NIfTI image of dimension 2, 3, 4 or 5
+# \param      dtype      numpy data type of sitk.Image; data type of NIfTI
+#                        image (after scaling) if None
+# \param      is_vector  Interpret the last dimension of 4D/5D images as
+#                        components of a 3D vector image. Determined from
+#                        NIfTI intent and dimension (5D) if None
 #
 # \return     (Multi-component) sitk.Image object
 #
-def read_sitk_vector_image(filename, dtype=None):
+def get_sitk_from_nib_image(image_nib, dtype=None, is_vector=None):
+    nda, geometry = _get_sitk_array_and_geometry_from_nib_image(
+        image_nib, np.asanyarray(image_nib.dataobj), is_vector)
+    if dtype is not None:
+        nda = nda.astype(dtype, copy=False)
 
-    # Workaround: Read vector image via nibabel
-    image_nib = nib.load(filename)
-    if dtype is None:
-        dtype = image_nib.header["bitpix"].dtype
-    nda_nib = image_nib.get_data().astype(dtype)
-    nda_nib_shape = nda_nib.shape
-    nda = np.zeros((nda_nib_shape[2],
-                    nda_nib_shape[1],
-                    nda_nib_shape[0],
-                    nda_nib_shape[3]),
-                   dtype=dtype)
-
-    # Convert to (Simple)ITK data array format, i.e. reorder to
-    # z-y-x-components shape
-    for i in range(0, nda_nib_shape[2]):
-        for k in range(0, nda_nib_shape[0]):
-            nda[i, :, k, :] = nda_nib[k, :, i, :]
-
-    # Get SimpleITK image
-    vector_image_sitk = sitk.GetImageFromArray(nda)
-
-    if 1:
-        # Update header from nibabel information
-        # (may introduce some header inaccuracies?)
-        R = np.array([
-            [-1, 0, 0],
-            [0, -1, 0],
-            [0, 0, 1]])
-        affine_nib = image_nib.affine.astype(np.float64)
-        R_nib = affine_nib[0:-1, 0:-1]
-
-        spacing_sitk = np.array(image_nib.header.get_zooms(), dtype=np.float64)
-        spacing_sitk = spacing_sitk[0:R_nib.shape[0]]
-        S_nib_inv = np.diag(1. / spacing_sitk)
-
-        direction_sitk = R.dot(R_nib).dot(S_nib_inv).flatten()
-
-        t_nib = affine_nib[0:-1, 3]
-        origin_sitk = R.dot(t_nib)
-
-        vector_image_sitk.SetSpacing(np.array(spacing_sitk).astype('double'))
-        vector_image_sitk.SetDirection(direction_sitk)
-        vector_image_sitk.SetOrigin(origin_sitk)
+    return get_sitk_from_array_and_geometry(nda, geometry)
+
+
+##
+# Gets a sitk.Image from a data array and image geometry.
+#
+# Data are copied into the buffer of the sitk.Image.
+# \date       2026-10-18 00:31:12+0100
+#
+# \param      nda       data array in (Simple)ITK order, i.e. (z, y, x) or
+#                       (z, y, x, components) for vector images
+# \param      geometry  ImageGeometry object (or sitk.Image)
+#
+# \return     (Multi-component) sitk.Image object
+#
+def get_sitk_from_array_and_geometry(nda, geometry):
+    image_sitk = sitk.GetImageFromArray(
+        nda, isVector=nda.ndim > geometry.GetDimension())
+    image_sitk.SetSpacing(geometry.GetSpacing())
+    image_sitk.SetOrigin(geometry.GetOrigin())
+    image_sitk.SetDirection(geometry.GetDirection())
+
+    return image_sitk
+
+
+##
+# Read an uncompressed NIfTI image as memory-mapped data array.
+#
+# Voxel data are not read until accessed, e.g. when only a few slices are
+# used or sparse statistics are computed. A sitk.Image can be created via
+# get_sitk_from_array_and_geometry if needed. Compressed or scaled (scl_slope,
+# scl_inter) data cannot be memory-mapped and are read into memory instead.
+# NaN values are not replaced.
+# \date       2026-10-18 00:34:40+0100
+#
+# \param      file_path  The file path as string
+# \param      is_vector  Interpret the last dimension of 4D/5D images as
+#                        components of a 3D vector image. Determined from
+#                        NIfTI intent and dimension (5D) if None
+#
+# \return     tuple of read-only data array in (Simple)ITK order, i.e.
+#             (z, y, x) or (z, y, x, components), and ImageGeometry object
+#
+def read_nifti_image_mmap(file_path, is_vector=None):
+    image_nib = nib.load(str(file_path), mmap="r")
+
+    proxy = image_nib.dataobj
+    if proxy.slope == 1 and proxy.inter == 0:
+        nda = proxy.get_unscaled()
     else:
-        # Extract header information from SimpleITK vector image
-        # (slower for many components)
-        dim = 4
-        dummy_sitk = sitk.ReadImage(filename)
+        nda = np.asanyarray(proxy)
+    nda.flags.writeable = False
+
+    return _get_sitk_array_and_geometry_from_nib_image(
+        image_nib, nda, is_vector)
 
-        direction_sitk = np.array(dummy_sitk.GetDirection()).reshape(dim, dim)
-        direction_sitk = direction_sitk[0:-1, 0:-1].flatten()
 
-        spacing_sitk = dummy_sitk.GetSpacing()[0:-1]
+##
+# Gets the data array in (Simple)ITK order and the image geometry of a NIfTI
+# image.
+# \date       2026-10-18 00:38:02+0100
+#
+# \param      image_nib  nibabel NIfTI image
+# \param      nda        data array of NIfTI image in (x, y, z, ...)-order
+# \param      is_vector  Boolean; determined from NIfTI intent and dimension
+#                        if None
+#
+# \return     tuple of transposed view of nda and ImageGeometry object
+#
+def _get_sitk_array_and_geometry_from_nib_image(image_nib, nda, is_vector):
+    if is_vector is None:
+        is_vector = nda.ndim == 5 or (
+            nda.ndim == 4 and image_nib.header.get_intent()[0] == "vector")
+
+    if is_vector:
+        # (x, y, z[, 1], components) -> (z, y, x, components)
+        n_components = nda.shape[-1]
+        nda = nda.reshape(nda.shape[0:3] + (n_components,))
+        nda = nda.transpose(2, 1, 0, 3)
+        dim = 3
+    else:
+        nda = nda.T
+        dim = nda.ndim
 
-        origin_sitk = dummy_sitk.GetOrigin()[0:-1]
+    # RAS to LPS
+    affine = np.diag([-1, -1, 1, 1]).dot(image_nib.affine)
+    dim_spatial = min(dim, 3)
 
-        vector_image_sitk.SetSpacing(spacing_sitk)
-        vector_image_sitk.SetDirection(direction_sitk)
-        vector_image_sitk.SetOrigin(origin_sitk)
+    A = affine[0:dim_spatial, 0:dim_spatial]
+    spacing = np.sqrt(np.sum(A ** 2, axis=0))
+    direction = np.eye(dim)
+    direction[0:dim_spatial, 0:dim_spatial] = A / spacing
+    origin = np.zeros(dim)
+    origin[0:dim_spatial] = affine[0:dim_spatial, 3]
 
-    return vector_image_sitk
+    if dim > dim_spatial:
+        spacing = np.concatenate((
+            spacing, image_nib.header.get_zooms()[dim_spatial:dim]))
+        spacing[spacing == 0] = 1
+
+    size = nda.shape[0:dim][::-1]
 
-    # All the other stuff did not work (neither in ITK nor in SimpleITK)! See
-    # below. Readings worked but the two components always contained the same
-    # value!
-    # IMAGE_TYPE = itk.Image.D3
-    # # IMAGE_TYPE = itk.Image.VD23
-    # # IMAGE_TYPE = itk.VectorImage.D3
-    # # IMAGE_TYPE = itk.Image.VF23
-    # reader = itk.ImageFileReader[IMAGE_TYPE].New()
-    # reader.SetFileName(DIR_INPUT + filename_ref + ".nii")
-    # reader.Update()
-    # foo_itk = reader.GetOutput()
+    return nda, ImageGeometry(size, spacing, origin, direction)
+
+
+# Data array view of a sitk.Image which keeps the image alive. A writeable
+# view must only be requested for images whose buffer is not shared with
+# other sitk.Image objects (copy-on-write).
+class _SitkArrayInterface(object):
+
+    def __init__(self, image_sitk, writeable=False):
+        array_interface = dict(
+            sitk.GetArrayViewFromImage(image_sitk).__array_interface__)
+        if writeable:
+            array_interface["data"] = (array_interface["data"][0], False)
+        self.__array_interface__ = array_interface
+        self._image_sitk = image_sitk
+
+
+def _get_array_view_from_sitk_image(image_sitk, writeable=False):
+    return np.asarray(_SitkArrayInterface(image_sitk, writeable=writeable))
+
+
+##
+# Reads 3D vector image and return as SimpleITK image
+#
+# Images are expected to store the components in the fourth (or, as written
+# by ITK, fifth) dimension.
+# \date       2016-09-20 15:31:05+0100
+#
+# \param      filename  path to file, string
+# \param      dtype     numpy data type; data type of file if None
+#
+# \return     (Multi-component) sitk.Image object
+#
+def read_sitk_vector_image(filename, dtype=None):
+    return get_sitk_from_nib_image(
+        nib.load(filename), dtype=dtype, is_vector=True)
 
 
 ##
@@ -671,40 +1922,11 @@ def write_sitk_vector_image(
 ):
     # Use nib to generate a (nx, ny, nz, n) image, i.e. 4D.
     # In contrast, sitk would generate a (nx, ny, nz, 1, n) one, i.e. 5D.
-    R = np.array([
-        [-1, 0, 0],
-        [0, -1, 0],
-        [0, 0, 1]])
-    origin_sitk = vector_image_sitk.GetOrigin()
-    direction_sitk = vector_image_sitk.GetDirection()
-    spacing_sitk = vector_image_sitk.GetSpacing()
-
-    t_nib = R.dot(origin_sitk)
-    R_nib = R.dot(np.array(direction_sitk).reshape(
-        3, 3)).dot(np.diag(spacing_sitk))
-
-    A_nib = np.eye(4)
-    A_nib[0:-1, 3] = t_nib
-    A_nib[0:-1, 0:-1] = R_nib
-
-    nda = sitk.GetArrayFromImage(vector_image_sitk)
-    shape = nda.shape
-    nda_nib = np.zeros((shape[2], shape[1], shape[0], shape[3]),
-                       dtype=nda.dtype)
-
-    # Convert to Nibabel data array format, i.e. reorder to x-y-z-components
-    # shape
-    for i in range(0, nda.shape[2]):
-        for k in range(0, nda.shape[0]):
-            nda_nib[i, :, k, :] = nda[k, :, i, :]
-
-    image_nib = nib.Nifti1Pair(nda_nib, A_nib)
-
-    # Update NIfTI image header
-    if header_update is not None:
-        for k, v in six.iteritems(header_update):
-            image_nib.header[k] = v
+    image_nib = get_nib_from_sitk_image(vector_image_sitk, vector_as_5d=False)
+    image_nib = _get_nifti_image_with_header_update(
+        image_nib, header_update=header_update)
 
+    ph.create_directory(os.path.dirname(filename))
     nib.save(image_nib, filename)
 
     if verbose:
@@ -716,7 +1938,9 @@ def write_sitk_vector_image(
 #
 # By default, ITK only writes the q-form and s-form is set to zero. The problem
 # is that, e.g., ITK seems to prioritize the q-form whereas FSL prioritizes the
-# s-form. Additionally, NIfTI header updates can be performed
+# s-form. Therefore, the NIfTI image is created in memory with both forms set
+# (and NIfTI header updates applied) and written once. Other file formats are
+# written by ITK.
 #
 # \see        https://github.com/ANTsX/ANTs/wiki/How-does-ANTs-handle-qform-and-sform-in-NIFTI-1-images%3F
 # \see        https://nifti.nimh.nih.gov/nifti-1/documentation/nifti1fields
@@ -728,6 +1952,8 @@ def write_sitk_vector_image(
 # \param      header_update  dictionary that carries NIfTI header information
 #                            updates
 #
+# \return     exit status
+#
 def write_nifti_image_sitk(
     image_sitk,
     path_to_file,
@@ -738,24 +1964,24 @@ def write_nifti_image_sitk(
     ph.create_directory(os.path.dirname(path_to_file))
     if verbose:
         ph.print_info("Image written to '%s' ... " % path_to_file, newline=0)
-    sitk.WriteImage(image_sitk, path_to_file)
-
-    # Use fslorient to copy q-form to s-form. However, in case of a 3D slice,
-    # it would set dim0 = 2 incorrectly. Using fslmodhd for such a case seems
-    # to do the trick as it updates the s-form as well.
-    if image_sitk.GetDimension() == 3 and image_sitk.GetSize()[-1] == 1:
-        # Do not apply header update to single slice; causes troubles for
-        # some FSL versions (e.g. 5.0.9)
-        flag = 0
-        # flag = ph.execute_command(
-        #     "fslmodhd %s dim0 3" % path_to_file, verbose=debug)
+
+    if _is_nifti_file(path_to_file):
+        image_nib = _get_nifti_image_nib(
+            sitk.GetArrayViewFromImage(image_sitk),
+            image_sitk.GetSpacing(),
+            image_sitk.GetOrigin(),
+            image_sitk.GetDirection(),
+            image_sitk.GetNumberOfComponentsPerPixel())
+        image_nib = _get_nifti_image_with_header_update(
+            image_nib, header_update=header_update)
+        nib.save(image_nib, path_to_file)
     else:
-        flag = apply_header_update(path_to_file, header_update=header_update)
+        sitk.WriteImage(image_sitk, path_to_file)
 
     if verbose:
         print("done")
 
-    return flag
+    return 0
 
 
 def write_nifti_image_itk(
@@ -767,13 +1993,24 @@ def write_nifti_image_itk(
     ph.create_directory(os.path.dirname(path_to_file))
     if verbose:
         ph.print_info("Image written to '%s' ... " % path_to_file, newline=0)
-    itk.imwrite(image_itk, path_to_file)
-    flag = apply_header_update(path_to_file, header_update=header_update)
+
+    if _is_nifti_file(path_to_file):
+        image_nib = _get_nifti_image_nib(
+            itk.array_view_from_image(image_itk),
+            np.array(image_itk.GetSpacing()),
+            np.array(image_itk.GetOrigin()),
+            itk.array_from_matrix(image_itk.GetDirection()),
+            image_itk.GetNumberOfComponentsPerPixel())
+        image_nib = _get_nifti_image_with_header_update(
+            image_nib, header_update=header_update)
+        nib.save(image_nib, path_to_file)
+    else:
+        itk.imwrite(image_itk, path_to_file)
 
     if verbose:
         print("done")
 
-    return flag
+    return 0
 
 
 def write_nifti_image_nib(
@@ -786,14 +2023,15 @@ def write_nifti_image_nib(
     ph.create_directory(os.path.dirname(path_to_file))
     if verbose:
         ph.print_info("Image written to '%s' ... " % path_to_file, newline=0)
-    nib.save(image_nib, path_to_file)
 
-    flag = apply_header_update(path_to_file, header_update=header_update)
+    image_nib = _get_nifti_image_with_header_update(
+        image_nib, header_update=header_update)
+    nib.save(image_nib, path_to_file)
 
     if verbose:
         print("done")
 
-    return flag
+    return 0
 
 
 ##
@@ -804,9 +2042,9 @@ def write_nifti_image_nib(
 # s-form.
 # \see        https://github.com/ANTsX/ANTs/wiki/How-does-ANTs-handle-qform-and-sform-in-NIFTI-1-images%3F
 #
-# subprocess is used to wait for the process to be finished. Resulting image
-# header format will/should be in LPI, i.e neurological (right-handed), rather
-# than RPI, i.e. radiological (left-handed) orientation
+# The header is updated in memory (equivalent to 'fslorient -copyqform2sform'
+# followed by the header updates) and the file is rewritten once. The write
+# functions above set the header before writing and do not need this function.
 # \date       2019-02-23 23:44:12+0000
 #
 # \param      path_to_file  The path to file
@@ -817,34 +2055,133 @@ def write_nifti_image_nib(
 # \return     exit status
 #
 def apply_header_update(path_to_file, verbose=False, header_update=None):
-    # TODO: Depending on the NIfTI image, either s- or q-form is set but not
-    # necessarily both. 'fslorient forceneurological/forceradiological' would
-    # do the trick to set them regardless of whether s- or q-form is given but
-    # may have unintended consequences since not properly tested.
+    image_nib = nib.load(path_to_file)
+
+    # Load data before the file is overwritten
+    image_nib = image_nib.__class__(
+        np.asanyarray(image_nib.dataobj), image_nib.affine, image_nib.header)
+
+    image_nib = _get_nifti_image_with_header_update(
+        image_nib, header_update=header_update)
+    nib.save(image_nib, path_to_file)
+
+    if verbose:
+        ph.print_info("Header of '%s' updated." % path_to_file)
+
+    return 0
+
+
+# Check whether file is written as NIfTI (image or pair)
+def _is_nifti_file(path_to_file):
+    return re.search(r"\.(nii|hdr|img)(\.gz)?$", str(path_to_file)) is not None
+
+
+##
+# Gets the NIfTI affine (RAS) from the geometry of an (Simple)ITK image (LPS).
+#
+# Images of dimension 2 are embedded in 3D; only the spatial part of images of
+# dimension 4 is considered.
+# \date       2026-10-17 23:41:05+0100
+#
+# \param      spacing    spacing as obtained via GetSpacing
+# \param      origin     origin as obtained via GetOrigin
+# \param      direction  (flattened) direction matrix
+#
+# \return     (4 x 4)-numpy array
+#
+def _get_nifti_affine(spacing, origin, direction):
+    dim = len(spacing)
+    direction = np.array(direction, dtype=np.float64).reshape(dim, dim)
+    dim_spatial = min(dim, 3)
+
+    affine = np.eye(4)
+    affine[0:dim_spatial, 0:dim_spatial] = \
+        direction[0:dim_spatial, 0:dim_spatial] * spacing[0:dim_spatial]
+    affine[0:dim_spatial, 3] = origin[0:dim_spatial]
+
+    # LPS to RAS
+    return np.diag([-1, -1, 1, 1]).dot(affine)
+
+
+##
+# Create NIfTI image in memory from a (Simple)ITK data array and its geometry.
+#
+# The header corresponds to the one written by ITK with both q- and s-form set
+# (code 'scanner'). Vector images are stored as 5D arrays (x, y, z, 1,
+# components) with vector intent.
+# \date       2026-10-17 23:44:37+0100
+#
+# \param      nda           data array in (Simple)ITK order, i.e. (z, y, x) or
+#                           (z, y, x, components)
+# \param      spacing       spacing as obtained via GetSpacing
+# \param      origin        origin as obtained via GetOrigin
+# \param      direction     (flattened) direction matrix
+# \param      n_components  number of components per pixel
+#
+# \return     nib.Nifti1Image object
+#
+def _get_nifti_image_nib(nda, spacing, origin, direction, n_components=1):
+    dim = len(spacing)
+
+    # Reorder to x-y-z(-components) without copying data
+    if n_components > 1:
+        nda = nda.transpose(tuple(range(dim - 1, -1, -1)) + (dim,))
+        nda = nda.reshape(nda.shape[0:dim] + (1,) * (4 - dim) +
+                          (n_components,))
+    else:
+        nda = nda.T
+
+    affine = _get_nifti_affine(np.array(spacing), np.array(origin), direction)
+
+    header = nib.Nifti1Header()
+    header.set_data_dtype(nda.dtype)
+    image_nib = nib.Nifti1Image(nda, affine, header)
+
+    header = image_nib.header
+    header.set_qform(affine, code=1)
+    header.set_sform(affine, code=1)
+    header["pixdim"][1:dim + 1] = spacing
+    header["pixdim"][max(dim, 3) + 1:] = 0
+    header.set_xyzt_units("mm", "sec")
+    if n_components > 1:
+        header.set_intent("vector")
 
-    # flag = subprocess.call(["fslorient", "-forceradiological", path_to_file])
-    # flag = subprocess.call(["fslorient", "-forceneurological", path_to_file])
+    return image_nib
 
-    # Causes memory error for NiftyMIC virtual machine (avoid for now)
-    # flag = subprocess.call(["fslorient", "-copyqform2sform", path_to_file])
 
-    flag = ph.execute_command(
-        "fslorient -copyqform2sform '%s'" % path_to_file, verbose=verbose)
+##
+# Gets a copy of a NIfTI image with both q- and s-form set and header updates
+# applied.
+#
+# If the q-form is set, it is copied to the s-form (as 'fslorient
+# -copyqform2sform'), otherwise the s-form is copied to the q-form.
+# \date       2026-10-17 23:48:12+0100
+#
+# \param      image_nib      nib.Nifti1Image or nib.Nifti1Pair object
+# \param      header_update  dictionary that carries NIfTI header information
+#                            updates
+#
+# \return     nib.Nifti1Image or nib.Nifti1Pair object
+#
+def _get_nifti_image_with_header_update(image_nib, header_update=None):
+    image_nib = image_nib.__class__(
+        image_nib.dataobj, image_nib.affine, image_nib.header)
+    image_nib.update_header()
+    header = image_nib.header
 
-    if flag != 0:
-        ph.print_warning(
-            "Only q-form is set as fslorient was not successful!")
+    qform, qform_code = header.get_qform(coded=True)
+    sform, sform_code = header.get_sform(coded=True)
+    if qform_code > 0:
+        header.set_sform(qform, code=int(qform_code))
+    elif sform_code > 0:
+        header.set_qform(sform, code=int(sform_code))
 
-    # Update NIfTI image header
-    # (FSL modhd overwrites 'descript' field with their version by default;
-    # thus use nibabel instead)
     if header_update is not None:
-        image_nib = nib.load(path_to_file)
         for k, v in six.iteritems(header_update):
-            image_nib.header[k] = v
-        nib.save(image_nib, path_to_file)
+            header[k] = v
 
-    return flag
+    return image_nib.__class__(
+        image_nib.dataobj, header.get_best_affine(), header)
 
 
 ##
@@ -870,10 +2207,12 @@ def read_nifti_image_sitk(
     if image_sitk.GetNumberOfComponentsPerPixel() > 1:
         return image_sitk
 
-    # Replace nan (and inf) with numerical values
-    if replace_nan:
+    # Replace nan (and inf) with numerical values; avoid the copy if there
+    # are none
+    if replace_nan and not np.all(np.isfinite(
+            sitk.GetArrayViewFromImage(image_sitk))):
         image_nda = sitk.GetArrayFromImage(image_sitk)
-        image_nda = np.nan_to_num(image_nda)
+        image_nda = np.nan_to_num(image_nda, copy=False)
         image_sitk_ = sitk.GetImageFromArray(image_nda)
         image_sitk_.CopyInformation(image_sitk)
         return image_sitk_
@@ -881,6 +2220,110 @@ def read_nifti_image_sitk(
     return image_sitk
 
 
+##
+# Reads many nifti images using a pool of threads (decompression and
+# SimpleITK release the GIL).
+#
+# Images are returned in input order. Failed reads are reported per file.
+# If prefetch is given, an iterator is returned instead which yields the
+# images in input order while keeping the reads of the next prefetch images
+# in flight, i.e. they are decoded while the caller processes the current
+# image.
+# \date       2026-10-18 01:15:40+0100
+#
+# \param      paths         list of file paths
+# \param      pixel_type    The pixel type as sitk object
+# \param      replace_nan   boolean to indicate whether nan should be replaced
+# \param      n_workers     number of threads; number of CPUs (at most
+#                           prefetch in iterator mode) if None
+# \param      prefetch      number of images read ahead in iterator mode;
+#                           all images are read at once if None
+# \param      raise_errors  If True, an IOError listing all failed files is
+#                           raised (in iterator mode when the failed file is
+#                           reached). Otherwise, a warning is printed and None
+#                           is returned for failed files.
+#
+# \return     list of sitk.Image objects or iterator thereof
+#
+def read_nifti_images_sitk(paths,
+                           pixel_type=sitk.sitkUnknown,
+                           replace_nan=1,
+                           n_workers=None,
+                           prefetch=None,
+                           raise_errors=True):
+    paths = [str(p) for p in paths]
+
+    def read(path):
+        try:
+            return read_nifti_image_sitk(
+                path, pixel_type=pixel_type, replace_nan=replace_nan), None
+        except Exception as e:
+            return None, "Reading '%s' failed: %s" % (path, str(e).strip())
+
+    if prefetch is not None:
+        return _iterate_nifti_images_sitk(
+            paths, read, n_workers, prefetch, raise_errors)
+
+    results = _map_in_thread_pool(read, paths, n_workers=n_workers)
+    errors = [error for image_sitk, error in results if error is not None]
+
+    if len(errors) > 0:
+        if raise_errors:
+            raise IOError("%d of %d images could not be read:\n%s" % (
+                len(errors), len(paths), "\n".join(errors)))
+        for error in errors:
+            ph.print_warning(error)
+
+    return [image_sitk for image_sitk, error in results]
+
+
+##
+# Iterate over images while reading ahead in a pool of threads.
+# \date       2026-10-18 01:19:02+0100
+#
+# \param      paths         list of file paths
+# \param      read          function returning tuple of image and error
+#                           message (or None) for a path
+# \param      n_workers     number of threads; number of CPUs (at most
+#                           prefetch) if None
+# \param      prefetch      number of images read ahead
+# \param      raise_errors  raise IOError for failed files if True; yield None
+#                           otherwise
+#
+# \return     generator yielding sitk.Image objects in input order
+#
+def _iterate_nifti_images_sitk(paths, read, n_workers, prefetch, raise_errors):
+    prefetch = max(1, int(prefetch))
+    if n_workers is None:
+        n_workers = multiprocessing.cpu_count()
+    n_workers = max(1, min(n_workers, prefetch, len(paths)))
+
+    pool = multiprocessing.pool.ThreadPool(n_workers)
+    try:
+        # Keep the current and the next prefetch reads in flight
+        pending = collections.deque()
+        for path in paths[0:prefetch + 1]:
+            pending.append(pool.apply_async(read, (path,)))
+
+        for i in range(len(paths)):
+            image_sitk, error = pending.popleft().get()
+            if i + prefetch + 1 < len(paths):
+                pending.append(pool.apply_async(
+                    read, (paths[i + prefetch + 1],)))
+
+            if error is not None:
+                if raise_errors:
+                    raise IOError(error)
+                ph.print_warning(error)
+
+            yield image_sitk
+
+    finally:
+        # Discard reads ahead if iteration is stopped early
+        pool.terminate()
+        pool.join()
+
+
 ##
 # Print the ITK direction matrix
 # \date       2016-09-20 15:52:28+0100
@@ -976,41 +2419,150 @@ def get_numpy_from_itk_array(array_itk):
     return nda
 
 
+##
+# Gets the smallest signed integer type able to hold all voxel indices of an
+# image.
+# \date       2026-10-17 20:10:44+0100
+#
+# \param      image_sitk  sitk.Image or ImageGeometry object
+#
+# \return     numpy dtype, e.g. int16 for images with less than 32768 voxels
+#             along each axis
+#
+def get_minimal_index_dtype(image_sitk):
+    return np.result_type(
+        np.int8, np.min_scalar_type(-max(image_sitk.GetSize())))
+
+
 ##
 # Gets the indices array to flattened sitk image data array.
 # \date       2016-11-21 00:26:27+0000
 #
 # Get an (image_dimension x N_voxels)-numpy array which holds the indices
-# corresponding to a sitk.GetArrayFromImage(image_sitk).flatten() data array
+# corresponding to a sitk.GetArrayFromImage(image_sitk).flatten() data array.
+# The array is filled from broadcast 1D axes, i.e. no meshgrids or
+# intermediate copies are created.
 #
-# \param      image_sitk  The image sitk
+# \param      image_sitk  The image sitk or ImageGeometry object
+# \param      dtype       integer type of indices; smallest sufficient
+#                         signed type if None, e.g. to save memory for large
+#                         images
 #
-# \return     (image_dimension x N_voxels)-numpy array
+# \return     (image_dimension x N_voxels)-numpy array (C-contiguous)
 #
-def get_indices_array_to_flattened_sitk_image_data_array(image_sitk):
+def get_indices_array_to_flattened_sitk_image_data_array(image_sitk,
+                                                         dtype=np.int64):
+    if dtype is None:
+        dtype = get_minimal_index_dtype(image_sitk)
 
-    shape = np.array(image_sitk.GetSize())[::-1]
-    dim = image_sitk.GetDimension()
+    size = list(image_sitk.GetSize())
+    dim = len(size)
+    indices = np.empty([dim] + size[::-1], dtype=dtype)
+
+    for d in range(dim):
+        # Axis d of the image is axis dim - 1 - d of the data array
+        shape_axis = [1] * dim
+        shape_axis[dim - 1 - d] = size[d]
+        indices[d] = np.arange(size[d], dtype=dtype).reshape(shape_axis)
 
-    x = np.arange(0, shape[0])
-    y = np.arange(0, shape[1])
-    if dim is 3:
-        z = np.arange(0, shape[2])
+    return indices.reshape(dim, -1)
 
-    if dim is 2:
-        # 'ij' yields vertical x-coordinate for image!
-        X, Y = np.meshgrid(x, y, indexing='ij')
 
-        # Index array (2xN_voxels) of image in voxel space
-        indices = np.array([Y.flatten(), X.flatten()])
+##
+# Iterate over the voxel coordinates of an image in chunks.
+#
+# Chunks consist of consecutive slices along the last image axis (i.e. the
+# first axis of the numpy data array) and are chosen such that the
+# coordinates of each chunk do not exceed max_bytes (but contain at least
+# one slice). Coordinates are computed directly from broadcast 1D axes.
+# \date       2026-10-17 20:14:30+0100
+#
+# \param      image_sitk  sitk.Image or ImageGeometry object
+# \param      physical    yield physical points if True, otherwise indices
+# \param      max_bytes   memory budget per chunk in bytes
+# \param      dtype       integer type of indices; smallest sufficient
+#                         signed type if None. Ignored for physical points
+#
+# \return     generator yielding tuples of the slice of the chunk in the
+#             flattened data array, i.e. sitk.GetArrayFromImage(
+#             image_sitk).flatten(), and the (N_chunk x dim)-numpy array of
+#             coordinates in (i, j, k)-order
+#
+def iterate_voxel_coordinates_sitk(image_sitk,
+                                   physical=False,
+                                   max_bytes=CHUNK_MAX_BYTES,
+                                   dtype=None):
+    size = image_sitk.GetSize()
+    dim = len(size)
+    if physical:
+        itemsize = 8
+    elif dtype is None:
+        itemsize = get_minimal_index_dtype(image_sitk).itemsize
     else:
-        # 'ij' yields vertical x-coordinate for image!
-        X, Y, Z = np.meshgrid(x, y, z, indexing='ij')
+        itemsize = np.dtype(dtype).itemsize
+
+    slice_size = int(np.prod(size[0:-1]))
+    n_slices = int(max(1, min(
+        size[-1], max_bytes // (slice_size * dim * itemsize))))
 
-        # Index array (3xN_voxels) of image in voxel space
-        indices = np.array([Z.flatten(), Y.flatten(), X.flatten()])
+    for k in range(0, size[-1], n_slices):
+        k_end = min(k + n_slices, size[-1])
+        coordinates = _get_grid_coordinates(
+            image_sitk, k, k_end, physical=physical, dtype=dtype)
+        yield slice(k * slice_size, k_end * slice_size), coordinates
 
-    return indices
+
+##
+# Gets the coordinates of all voxels of the slab k_start <= k < k_end along
+# the last image axis.
+# \date       2026-10-17 20:18:02+0100
+#
+# \param      image_sitk  sitk.Image or ImageGeometry object
+# \param      k_start     first slice of slab
+# \param      k_end       end of slab (exclusive)
+# \param      physical    return physical points if True, otherwise indices
+# \param      dtype       integer type of indices; smallest sufficient
+#                         signed type if None. Ignored for physical points
+#
+# \return     (N_slab x dim)-numpy array in the order of the flattened data
+#             array
+#
+def _get_grid_coordinates(image_sitk,
+                          k_start,
+                          k_end,
+                          physical=False,
+                          dtype=None):
+    size = list(image_sitk.GetSize())
+    dim = len(size)
+    shape = [k_end - k_start] + size[-2::-1]
+
+    if physical:
+        geometry = get_image_geometry(image_sitk)
+        A = geometry.get_matrix()
+        coordinates = np.empty(shape + [dim])
+        coordinates[...] = geometry.GetOrigin()
+    else:
+        if dtype is None:
+            dtype = get_minimal_index_dtype(image_sitk)
+        coordinates = np.empty(shape + [dim], dtype=dtype)
+
+    for d in range(dim):
+        start = k_start if d == dim - 1 else 0
+        end = k_end if d == dim - 1 else size[d]
+
+        # Axis d of the image is axis dim - 1 - d of the data array
+        shape_axis = [1] * (dim + 1)
+        shape_axis[dim - 1 - d] = end - start
+        if physical:
+            shape_axis[dim] = dim
+            coordinates += (
+                np.arange(start, end)[:, np.newaxis] * A[:, d]).reshape(
+                shape_axis)
+        else:
+            coordinates[..., d] = np.arange(start, end, dtype=dtype).reshape(
+                shape_axis[0:dim])
+
+    return coordinates.reshape(-1, dim)
 
 
 ##
@@ -1038,47 +2590,42 @@ def get_numpy_array_of_jacobian_itk_transform_applied_on_sitk_image(
         points=None,
         jacobian_transform_on_image_nda=None):
 
-    # Shape of corresponding image data array
-    shape = np.array(image_sitk.GetSize())
     dim = image_sitk.GetDimension()
-
-    # Shall reduce the computational burden in case points stay the same.
-    # However, it does not add much to the computational time
     if points is None:
-
-        # Index array (dimension x N_voxels) of image in voxel space
-        indices = get_indices_array_to_flattened_sitk_image_data_array(
-            image_sitk)
-
-        # Get transform from voxel to image space coordinates
-        A = get_sitk_affine_matrix_from_sitk_image(
-            image_sitk).reshape(dim, dim)
-        t = np.array(image_sitk.GetOrigin()).reshape(dim, 1)
-
-        # Compute point array (3xN_voxels) of image in image space
-        points = A.dot(indices) + t
+        N_voxels = int(np.prod(image_sitk.GetSize()))
+    else:
+        N_voxels = points.shape[1]
 
     if jacobian_transform_on_image_nda is None:
         # Allocate memory
         transform_dof = int(transform_itk.GetNumberOfParameters())
         jacobian_transform_on_image_nda = np.zeros(
-            (points.shape[1], dim, transform_dof))
+            (N_voxels, dim, transform_dof))
 
     # Create 2D itk-array
     jacobian_transform_on_point_itk = itk.Array2D[itk.D]()
 
+    # Points are streamed chunkwise unless given
+    if points is None:
+        chunks = iterate_voxel_coordinates_sitk(image_sitk, physical=True)
+    else:
+        chunks = [(slice(0, points.shape[1]), points.T)]
+
     # Evaluate the Jacobian of transform at all points
-    for i in range(0, points.shape[1]):
+    for chunk, points_chunk in chunks:
+        for i, point in zip(range(chunk.start, chunk.stop),
+                            points_chunk.tolist()):
 
-        # Compute Jacobian of transform w.r.t. parameters evaluated at point
-        # jacobian_transform_point_itk is (Dimension x transform_DOF) array
-        transform_itk.ComputeJacobianWithRespectToParameters(
-            points[:, i], jacobian_transform_on_point_itk)
+            # Compute Jacobian of transform w.r.t. parameters evaluated at
+            # point; jacobian_transform_point_itk is (Dimension x
+            # transform_DOF) array
+            transform_itk.ComputeJacobianWithRespectToParameters(
+                point, jacobian_transform_on_point_itk)
 
-        # Convert itk to numpy array
-        # THE computational time consuming part!
-        jacobian_transform_on_image_nda[i, :, :] = get_numpy_from_itk_array(
-            jacobian_transform_on_point_itk)
+            # Convert itk to numpy array
+            # THE computational time consuming part!
+            jacobian_transform_on_image_nda[i, :, :] = \
+                get_numpy_from_itk_array(jacobian_transform_on_point_itk)
 
     # Return Jacobian w.r.t to parameters evaluated at all image points
     return jacobian_transform_on_image_nda
@@ -1155,121 +2702,174 @@ def get_sitk_from_itk_direction(direction_itk):
 
 
 ##
-# Convert itk.Euler3DTransform to sitk.Euler3DTransform instance
-# \date       2017-06-26 16:58:27+0100
+# Gets the numpy array of itk (optimizer) parameters using a single buffer
+# copy.
+# \date       2026-10-17 18:02:14+0100
 #
-# \param[in]  Euler3DTransform_itk  itk.Euler3DTransform instance
+# \param      parameters_itk  itk.OptimizerParameters object
 #
-# \return     converted sitk.Euler3DTransform instance
+# \return     numpy array (float64)
 #
-def get_sitk_from_itk_Euler3DTransform(Euler3DTransform_itk):
-    parameters_itk = Euler3DTransform_itk.GetParameters()
-    fixed_parameters_itk = Euler3DTransform_itk.GetFixedParameters()
+def _get_numpy_from_itk_parameters(parameters_itk):
+    return itk.array_from_vnl_vector(parameters_itk).astype(
+        np.float64, copy=False)
 
-    N_params = parameters_itk.GetNumberOfElements()
-    N_fixedparams = fixed_parameters_itk.GetNumberOfElements()
 
-    parameters_sitk = np.zeros(N_params)
-    fixed_parameters_sitk = np.zeros(N_fixedparams)
+##
+# Gets the itk (optimizer) parameters of a numpy array using a single buffer
+# copy.
+# \date       2026-10-17 18:04:37+0100
+#
+# \param      nda         1D numpy array
+# \param      pixel_type  itk pixel type of parameters, i.e. itk.D or itk.F
+#
+# \return     itk.OptimizerParameters object
+#
+def _get_itk_parameters_from_numpy(nda, pixel_type=itk.D):
+    dtype = np.float32 if pixel_type == itk.F else np.float64
+    nda = np.ascontiguousarray(nda, dtype=dtype)
 
-    for i in range(0, N_params):
-        parameters_sitk[i] = parameters_itk.GetElement(i)
+    parameters_itk = itk.OptimizerParameters[pixel_type](nda.size)
+    if nda.size > 0:
+        # Keep reference to vector as long as its data block is accessed
+        vector_vnl = itk.vnl_vector_from_array(nda)
+        parameters_itk.copy_in(vector_vnl.data_block())
 
-    for i in range(0, N_fixedparams):
-        fixed_parameters_sitk[i] = fixed_parameters_itk.GetElement(i)
+    return parameters_itk
 
-    Euler3DTransform_sitk = sitk.Euler3DTransform()
-    Euler3DTransform_sitk.SetParameters(parameters_sitk)
-    Euler3DTransform_sitk.SetFixedParameters(fixed_parameters_sitk)
 
-    return Euler3DTransform_sitk
+def _get_sitk_from_itk_transform(transform_itk, transform_type):
+    transform_sitk = transform_type.new_sitk()
+    transform_sitk.SetFixedParameters(_get_numpy_from_itk_parameters(
+        transform_itk.GetFixedParameters()))
+    transform_sitk.SetParameters(_get_numpy_from_itk_parameters(
+        transform_itk.GetParameters()))
 
+    return transform_sitk
 
-def get_sitk_from_itk_transform(transform_itk):
-    dimension = transform_itk.GetInputSpaceDimension()
 
-    if transform_itk.GetNameOfClass() == "AffineTransform":
-        transform_sitk = sitk.AffineTransform(dimension)
-    else:
-        transform_sitk = eval("sitk.%s()" % (transform_itk.GetNameOfClass()))
+def _get_itk_from_sitk_transform(transform_sitk, transform_type, pixel_type):
+    transform_itk = transform_type.new_itk()
+
+    # Fixed parameters define the number of parameters, e.g. for BSplines
+    transform_itk.SetFixedParameters(_get_itk_parameters_from_numpy(
+        transform_sitk.GetFixedParameters(), itk.D))
 
-    parameters_itk = transform_itk.GetParameters()
-    fixed_parameters_itk = transform_itk.GetFixedParameters()
+    # Some transforms, e.g. itk.BSplineTransform, only keep a reference to
+    # the parameters passed via SetParameters
+    transform_itk.SetParametersByValue(_get_itk_parameters_from_numpy(
+        transform_sitk.GetParameters(), pixel_type))
 
-    N_params = parameters_itk.GetNumberOfElements()
-    N_fixedparams = fixed_parameters_itk.GetNumberOfElements()
+    return transform_itk
 
-    parameters_sitk = np.zeros(N_params)
-    fixed_parameters_sitk = np.zeros(N_fixedparams)
 
-    for i in range(0, N_params):
-        parameters_sitk[i] = parameters_itk.GetElement(i)
+##
+# Convert itk.Euler3DTransform to sitk.Euler3DTransform instance
+# \date       2017-06-26 16:58:27+0100
+#
+# \param[in]  Euler3DTransform_itk  itk.Euler3DTransform instance
+#
+# \return     converted sitk.Euler3DTransform instance
+#
+def get_sitk_from_itk_Euler3DTransform(Euler3DTransform_itk):
+    return get_sitk_from_itk_transform(Euler3DTransform_itk)
 
-    for i in range(0, N_fixedparams):
-        fixed_parameters_sitk[i] = fixed_parameters_itk.GetElement(i)
 
-    transform_sitk.SetParameters(parameters_sitk)
-    transform_sitk.SetFixedParameters(fixed_parameters_sitk)
+##
+# Convert itk transform to sitk transform of same type
+# \date       2026-10-17 18:10:02+0100
+#
+# \param[in]  transform_itk  itk transform, e.g. itk.Euler3DTransform
+#
+# \return     converted sitk transform, e.g. sitk.Euler3DTransform
+#
+def get_sitk_from_itk_transform(transform_itk):
+    return _get_sitk_from_itk_transform(
+        transform_itk, tr.get_transform_type_of_itk(transform_itk))
 
-    return transform_sitk
 
+##
+# Convert list of itk transforms to sitk transforms of same types
+# \date       2026-10-17 18:11:40+0100
+#
+# \param[in]  transforms_itk  list of itk transforms
+#
+# \return     list of converted sitk transforms
+#
+def get_sitk_from_itk_transforms(transforms_itk):
+    transform_types = {}
+    transforms_sitk = [None] * len(transforms_itk)
 
-def get_itk_from_sitk_transform(transform_sitk, pixel_type=itk.D):
-    if transform_sitk.GetName() == "AffineTransform":
-        transform_itk = itk.AffineTransform[
-            pixel_type, transform_sitk.GetDimension()].New()
-    else:
-        transform_itk = getattr(itk, transform_sitk.GetName())[
-            pixel_type].New()
-
-    parameters_itk = transform_itk.GetParameters()
-    parameters_sitk = transform_sitk.GetParameters()
-    fixed_parameters_itk = transform_itk.GetFixedParameters()
-    fixed_parameters_sitk = transform_sitk.GetFixedParameters()
-
-    # Update transform parameters
-    for i in range(len(parameters_sitk)):
-        parameters_itk.SetElement(i, parameters_sitk[i])
-    for i in range(len(fixed_parameters_sitk)):
-        fixed_parameters_itk.SetElement(i, fixed_parameters_sitk[i])
-    transform_itk.SetParameters(parameters_itk)
-    transform_itk.SetFixedParameters(fixed_parameters_itk)
+    for i, transform_itk in enumerate(transforms_itk):
+        # Proxy classes are specific to the template instantiation
+        key = type(transform_itk)
+        if key not in transform_types:
+            transform_types[key] = tr.get_transform_type_of_itk(transform_itk)
+        transforms_sitk[i] = _get_sitk_from_itk_transform(
+            transform_itk, transform_types[key])
 
-    return transform_itk
+    return transforms_sitk
 
 
 ##
-# Convert itk.AffineTransform to sitk.AffineTransform instance
-# \date       2017-06-26 16:58:14+0100
+# Convert sitk transform to itk transform of same type
+# \date       2026-10-17 18:13:25+0100
 #
-# \param[in]  AffineTransform_itk  itk.AffineTransform instance
+# \param[in]  transform_sitk  sitk transform, e.g. sitk.Euler3DTransform
+# \param[in]  pixel_type      precision of itk transform, i.e. itk.D or
+#                             itk.F
 #
-# \return     converted sitk.AffineTransform instance
+# \return     converted itk transform, e.g. itk.Euler3DTransform
 #
-def get_sitk_from_itk_AffineTransform(AffineTransform_itk):
+def get_itk_from_sitk_transform(transform_sitk, pixel_type=itk.D):
+    return get_itk_from_sitk_transforms([transform_sitk], pixel_type)[0]
 
-    dim = len(AffineTransform_itk.GetTranslation())
 
-    parameters_itk = AffineTransform_itk.GetParameters()
-    fixed_parameters_itk = AffineTransform_itk.GetFixedParameters()
+##
+# Convert list of sitk transforms to itk transforms of same types
+# \date       2026-10-17 18:14:48+0100
+#
+# \param[in]  transforms_sitk  list of sitk transforms
+# \param[in]  pixel_type       precision of itk transforms, i.e. itk.D or
+#                              itk.F
+#
+# \return     list of converted itk transforms
+#
+def get_itk_from_sitk_transforms(transforms_sitk, pixel_type=itk.D):
+    precision = "float" if pixel_type == itk.F else "double"
+    transform_types = {}
+    transforms_itk = [None] * len(transforms_sitk)
 
-    N_params = parameters_itk.GetNumberOfElements()
-    N_fixedparams = fixed_parameters_itk.GetNumberOfElements()
+    for i, transform_sitk in enumerate(transforms_sitk):
+        key = (transform_sitk.GetName(), transform_sitk.GetDimension())
+        if key not in transform_types:
+            transform_type = tr.get_transform_type_of_sitk(transform_sitk)
+            transform_type = tr.get_transform_type(
+                transform_type.name, transform_type.dimension, precision)
 
-    parameters_sitk = np.zeros(N_params)
-    fixed_parameters_sitk = np.zeros(N_fixedparams)
+            # Generic sitk.Transform objects can be of any type
+            if key[0] == "Transform":
+                transforms_itk[i] = _get_itk_from_sitk_transform(
+                    transform_sitk, transform_type, pixel_type)
+                continue
+            transform_types[key] = transform_type
 
-    for i in range(0, N_params):
-        parameters_sitk[i] = parameters_itk.GetElement(i)
+        transforms_itk[i] = _get_itk_from_sitk_transform(
+            transform_sitk, transform_types[key], pixel_type)
 
-    for i in range(0, N_fixedparams):
-        fixed_parameters_sitk[i] = fixed_parameters_itk.GetElement(i)
+    return transforms_itk
 
-    AffineTransform_sitk = sitk.AffineTransform(dim)
-    AffineTransform_sitk.SetParameters(parameters_sitk)
-    AffineTransform_sitk.SetFixedParameters(fixed_parameters_sitk)
 
-    return AffineTransform_sitk
+##
+# Convert itk.AffineTransform to sitk.AffineTransform instance
+# \date       2017-06-26 16:58:14+0100
+#
+# \param[in]  AffineTransform_itk  itk.AffineTransform instance
+#
+# \return     converted sitk.AffineTransform instance
+#
+def get_sitk_from_itk_AffineTransform(AffineTransform_itk):
+    return get_sitk_from_itk_transform(AffineTransform_itk)
 
 
 ##
@@ -1357,10 +2957,20 @@ def get_sitk_from_itk_image(image_itk):
 #
 # \param      rigid_affine_similarity_transform_sitk  The rigid affine
 #                                                     similarity transform sitk
+#                                                     or TransformBatch
 # \param      text                                    The text
 #
 def print_sitk_transform(rigid_affine_similarity_transform_sitk, text=None):
 
+    if isinstance(rigid_affine_similarity_transform_sitk, TransformBatch):
+        transform_batch = rigid_affine_similarity_transform_sitk
+        if text is None:
+            text = transform_batch.get_transform_type()
+        for i, transform_sitk in enumerate(
+                transform_batch.get_sitk_transforms()):
+            print_sitk_transform(transform_sitk, text="%s %d" % (text, i))
+        return
+
     dim = rigid_affine_similarity_transform_sitk.GetDimension()
 
     if text is None:
@@ -1657,23 +3267,21 @@ def show_sitk_image(image_sitk,
             dir_output, label_segmentation + ".nii.gz")
 
         # In case images are not in the same physical space, resample them
-        try:
-            sitk.Cast(segmentation,
-                      image_sitk[0].GetPixelIDValue()) - image_sitk[0]
-        except:
+        if not same_physical_space(segmentation, image_sitk[0]):
             segmentation = sitk.Resample(
                 segmentation,
                 image_sitk[0],
-                eval("sitk.Euler%dDTransform()" %
-                     (image_sitk[0].GetDimension())),
+                tr.get_transform_type(
+                    "Euler%dDTransform" % image_sitk[0].GetDimension(),
+                    image_sitk[0].GetDimension()).new_sitk(),
                 sitk.sitkNearestNeighbor,
                 0)
 
         write_nifti_image_sitk(segmentation, filename_segmentation)
 
     # Get command line to call viewer
-    cmd = eval("ph.get_function_call_" + viewer +
-               "(filenames, filename_segmentation)")
+    cmd = getattr(ph, "get_function_call_" + viewer)(
+        filenames, filename_segmentation)
 
     # Execute command
     ph.execute_command(cmd, verbose)
@@ -1855,9 +3463,8 @@ def get_downsampled_sitk_image(image_sitk,
 
     # Choose interpolator
     try:
-        interpolator_str = interpolator
-        interpolator = eval("sitk.sitk" + interpolator_str)
-    except:
+        interpolator = getattr(sitk, "sitk" + interpolator)
+    except AttributeError:
         raise ValueError("Error: interpolator is not known")
 
     # Define new image space
@@ -1868,7 +3475,8 @@ def get_downsampled_sitk_image(image_sitk,
     image_sitk_resampled = sitk.Resample(
         image_sitk,
         size_new,
-        eval("sitk.Euler" + str(dimension) + "DTransform()"),
+        tr.get_transform_type(
+            "Euler%dDTransform" % dimension, dimension).new_sitk(),
         interpolator,
         image_sitk.GetOrigin(),
         spacing_new,
@@ -1877,3 +3485,326 @@ def get_downsampled_sitk_image(image_sitk,
         image_sitk.GetPixelIDValue())
 
     return image_sitk_resampled
+
+
+##
+# Build a multi-resolution pyramid of an image.
+#
+# Each level is obtained from the input image directly so that levels are
+# computed independently on a thread pool. The voxels of a level cover
+# blocks of factor voxels of the input image, i.e. the first voxel of a level
+# is centered at the continuous index (factor - 1) / 2 and trailing voxels
+# not covering an entire block are dropped.
+#
+# Anti-aliasing is performed by
+#   - block averaging (NumPy reshape-reduce) for integer factors if no sigmas
+#     are given,
+#   - Gaussian smoothing with standard deviation sigma (in voxels of the input
+#     image; factor / 2 by default as in itk::MultiResolutionPyramidImageFilter)
+#     followed by resampling otherwise.
+# Label maps are downsampled by majority vote within the blocks (ties in
+# favour of the smaller label) for integer factors and by nearest neighbour
+# interpolation otherwise.
+#
+# Levels are cached by geometry and content hash of the input image, so
+# repeated calls, e.g. by multi-resolution registrations, reuse them.
+# \date       2026-10-17 21:05:14+0100
+#
+# \param      image_sitk    sitk.Image
+# \param      factors       list of downsampling factors, one per level. Each
+#                           factor is either a scalar or a sequence of length
+#                           dim in (x, y, z)-order
+# \param      sigmas        list of standard deviations in voxels of the
+#                           input image, one per level (scalar or sequence of
+#                           length dim); only used for intensity images
+# \param      is_label      Boolean whether image is a label map
+# \param      interpolator  interpolator used after Gaussian smoothing
+# \param      n_workers     number of threads; number of CPUs if None
+# \param      use_cache     Boolean whether levels are looked up in and
+#                           stored to the pyramid cache
+#
+# \return     list of sitk.Image objects in the order of factors
+#
+def build_image_pyramid(image_sitk,
+                        factors,
+                        sigmas=None,
+                        is_label=False,
+                        interpolator="Linear",
+                        n_workers=None,
+                        use_cache=True):
+
+    dimension = image_sitk.GetDimension()
+
+    factors = [_get_pyramid_vector(f, dimension) for f in factors]
+    if np.any(np.array(factors) < 1):
+        raise ValueError("Downsampling factors must be at least 1")
+    if sigmas is None:
+        sigmas = [None] * len(factors)
+    else:
+        sigmas = [_get_pyramid_vector(s, dimension) for s in sigmas]
+        if len(sigmas) != len(factors):
+            raise ValueError("Number of sigmas and factors must match")
+
+    try:
+        getattr(sitk, "sitk" + interpolator)
+    except AttributeError:
+        raise ValueError("Error: interpolator is not known")
+
+    levels = [(f, s, bool(is_label), interpolator)
+              for f, s in zip(factors, sigmas)]
+
+    if use_cache:
+        key_image = (
+            ImageGeometry.from_sitk(image_sitk),
+            image_sitk.GetPixelIDValue(),
+            hashlib.sha1(np.ascontiguousarray(
+                sitk.GetArrayViewFromImage(image_sitk))).hexdigest(),
+        )
+        images_sitk = [IMAGE_PYRAMID_CACHE.get((key_image, level))
+                       for level in levels]
+    else:
+        images_sitk = [None] * len(levels)
+
+    indices = [i for i, im in enumerate(images_sitk) if im is None]
+    images_new_sitk = _map_in_thread_pool(
+        lambda i: _get_pyramid_level(image_sitk, *levels[i]),
+        indices, n_workers=n_workers)
+
+    for i, image_level_sitk in zip(indices, images_new_sitk):
+        images_sitk[i] = image_level_sitk
+        if use_cache:
+            IMAGE_PYRAMID_CACHE.put(
+                (key_image, levels[i]), image_level_sitk,
+                sitk.GetArrayViewFromImage(image_level_sitk).nbytes)
+
+    # Shallow copies so that header changes do not alter cached levels
+    return [sitk.Image(im) for im in images_sitk]
+
+
+# Convert scalar or sequence to tuple of floats of length dimension
+def _get_pyramid_vector(value, dimension):
+    vector = np.array(value, dtype=np.float64).flatten()
+    if vector.size == 1:
+        vector = np.repeat(vector, dimension)
+    if vector.size != dimension:
+        raise ValueError("Expected scalar or sequence of length %d" %
+                         dimension)
+    return tuple(float(v) for v in vector)
+
+
+##
+# Compute a single level of an image pyramid.
+# \date       2026-10-17 21:12:40+0100
+#
+# \param      image_sitk    sitk.Image
+# \param      factor        tuple of downsampling factors in (x, y, z)-order
+# \param      sigma         tuple of standard deviations in voxels or None
+# \param      is_label      Boolean whether image is a label map
+# \param      interpolator  interpolator used after Gaussian smoothing
+#
+# \return     sitk.Image
+#
+def _get_pyramid_level(image_sitk, factor, sigma, is_label, interpolator):
+    dimension = image_sitk.GetDimension()
+    factor = np.array(factor)
+    spacing = np.array(image_sitk.GetSpacing())
+    size = np.array(image_sitk.GetSize())
+
+    size_new = np.maximum(np.floor(size / factor), 1).astype(int)
+    spacing_new = spacing * factor
+    origin_new = transform_indices_to_physical_points_sitk(
+        (factor - 1) / 2., image_sitk)
+
+    is_integer = np.all(factor == np.round(factor)) \
+        and np.all(size_new * factor <= size)
+
+    if is_integer and (is_label or sigma is None):
+        factor = factor.astype(int)
+        nda = sitk.GetArrayViewFromImage(image_sitk)
+
+        # Crop to blocks and reshape to (z', f_z, y', f_y, x', f_x[, c])
+        nda = nda[tuple(slice(0, n * f) for n, f in
+                        zip(size_new[::-1], factor[::-1]))]
+        shape = []
+        for n, f in zip(size_new[::-1], factor[::-1]):
+            shape.extend([n, f])
+        nda_blocks = nda.reshape(tuple(shape) + nda.shape[dimension:])
+        axes = tuple(range(1, 2 * dimension, 2))
+
+        if is_label:
+            nda_new = _get_majority_vote(nda_blocks, axes)
+        else:
+            nda_new = nda_blocks.mean(axis=axes, dtype=np.float64)
+            if not np.issubdtype(nda.dtype, np.floating):
+                nda_new = np.round(nda_new)
+            nda_new = nda_new.astype(nda.dtype)
+
+        image_new_sitk = sitk.GetImageFromArray(
+            nda_new, isVector=image_sitk.GetNumberOfComponentsPerPixel() > 1)
+        image_new_sitk.SetSpacing(spacing_new)
+        image_new_sitk.SetOrigin(origin_new)
+        image_new_sitk.SetDirection(image_sitk.GetDirection())
+        return image_new_sitk
+
+    if is_label:
+        interpolator = "NearestNeighbor"
+    else:
+        if sigma is None:
+            sigma = factor / 2.
+        image_sitk = _get_smoothed_sitk_image(
+            image_sitk, np.array(sigma) * spacing)
+
+    return sitk.Resample(
+        image_sitk,
+        [int(s) for s in size_new],
+        tr.get_transform_type(
+            "Euler%dDTransform" % dimension, dimension).new_sitk(),
+        getattr(sitk, "sitk" + interpolator),
+        origin_new,
+        spacing_new,
+        image_sitk.GetDirection(),
+        0.0,
+        image_sitk.GetPixelIDValue())
+
+
+# Gaussian smoothing of (vector) image in double precision by recursive
+# filtering along each axis with sigma > 0; sigma in mm
+def _get_smoothed_sitk_image(image_sitk, sigma):
+    if image_sitk.GetNumberOfComponentsPerPixel() > 1:
+        return sitk.Compose([
+            _get_smoothed_sitk_image(
+                sitk.VectorIndexSelectionCast(image_sitk, i, sitk.sitkFloat64),
+                sigma)
+            for i in range(image_sitk.GetNumberOfComponentsPerPixel())])
+
+    image_sitk = sitk.Cast(image_sitk, sitk.sitkFloat64)
+    for axis, sigma_axis in enumerate(sigma):
+        if sigma_axis > 0:
+            image_sitk = sitk.RecursiveGaussian(
+                image_sitk, float(sigma_axis), False,
+                sitk.RecursiveGaussianImageFilter.ZeroOrder, axis)
+
+    return image_sitk
+
+
+##
+# Majority vote along the given axes of an array
+# \date       2026-10-17 21:18:55+0100
+#
+# \param      nda   numpy array of labels
+# \param      axes  tuple of axes to reduce
+#
+# \return     numpy array of most frequent labels (smaller label for ties)
+#
+def _get_majority_vote(nda, axes):
+    axes_kept = [i for i in range(nda.ndim) if i not in axes]
+    shape = tuple(nda.shape[i] for i in axes_kept)
+
+    # Gather votes contiguously in last axis
+    nda = nda.transpose(axes_kept + list(axes)).reshape(shape + (-1,))
+    dtype_counts = np.min_scalar_type(nda.shape[-1])
+
+    nda_vote = None
+    counts_vote = None
+    for label in np.unique(nda):
+        counts = np.add.reduce(nda == label, axis=-1, dtype=dtype_counts)
+        if nda_vote is None:
+            nda_vote = np.full(shape, label, dtype=nda.dtype)
+            counts_vote = counts
+        else:
+            mask = counts > counts_vote
+            nda_vote[mask] = label
+            counts_vote = np.maximum(counts, counts_vote)
+
+    return nda_vote
+
+
+##
+# Resample images onto a common reference grid in parallel.
+#
+# Images are distributed over a pool of threads (SimpleITK releases the GIL).
+# Each thread reuses a single, configured sitk.ResampleImageFilter whose
+# number of threads is limited to (number of CPUs / n_workers) so that cores
+# are not oversubscribed. Resampled images are returned in input order.
+# Images already in the physical space of the reference and without
+# transform are not resampled, see same_physical_space.
+# \date       2026-10-17 21:48:37+0100
+#
+# \param      images_sitk          list of sitk.Image objects; LazyImage
+#                                  objects are read by the threads
+# \param      image_ref_sitk       reference image defining the output grid;
+#                                  sitk.Image, ImageGeometry or LazyImage
+# \param      transforms           None (identity), single transform used for
+#                                  all images or one transform per image;
+#                                  sitk transforms, TransformChain or
+#                                  TransformBatch objects are supported
+# \param      interpolator         interpolator, e.g. "Linear"
+# \param      default_pixel_value  value of pixels mapped outside the images
+# \param      n_workers            number of threads; number of CPUs if None
+#
+# \return     list of resampled sitk.Image objects
+#
+def resample_images_to_reference(images_sitk,
+                                 image_ref_sitk,
+                                 transforms=None,
+                                 interpolator="Linear",
+                                 default_pixel_value=0.0,
+                                 n_workers=None):
+
+    images_sitk = list(images_sitk)
+    N_images = len(images_sitk)
+
+    if isinstance(transforms, TransformBatch):
+        transforms = transforms.get_sitk_transforms()
+    elif transforms is None or not isinstance(transforms, (list, tuple)):
+        transforms = [transforms] * N_images
+    transforms = [t.get_sitk_transform() if isinstance(t, TransformChain)
+                  else t for t in transforms]
+    if len(transforms) != N_images:
+        raise ValueError("Number of transforms and images must match")
+
+    try:
+        interpolator = getattr(sitk, "sitk" + interpolator)
+    except AttributeError:
+        raise ValueError("Error: interpolator is not known")
+
+    n_cpus = multiprocessing.cpu_count()
+    if n_workers is None:
+        n_workers = n_cpus
+    n_workers = max(1, min(n_workers, N_images))
+    n_threads_filter = max(1, n_cpus // n_workers)
+
+    geometry = get_image_geometry(image_ref_sitk)
+    local = threading.local()
+
+    def resample(i):
+        image_sitk = images_sitk[i]
+        if isinstance(image_sitk, LazyImage):
+            image_sitk = image_sitk.get_sitk()
+
+        # Images on the reference grid are passed through (shallow copy)
+        if transforms[i] is None and \
+                same_physical_space(image_sitk, geometry):
+            return sitk.Image(image_sitk)
+
+        resampler = getattr(local, "resampler", None)
+        if resampler is None:
+            resampler = sitk.ResampleImageFilter()
+            resampler.SetSize(geometry.GetSize())
+            resampler.SetOutputOrigin(geometry.GetOrigin())
+            resampler.SetOutputSpacing(geometry.GetSpacing())
+            resampler.SetOutputDirection(geometry.GetDirection())
+            resampler.SetInterpolator(interpolator)
+            resampler.SetDefaultPixelValue(default_pixel_value)
+            resampler.SetNumberOfThreads(n_threads_filter)
+            local.resampler = resampler
+
+        if transforms[i] is None:
+            resampler.SetTransform(sitk.Transform(
+                geometry.GetDimension(), sitk.sitkIdentity))
+        else:
+            resampler.SetTransform(transforms[i])
+
+        return resampler.Execute(image_sitk)
+
+    return _map_in_thread_pool(resample, range(N_images), n_workers=n_workers)
@@ -0,0 +1,574 @@
+##
+# \file transform_batch.py
+# \brief      Class to hold many affine-type transforms in contiguous arrays
+#
+# \author     Michael Ebner (michael.ebner.14@ucl.ac.uk)
+# \date       October 2026
+#
+
+import numpy as np
+
+import pysitk.transform_registry as tr
+
+
+# Transform types whose matrix is a pure rotation
+RIGID_TRANSFORM_TYPES = [
+    "Euler2DTransform",
+    "Euler3DTransform",
+    "VersorTransform",
+    "VersorRigid3DTransform",
+]
+
+# Transform types without translation parameters, i.e. rotations about the
+# center only
+TRANSLATION_FREE_TRANSFORM_TYPES = [
+    "VersorTransform",
+]
+
+
+##
+# Array-backed container of N affine-type transforms of the same type.
+#
+# Each transform T_n(x) = A_n(x - c_n) + t_n + c_n is stored via its
+# (N x dim x dim) matrices A, (N x dim) translations t and (N x F) fixed
+# parameters whose first dim columns are the centers c. SimpleITK objects are
+# only created when explicitly requested via get_sitk_transforms.
+# \date       2026-10-17 11:02:16+0100
+#
+class TransformBatch(object):
+
+    __slots__ = [
+        "_transform_type",
+        "_matrix",
+        "_translation",
+        "_fixed_parameters",
+    ]
+
+    ##
+    # Store transform information
+    # \date       2026-10-17 11:04:40+0100
+    #
+    # \param      self              The object
+    # \param      matrix            (N x dim x dim)-numpy array
+    # \param      translation       (N x dim)-numpy array; zero if None
+    # \param      fixed_parameters  (N x F)-numpy array with F >= dim whose
+    #                               first dim columns hold the centers; zero if
+    #                               None
+    # \param      transform_type    name of sitk transform type, e.g.
+    #                               "Euler3DTransform"
+    #
+    def __init__(self,
+                 matrix,
+                 translation=None,
+                 fixed_parameters=None,
+                 transform_type="AffineTransform"):
+
+        matrix = np.array(matrix, dtype=np.float64, order="C", ndmin=3)
+        N, dim = matrix.shape[0:2]
+
+        if translation is None:
+            translation = np.zeros((N, dim))
+        if fixed_parameters is None:
+            fixed_parameters = np.zeros((N, dim))
+
+        translation = np.array(
+            translation, dtype=np.float64, order="C", ndmin=2)
+        fixed_parameters = np.array(
+            fixed_parameters, dtype=np.float64, order="C", ndmin=2)
+
+        if matrix.shape[1:] != (dim, dim) \
+                or translation.shape != (N, dim) \
+                or fixed_parameters.shape[0] != N \
+                or fixed_parameters.shape[1] < dim:
+            raise ValueError("Shapes of transform arrays are not consistent")
+
+        self._transform_type = transform_type
+        self._matrix = matrix
+        self._translation = translation
+        self._fixed_parameters = fixed_parameters
+
+    ##
+    # Create batch from a list of sitk transforms.
+    #
+    # If transforms are of different types the batch is of type
+    # AffineTransform. Transforms without translation, i.e. VersorTransform,
+    # are stored with zero translation.
+    # \date       2026-10-17 11:10:51+0100
+    #
+    # \param      cls              The cls
+    # \param      transforms_sitk  list of affine-type sitk transforms
+    #
+    # \return     TransformBatch object
+    #
+    @classmethod
+    def from_sitk(cls, transforms_sitk):
+        transforms_sitk = [_get_downcast_sitk_transform(t)
+                           for t in transforms_sitk]
+        if len(transforms_sitk) == 0:
+            raise ValueError("At least one transform is required")
+
+        dim = transforms_sitk[0].GetDimension()
+        names = set([t.GetName() for t in transforms_sitk])
+        transform_type = "AffineTransform" if len(names) > 1 \
+            else transforms_sitk[0].GetName()
+
+        matrix = np.array([t.GetMatrix() for t in transforms_sitk])
+        translation = np.array(
+            [t.GetTranslation() if hasattr(t, "GetTranslation")
+             else np.zeros(dim) for t in transforms_sitk])
+
+        # Fixed parameters of different types may differ in length, e.g.
+        # Euler3DTransform additionally stores ComputeZYX
+        if len(names) > 1:
+            fixed_parameters = np.array(
+                [t.GetCenter() for t in transforms_sitk])
+        else:
+            fixed_parameters = np.array(
+                [t.GetFixedParameters() for t in transforms_sitk])
+
+        return cls(matrix.reshape(-1, dim, dim),
+                   translation=translation,
+                   fixed_parameters=fixed_parameters,
+                   transform_type=transform_type)
+
+    ##
+    # Create batch from homogeneous matrices.
+    # \date       2026-10-17 11:16:27+0100
+    #
+    # \param      cls             The cls
+    # \param      matrices        (N x dim+1 x dim+1)-numpy array
+    # \param      center          (N x dim)- or (dim,)-numpy array; zero if
+    #                             None
+    # \param      transform_type  name of sitk transform type
+    #
+    # \return     TransformBatch object
+    #
+    @classmethod
+    def from_homogeneous_matrices(cls,
+                                  matrices,
+                                  center=None,
+                                  transform_type="AffineTransform"):
+        matrices = np.array(matrices, dtype=np.float64, ndmin=3)
+        N = matrices.shape[0]
+        dim = matrices.shape[1] - 1
+
+        A = matrices[:, 0:dim, 0:dim]
+        offset = matrices[:, 0:dim, dim]
+
+        if center is None:
+            center = np.zeros((N, dim))
+        center = np.broadcast_to(
+            np.asarray(center, dtype=np.float64), (N, dim))
+
+        translation = offset - center + _matvec(A, center)
+
+        return cls(A,
+                   translation=translation,
+                   fixed_parameters=center,
+                   transform_type=transform_type)
+
+    ##
+    # Create batch from sitk parameter arrays.
+    #
+    # Supported are Euler2DTransform, Euler3DTransform and AffineTransform
+    # with the same parameter conventions as SimpleITK.
+    # \date       2026-10-17 13:05:12+0100
+    #
+    # \param      cls               The cls
+    # \param      parameters        (N x P)-numpy array as obtained via
+    #                               GetParameters
+    # \param      fixed_parameters  (N x F)-numpy array as obtained via
+    #                               GetFixedParameters
+    # \param      transform_type    name of sitk transform type
+    #
+    # \return     TransformBatch object
+    #
+    @classmethod
+    def from_parameters(cls, parameters, fixed_parameters, transform_type):
+        parameters = np.array(parameters, dtype=np.float64, ndmin=2)
+        fixed_parameters = np.array(
+            fixed_parameters, dtype=np.float64, ndmin=2)
+        N = parameters.shape[0]
+
+        if transform_type == "Euler2DTransform":
+            matrix = get_rotation_matrices_from_euler_angles(
+                parameters[:, 0])
+            translation = parameters[:, 1:3]
+
+        elif transform_type == "Euler3DTransform":
+            matrix = get_rotation_matrices_from_euler_angles(
+                parameters[:, 0:3],
+                compute_zyx=_get_compute_zyx(fixed_parameters))
+            translation = parameters[:, 3:6]
+
+        elif transform_type == "AffineTransform":
+            dim = 2 if parameters.shape[1] == 6 else 3
+            matrix = parameters[:, 0:dim * dim].reshape(N, dim, dim)
+            translation = parameters[:, dim * dim:]
+
+        else:
+            raise ValueError(
+                "Transform type '%s' not supported" % transform_type)
+
+        return cls(matrix,
+                   translation=translation,
+                   fixed_parameters=fixed_parameters,
+                   transform_type=transform_type)
+
+    def __len__(self):
+        return self._matrix.shape[0]
+
+    ##
+    # Access transforms of the batch.
+    # \date       2026-10-17 11:21:08+0100
+    #
+    # \param      self  The object
+    # \param      key   integer index or slice/index array
+    #
+    # \return     sitk transform for integer indices, TransformBatch otherwise
+    #
+    def __getitem__(self, key):
+        if isinstance(key, (int, np.integer)):
+            return self.get_sitk_transforms(indices=[key])[0]
+
+        return TransformBatch(self._matrix[key],
+                              translation=self._translation[key],
+                              fixed_parameters=self._fixed_parameters[key],
+                              transform_type=self._transform_type)
+
+    def get_transform_type(self):
+        return self._transform_type
+
+    def get_dimension(self):
+        return self._matrix.shape[1]
+
+    def get_matrix(self):
+        return self._matrix
+
+    def get_translation(self):
+        return self._translation
+
+    def get_center(self):
+        return self._fixed_parameters[:, 0:self.get_dimension()]
+
+    def get_fixed_parameters(self):
+        return self._fixed_parameters
+
+    ##
+    # Gets the sitk parameters of the transforms.
+    #
+    # Counterpart of from_parameters, i.e. supported are Euler2DTransform,
+    # Euler3DTransform and AffineTransform.
+    # \date       2026-10-17 13:12:40+0100
+    #
+    # \param      self  The object
+    #
+    # \return     (N x P)-numpy array as obtained via GetParameters
+    #
+    def get_parameters(self):
+        N = len(self)
+
+        if self._transform_type in ["Euler2DTransform", "Euler3DTransform"]:
+            angles = get_euler_angles_from_rotation_matrices(
+                self._matrix,
+                compute_zyx=_get_compute_zyx(self._fixed_parameters))
+            return np.concatenate(
+                (angles.reshape(N, -1), self._translation), axis=1)
+
+        if self._transform_type == "AffineTransform":
+            return np.concatenate(
+                (self._matrix.reshape(N, -1), self._translation), axis=1)
+
+        raise ValueError(
+            "Transform type '%s' not supported" % self._transform_type)
+
+    ##
+    # Gets the offsets t + c - Ac of the transforms.
+    # \date       2026-10-17 11:24:39+0100
+    #
+    # \param      self  The object
+    #
+    # \return     (N x dim)-numpy array
+    #
+    def get_offset(self):
+        center = self.get_center()
+        return self._translation + center - \
+            _matvec(self._matrix, center)
+
+    ##
+    # Gets the homogeneous matrices [[A, t + c - Ac], [0, 1]].
+    # \date       2026-10-17 11:26:02+0100
+    #
+    # \param      self  The object
+    #
+    # \return     (N x dim+1 x dim+1)-numpy array
+    #
+    def get_homogeneous_matrices(self):
+        N, dim = self._matrix.shape[0:2]
+        matrices = np.zeros((N, dim + 1, dim + 1))
+        matrices[:, 0:dim, 0:dim] = self._matrix
+        matrices[:, 0:dim, dim] = self.get_offset()
+        matrices[:, dim, dim] = 1
+
+        return matrices
+
+    ##
+    # Create sitk transforms of the batch.
+    # \date       2026-10-17 11:30:45+0100
+    #
+    # \param      self     The object
+    # \param      indices  indices of transforms to convert; all if None
+    #
+    # \return     list of sitk transforms
+    #
+    def get_sitk_transforms(self, indices=None):
+        if indices is None:
+            indices = range(len(self))
+
+        has_translation = \
+            self._transform_type not in TRANSLATION_FREE_TRANSFORM_TYPES
+
+        dim = self.get_dimension()
+        transforms_sitk = []
+        for i in indices:
+            transform_sitk = _new_sitk_transform(self._transform_type, dim)
+            transform_sitk.SetFixedParameters(self._fixed_parameters[i])
+            transform_sitk.SetMatrix(self._matrix[i].flatten())
+            if has_translation:
+                transform_sitk.SetTranslation(self._translation[i])
+            elif np.any(self._translation[i] != 0):
+                raise ValueError(
+                    "Transform type '%s' does not support a translation" %
+                    self._transform_type)
+            transforms_sitk.append(transform_sitk)
+
+        return transforms_sitk
+
+    ##
+    # Compose transforms of the batch with inner transforms, i.e. compute
+    # self o transforms_inner elementwise.
+    #
+    # Batches of length one are broadcast. Same conventions as for
+    # simple_itk_helper.get_composite_sitk_affine_transform apply, i.e. the
+    # center of the composite transform is the one of the inner transform.
+    # \date       2026-10-17 11:38:20+0100
+    #
+    # \param      self              The object
+    # \param      transforms_inner  TransformBatch object
+    #
+    # \return     TransformBatch object
+    #
+    def compose(self, transforms_inner):
+        A_outer = self._matrix
+        c_outer = self.get_center()
+        t_outer = self._translation
+
+        A_inner = transforms_inner.get_matrix()
+        c_inner = transforms_inner.get_center()
+        t_inner = transforms_inner.get_translation()
+
+        A = np.matmul(A_outer, A_inner)
+        t = _matvec(A_outer, t_inner + c_inner - c_outer) + \
+            t_outer + c_outer - c_inner
+
+        if self._transform_type == transforms_inner.get_transform_type() \
+                and self._transform_type != "AffineTransform" \
+                and self._transform_type not in \
+                TRANSLATION_FREE_TRANSFORM_TYPES:
+            transform_type = self._transform_type
+            fixed_parameters = transforms_inner.get_fixed_parameters()
+        else:
+            transform_type = "AffineTransform"
+            fixed_parameters = c_inner
+        fixed_parameters = np.broadcast_to(
+            fixed_parameters, (A.shape[0], fixed_parameters.shape[1]))
+
+        return TransformBatch(A,
+                              translation=t,
+                              fixed_parameters=fixed_parameters,
+                              transform_type=transform_type)
+
+    ##
+    # Gets the inverse transforms.
+    #
+    # The inverse keeps the center, i.e. T^{-1}(x) = A^{-1}(x - c) - A^{-1}t +
+    # c. Rotation matrices are inverted via transposition.
+    # \date       2026-10-17 11:45:33+0100
+    #
+    # \param      self  The object
+    #
+    # \return     TransformBatch object
+    #
+    def get_inverse(self):
+        if self._transform_type in RIGID_TRANSFORM_TYPES:
+            A_inv = np.swapaxes(self._matrix, 1, 2)
+        else:
+            A_inv = np.linalg.inv(self._matrix)
+
+        return TransformBatch(A_inv,
+                              translation=-_matvec(A_inv, self._translation),
+                              fixed_parameters=self._fixed_parameters,
+                              transform_type=self._transform_type)
+
+    ##
+    # Map points through all transforms of the batch.
+    # \date       2026-10-17 11:51:10+0100
+    #
+    # \param      self    The object
+    # \param      points  (M x dim)-numpy array of points to be mapped by each
+    #                     transform or (N x M x dim)-numpy array of points to
+    #                     be mapped by the respective transform
+    #
+    # \return     (N x M x dim)-numpy array
+    #
+    def transform_points(self, points):
+        points = np.asarray(points, dtype=np.float64)
+        offset = self.get_offset()[:, np.newaxis, :]
+
+        if points.ndim == 2:
+            return np.einsum("nij,mj->nmi", self._matrix, points) + offset
+
+        return np.einsum("nij,nmj->nmi", self._matrix, points) + offset
+
+
+##
+# Gets the rotation matrices from Euler angles following the ITK conventions.
+#
+# In 3D, R = R_z R_x R_y by default and R = R_z R_y R_x if compute_zyx.
+# \date       2026-10-17 13:20:03+0100
+#
+# \param      angles       (N,)-numpy array of angles (2D) or (N x 3)-numpy
+#                          array of angles about x, y and z (3D)
+# \param      compute_zyx  boolean or (N,)-boolean array (3D only)
+#
+# \return     (N x 2 x 2)- or (N x 3 x 3)-numpy array
+#
+def get_rotation_matrices_from_euler_angles(angles, compute_zyx=False):
+    angles = np.asarray(angles, dtype=np.float64)
+    cos = np.cos(angles)
+    sin = np.sin(angles)
+
+    if angles.ndim == 1:
+        matrices = np.empty((angles.shape[0], 2, 2))
+        matrices[:, 0, 0] = cos
+        matrices[:, 0, 1] = -sin
+        matrices[:, 1, 0] = sin
+        matrices[:, 1, 1] = cos
+        return matrices
+
+    N = angles.shape[0]
+    R = np.zeros((3, N, 3, 3))
+    for i, (j, k) in enumerate([(1, 2), (2, 0), (0, 1)]):
+        R[i, :, i, i] = 1
+        R[i, :, j, j] = cos[:, i]
+        R[i, :, k, k] = cos[:, i]
+        R[i, :, j, k] = -sin[:, i]
+        R[i, :, k, j] = sin[:, i]
+    R_x, R_y, R_z = R
+
+    compute_zyx = np.broadcast_to(compute_zyx, (N,))[:, np.newaxis, np.newaxis]
+    return np.where(compute_zyx,
+                    np.matmul(R_z, np.matmul(R_y, R_x)),
+                    np.matmul(R_z, np.matmul(R_x, R_y)))
+
+
+##
+# Gets the Euler angles from rotation matrices following the ITK conventions.
+#
+# Vectorized version of itk::Euler3DTransform::ComputeMatrixParameters (and
+# its 2D counterpart).
+# \date       2026-10-17 13:31:55+0100
+#
+# \param      matrices     (N x 2 x 2)- or (N x 3 x 3)-numpy array
+# \param      compute_zyx  boolean or (N,)-boolean array (3D only)
+#
+# \return     (N,)-numpy array of angles (2D) or (N x 3)-numpy array of
+#             angles about x, y and z (3D)
+#
+def get_euler_angles_from_rotation_matrices(matrices, compute_zyx=False):
+    m = np.asarray(matrices, dtype=np.float64)
+
+    if m.shape[1] == 2:
+        return np.arctan2(m[:, 1, 0], m[:, 0, 0])
+
+    compute_zyx = np.broadcast_to(
+        np.asarray(compute_zyx, dtype=bool), (m.shape[0],))
+    angles = np.zeros((m.shape[0], 3))
+
+    # Default: R = R_z R_x R_y
+    angle_x = np.arcsin(np.clip(m[:, 2, 1], -1, 1))
+    cos_x = np.cos(angle_x)
+    regular = np.abs(cos_x) > 0.00005
+    cos_x = np.where(regular, cos_x, 1)
+    angle_y = np.where(regular,
+                       np.arctan2(-m[:, 2, 0] / cos_x, m[:, 2, 2] / cos_x),
+                       np.arctan2(m[:, 1, 0], m[:, 0, 0]))
+    angle_z = np.where(regular,
+                       np.arctan2(-m[:, 0, 1] / cos_x, m[:, 1, 1] / cos_x),
+                       0)
+    angles[~compute_zyx] = np.stack(
+        (angle_x, angle_y, angle_z), axis=1)[~compute_zyx]
+
+    # ZYX: R = R_z R_y R_x
+    angle_y = -np.arcsin(np.clip(m[:, 2, 0], -1, 1))
+    cos_y = np.cos(angle_y)
+    regular = np.abs(cos_y) > 0.00005
+    cos_y = np.where(regular, cos_y, 1)
+    angle_x = np.where(regular,
+                       np.arctan2(m[:, 2, 1] / cos_y, m[:, 2, 2] / cos_y),
+                       0)
+    angle_z = np.where(regular,
+                       np.arctan2(m[:, 1, 0] / cos_y, m[:, 0, 0] / cos_y),
+                       np.arctan2(-m[:, 0, 1], m[:, 1, 1]))
+    angles[compute_zyx] = np.stack(
+        (angle_x, angle_y, angle_z), axis=1)[compute_zyx]
+
+    return angles
+
+
+##
+# Get sitk transform with access to GetMatrix etc. Generic sitk.Transform
+# objects, e.g. returned by sitk.ImageRegistrationMethod, do not provide those.
+# \date       2026-10-17 11:55:42+0100
+#
+# \param      transform_sitk  The transform sitk
+#
+# \return     sitk transform of specific type
+#
+def _get_downcast_sitk_transform(transform_sitk):
+    if hasattr(transform_sitk, "GetMatrix"):
+        return transform_sitk
+    return tr.get_transform_type_of_sitk(transform_sitk).get_sitk(
+        transform_sitk)
+
+
+##
+# Multiply stacked matrices with stacked vectors, broadcasting over the stack
+# \date       2026-10-17 11:57:02+0100
+#
+# \param      A     (N x m x n)-numpy array
+# \param      v     (N x n)-numpy array
+#
+# \return     (N x m)-numpy array
+#
+def _matvec(A, v):
+    return np.matmul(A, v[..., np.newaxis])[..., 0]
+
+
+##
+# Gets the ComputeZYX flags of Euler3DTransform fixed parameters, i.e. the
+# fourth fixed parameter if available.
+# \date       2026-10-17 13:40:21+0100
+#
+# \param      fixed_parameters  (N x F)-numpy array
+#
+# \return     (N,)-boolean numpy array
+#
+def _get_compute_zyx(fixed_parameters):
+    if fixed_parameters.shape[1] > 3:
+        return fixed_parameters[:, 3] != 0
+    return np.zeros(fixed_parameters.shape[0], dtype=bool)
+
+
+def _new_sitk_transform(transform_type, dim):
+    return tr.get_transform_type(transform_type, dim).new_sitk()
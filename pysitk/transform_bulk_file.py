@@ -0,0 +1,237 @@
+##
+# \file transform_bulk_file.py
+# \brief      Class to store many transforms in a single binary,
+#             memory-mappable file
+#
+# The file consists of a fixed-size header followed by fixed-size records,
+# one per transform. Each record holds a string key, the ITK transform type
+# (e.g. "Euler3DTransform_double_3_3"), the parameters and the fixed
+# parameters as little-endian float64 values, i.e. transforms are stored
+# losslessly. New records are simply appended; if a key is stored multiple
+# times the last record is used.
+#
+# \author     Michael Ebner (michael.ebner.14@ucl.ac.uk)
+# \date       October 2026
+#
+
+import os
+import numpy as np
+
+import pysitk.transform_registry as tr
+
+
+MAGIC = b"PYSITKTB"
+VERSION = 1
+
+HEADER_DTYPE = np.dtype([
+    ("magic", "S8"),
+    ("version", "<u4"),
+    ("key_length", "<u4"),
+    ("n_parameters", "<u4"),
+    ("n_fixed_parameters", "<u4"),
+    ("reserved", "<u4", (2,)),
+])
+
+TYPE_LENGTH = 48
+
+
+##
+# Single binary file holding many transforms accessible by string keys.
+# \date       2026-10-17 15:45:10+0100
+#
+class TransformBulkFile(object):
+
+    ##
+    # Open existing file or define the record layout of a new one.
+    # \date       2026-10-17 15:47:32+0100
+    #
+    # \param      self                The object
+    # \param      path_to_file        path to file
+    # \param      key_length          maximum number of bytes of (utf-8
+    #                                 encoded) keys; only used for new files
+    # \param      n_parameters        maximum number of parameters per
+    #                                 transform; only used for new files
+    # \param      n_fixed_parameters  maximum number of fixed parameters per
+    #                                 transform; only used for new files
+    #
+    def __init__(self,
+                 path_to_file,
+                 key_length=128,
+                 n_parameters=16,
+                 n_fixed_parameters=4):
+        self._path_to_file = path_to_file
+
+        if os.path.isfile(path_to_file):
+            header = np.fromfile(path_to_file, dtype=HEADER_DTYPE, count=1)
+            if len(header) == 0 or header["magic"][0] != MAGIC:
+                raise IOError(
+                    "'%s' is not a transform bulk file" % path_to_file)
+            if header["version"][0] != VERSION:
+                raise IOError(
+                    "Version %d of transform bulk file '%s' not supported" % (
+                        header["version"][0], path_to_file))
+            key_length = int(header["key_length"][0])
+            n_parameters = int(header["n_parameters"][0])
+            n_fixed_parameters = int(header["n_fixed_parameters"][0])
+
+        self._header = np.zeros(1, dtype=HEADER_DTYPE)
+        self._header["magic"] = MAGIC
+        self._header["version"] = VERSION
+        self._header["key_length"] = key_length
+        self._header["n_parameters"] = n_parameters
+        self._header["n_fixed_parameters"] = n_fixed_parameters
+
+        self._record_dtype = np.dtype([
+            ("key", "S%d" % key_length),
+            ("type", "S%d" % TYPE_LENGTH),
+            ("n_parameters", "<u4"),
+            ("n_fixed_parameters", "<u4"),
+            ("parameters", "<f8", (n_parameters,)),
+            ("fixed_parameters", "<f8", (n_fixed_parameters,)),
+        ])
+
+        self._records = None
+        self._indices = None
+
+    def get_path_to_file(self):
+        return self._path_to_file
+
+    def __len__(self):
+        return len(self._get_records())
+
+    def __contains__(self, key):
+        return self._encode_key(key) in self._get_indices()
+
+    ##
+    # Gets the keys in the order of first appearance
+    # \date       2026-10-17 15:52:08+0100
+    #
+    def keys(self):
+        keys = self._get_records()["key"]
+        _, indices = np.unique(keys, return_index=True)
+        return [keys[i].decode("utf-8") for i in np.sort(indices)]
+
+    ##
+    # Gets the stored information of the transform with given key
+    # \date       2026-10-17 15:54:36+0100
+    #
+    # \param      self  The object
+    # \param      key   string key
+    #
+    # \return     tuple of transform type (as used in ITK transform files),
+    #             parameters and fixed parameters (numpy arrays)
+    #
+    def get_parameters(self, key):
+        try:
+            index = self._get_indices()[self._encode_key(key)]
+        except KeyError:
+            raise KeyError("Transform '%s' not found in '%s'" % (
+                key, self._path_to_file))
+        record = self._get_records()[index]
+
+        return (record["type"].decode("utf-8"),
+                np.array(record["parameters"][0:record["n_parameters"]]),
+                np.array(record["fixed_parameters"][
+                    0:record["n_fixed_parameters"]]))
+
+    ##
+    # Gets the sitk transform with given key
+    # \date       2026-10-17 15:57:12+0100
+    #
+    # \param      self  The object
+    # \param      key   string key
+    #
+    # \return     sitk transform, e.g. sitk.Euler3DTransform
+    #
+    def get_transform_sitk(self, key):
+        file_type, parameters, fixed_parameters = self.get_parameters(key)
+
+        transform_sitk = tr.get_transform_type_from_file_type(
+            file_type).new_sitk()
+        transform_sitk.SetFixedParameters(fixed_parameters)
+        transform_sitk.SetParameters(parameters)
+
+        return transform_sitk
+
+    def __getitem__(self, key):
+        return self.get_transform_sitk(key)
+
+    ##
+    # Append transforms to file; the file is created if it does not exist.
+    # \date       2026-10-17 16:01:48+0100
+    #
+    # \param      self             The object
+    # \param      transforms_sitk  list of sitk transforms
+    # \param      keys             list of string keys
+    #
+    def append(self, transforms_sitk, keys):
+        if len(transforms_sitk) != len(keys):
+            raise ValueError("Number of transforms and keys must match")
+
+        records = np.zeros(len(keys), dtype=self._record_dtype)
+        n_parameters = self._record_dtype["parameters"].shape[0]
+        n_fixed_parameters = self._record_dtype["fixed_parameters"].shape[0]
+
+        for i, (transform_sitk, key) in enumerate(zip(transforms_sitk, keys)):
+            file_type = tr.get_transform_type_of_sitk(
+                transform_sitk).get_file_type()
+            parameters = transform_sitk.GetParameters()
+            fixed_parameters = transform_sitk.GetFixedParameters()
+
+            if len(parameters) > n_parameters \
+                    or len(fixed_parameters) > n_fixed_parameters:
+                raise ValueError(
+                    "Transform '%s' exceeds the number of parameters "
+                    "supported by '%s'" % (key, self._path_to_file))
+
+            records[i]["key"] = self._encode_key(key)
+            records[i]["type"] = file_type.encode("utf-8")
+            records[i]["n_parameters"] = len(parameters)
+            records[i]["n_fixed_parameters"] = len(fixed_parameters)
+            records[i]["parameters"][0:len(parameters)] = parameters
+            records[i]["fixed_parameters"][
+                0:len(fixed_parameters)] = fixed_parameters
+
+        directory = os.path.dirname(self._path_to_file)
+        if directory != "" and not os.path.isdir(directory):
+            os.makedirs(directory)
+
+        with open(self._path_to_file, "ab") as f:
+            if f.tell() == 0:
+                f.write(self._header.tobytes())
+            f.write(records.tobytes())
+
+        # Memory map and index need to be rebuilt
+        self._records = None
+        self._indices = None
+
+    def _encode_key(self, key):
+        key_encoded = key.encode("utf-8")
+        if len(key_encoded) > self._record_dtype["key"].itemsize:
+            raise ValueError("Key '%s' is too long" % key)
+        return key_encoded
+
+    def _get_records(self):
+        if self._records is None:
+            if not os.path.isfile(self._path_to_file):
+                return np.zeros(0, dtype=self._record_dtype)
+
+            # Ignore a potentially incomplete trailing record
+            size = os.path.getsize(self._path_to_file) - HEADER_DTYPE.itemsize
+            N = size // self._record_dtype.itemsize
+            if N == 0:
+                return np.zeros(0, dtype=self._record_dtype)
+
+            self._records = np.memmap(self._path_to_file,
+                                      dtype=self._record_dtype,
+                                      mode="r",
+                                      offset=HEADER_DTYPE.itemsize,
+                                      shape=(N,))
+        return self._records
+
+    def _get_indices(self):
+        if self._indices is None:
+            # Later records overwrite earlier ones with the same key
+            self._indices = dict(
+                (key, i) for i, key in enumerate(self._get_records()["key"]))
+        return self._indices
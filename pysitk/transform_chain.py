@@ -0,0 +1,249 @@
+##
+# \file transform_chain.py
+# \brief      Class to represent a composition of affine-type transforms that
+#             is only flattened when it is applied
+#
+# \author     Michael Ebner (michael.ebner.14@ucl.ac.uk)
+# \date       October 2026
+#
+
+import numpy as np
+
+from pysitk.transform_batch import TransformBatch
+from pysitk.transform_batch import TRANSLATION_FREE_TRANSFORM_TYPES
+
+
+##
+# Lazy composition T_0 o T_1 o ... o T_{L-1} of affine-type transforms.
+#
+# The operands are recorded and only canonicalized to a single affine
+# transform when the chain is applied. Homogeneous matrices of the operands
+# and the prefix products T_0 o ... o T_{i-1} and suffix products
+# T_i o ... o T_{L-1} are cached. Changing a single operand via set_transform
+# (or invalidate if a sitk transform was modified in place) only invalidates
+# the products containing it. Hence, if the same operand changes repeatedly,
+# e.g. in iterative reconstruction, the chain is recomposed in O(1) instead
+# of O(L).
+#
+# Same conventions as for simple_itk_helper.get_composite_sitk_affine_transform
+# apply, i.e. the center of the flattened transform is the one of the
+# innermost transform.
+# \date       2026-10-17 17:20:33+0100
+#
+class TransformChain(object):
+
+    ##
+    # Store operands of the chain
+    # \date       2026-10-17 17:22:10+0100
+    #
+    # \param      self        The object
+    # \param      transforms  list of affine-type sitk transforms or
+    #                         (dim+1 x dim+1)-numpy arrays, outermost first
+    #
+    def __init__(self, transforms):
+        if len(transforms) == 0:
+            raise ValueError("At least one transform is required")
+
+        self._transforms = list(transforms)
+        self.invalidate()
+
+    def __len__(self):
+        return len(self._transforms)
+
+    def __getitem__(self, index):
+        return self._transforms[index]
+
+    def get_transforms(self):
+        return list(self._transforms)
+
+    def get_dimension(self):
+        return self._get_operand(0)[0].shape[0] - 1
+
+    ##
+    # Replace an operand of the chain
+    # \date       2026-10-17 17:24:48+0100
+    #
+    # \param      self       The object
+    # \param      index      index of operand
+    # \param      transform  affine-type sitk transform or
+    #                        (dim+1 x dim+1)-numpy array
+    #
+    def set_transform(self, index, transform):
+        self._transforms[index] = transform
+        self.invalidate(index)
+
+    ##
+    # Append an innermost operand to the chain
+    # \date       2026-10-17 17:26:02+0100
+    #
+    # \param      self       The object
+    # \param      transform  affine-type sitk transform or
+    #                        (dim+1 x dim+1)-numpy array
+    #
+    def append(self, transform):
+        self._transforms.append(transform)
+        self._operands.append(None)
+        self._prefixes.append(None)
+        self._suffixes.append(None)
+        self.invalidate(len(self._transforms) - 1)
+
+    ##
+    # Invalidate cached information, e.g. after an operand (sitk transform)
+    # has been modified in place.
+    # \date       2026-10-17 17:28:15+0100
+    #
+    # \param      self   The object
+    # \param      index  index of modified operand; all operands if None
+    #
+    def invalidate(self, index=None):
+        L = len(self._transforms)
+        self._matrix = None
+
+        if index is None:
+            self._operands = [None] * L
+            self._prefixes = [None] * (L + 1)
+            self._suffixes = [None] * (L + 1)
+            self._index_changed = 0
+            return
+
+        if index < 0:
+            index += L
+        self._operands[index] = None
+        for i in range(index + 1, L + 1):
+            self._prefixes[i] = None
+        for i in range(0, index + 1):
+            self._suffixes[i] = None
+        self._index_changed = index
+
+    ##
+    # Gets the homogeneous matrix of the flattened chain.
+    # \date       2026-10-17 17:31:40+0100
+    #
+    # \param      self  The object
+    #
+    # \return     (dim+1 x dim+1)-numpy array
+    #
+    def get_matrix(self):
+        if self._matrix is None:
+            i = self._index_changed
+            self._matrix = self._get_prefix(i).dot(
+                self._get_operand(i)[0]).dot(self._get_suffix(i + 1))
+
+        return np.array(self._matrix)
+
+    ##
+    # Gets the flattened chain as single sitk transform.
+    #
+    # If all operands are sitk transforms of the same type, the transform is
+    # of this type. Otherwise, or if the type has no translation parameters
+    # (e.g. VersorTransform) but the flattened chain has a translation, a
+    # sitk.AffineTransform is returned.
+    # \date       2026-10-17 17:34:22+0100
+    #
+    # \param      self  The object
+    #
+    # \return     sitk transform
+    #
+    def get_sitk_transform(self):
+        matrix = self.get_matrix()
+        dim = matrix.shape[0] - 1
+
+        names = set([self._get_operand(i)[1] for i in range(len(self))])
+        transform_type = names.pop() if len(names) == 1 else "AffineTransform"
+
+        fixed_parameters = self._get_operand(-1)[2]
+        A = matrix[0:dim, 0:dim]
+        center = fixed_parameters[0:dim]
+        translation = matrix[0:dim, dim] - center + A.dot(center)
+
+        # Rotations about different centers result in a translation
+        if transform_type in TRANSLATION_FREE_TRANSFORM_TYPES:
+            if np.allclose(translation, 0):
+                translation = np.zeros(dim)
+            else:
+                transform_type = "AffineTransform"
+
+        if transform_type == "AffineTransform":
+            fixed_parameters = fixed_parameters[0:dim]
+
+        transform_batch = TransformBatch(A,
+                                         translation=translation,
+                                         fixed_parameters=fixed_parameters,
+                                         transform_type=transform_type)
+        return transform_batch.get_sitk_transforms()[0]
+
+    ##
+    # Map points through the flattened chain
+    # \date       2026-10-17 17:37:51+0100
+    #
+    # \param      self    The object
+    # \param      points  (N x dim)-numpy array or single point of length dim
+    #
+    # \return     (N x dim)-numpy array (or point of length dim)
+    #
+    def transform_points(self, points):
+        matrix = self.get_matrix()
+        dim = matrix.shape[0] - 1
+
+        return np.asarray(points, dtype=np.float64).dot(
+            matrix[0:dim, 0:dim].T) + matrix[0:dim, dim]
+
+    ##
+    # Gets the cached information of an operand.
+    # \date       2026-10-17 17:40:05+0100
+    #
+    # \param      self   The object
+    # \param      index  index of operand
+    #
+    # \return     tuple of homogeneous matrix, sitk transform type and fixed
+    #             parameters
+    #
+    def _get_operand(self, index):
+        if self._operands[index] is None:
+            transform = self._transforms[index]
+
+            if isinstance(transform, np.ndarray):
+                dim = transform.shape[0] - 1
+                self._operands[index] = (
+                    np.array(transform, dtype=np.float64),
+                    "AffineTransform",
+                    np.zeros(dim))
+            else:
+                transform_batch = TransformBatch.from_sitk([transform])
+                self._operands[index] = (
+                    transform_batch.get_homogeneous_matrices()[0],
+                    transform_batch.get_transform_type(),
+                    transform_batch.get_fixed_parameters()[0])
+
+        return self._operands[index]
+
+    # Product T_0 o ... o T_{index-1}
+    def _get_prefix(self, index):
+        if self._prefixes[0] is None:
+            self._prefixes[0] = np.eye(self.get_dimension() + 1)
+
+        # Extend the last valid product
+        i = index
+        while self._prefixes[i] is None:
+            i -= 1
+        for i in range(i, index):
+            self._prefixes[i + 1] = self._prefixes[i].dot(
+                self._get_operand(i)[0])
+
+        return self._prefixes[index]
+
+    # Product T_index o ... o T_{L-1}
+    def _get_suffix(self, index):
+        L = len(self._transforms)
+        if self._suffixes[L] is None:
+            self._suffixes[L] = np.eye(self.get_dimension() + 1)
+
+        # Extend the first valid product
+        i = index
+        while self._suffixes[i] is None:
+            i += 1
+        for i in range(i, index, -1):
+            self._suffixes[i - 1] = self._get_operand(i - 1)[0].dot(
+                self._suffixes[i])
+
+        return self._suffixes[index]
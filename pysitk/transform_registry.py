@@ -0,0 +1,267 @@
+##
+# \file transform_registry.py
+# \brief      Registry of supported transform types mapping class name,
+#             dimension and precision to SimpleITK and ITK constructors
+#
+# Use the registry instead of building type names as strings and evaluating
+# them, e.g.
+#   get_transform_type("Euler3DTransform", 3).new_sitk()
+# instead of
+#   eval("sitk.Euler3DTransform()")
+#
+# \author     Michael Ebner (michael.ebner.14@ucl.ac.uk)
+# \date       October 2026
+#
+
+import itk
+import SimpleITK as sitk
+
+
+##
+# Description of a single transform type.
+#
+# SimpleITK constructors are resolved when the registry is built at import.
+# Since accessing ITK transform classes triggers the (slow) lazy loading of
+# ITK modules, the ITK class is resolved on first use only and memoized.
+# \date       2026-10-17 14:05:32+0100
+#
+class TransformType(object):
+
+    __slots__ = [
+        "name",
+        "dimension",
+        "precision",
+        "_sitk_class",
+        "_sitk_args",
+        "_itk_name",
+        "_itk_args",
+        "_itk_class",
+    ]
+
+    ##
+    # Store transform type information
+    # \date       2026-10-17 14:07:18+0100
+    #
+    # \param      self        The object
+    # \param      name        ITK class name, e.g. "Euler3DTransform"
+    # \param      dimension   dimension of transform
+    # \param      precision   "double" or "float"
+    # \param      sitk_class  SimpleITK class, e.g. sitk.Euler3DTransform
+    # \param      sitk_args   arguments to create a default sitk instance
+    # \param      itk_args    template arguments of ITK class besides the
+    #                         precision
+    #
+    def __init__(self,
+                 name,
+                 dimension,
+                 precision,
+                 sitk_class,
+                 sitk_args=(),
+                 itk_args=()):
+        self.name = name
+        self.dimension = dimension
+        self.precision = precision
+        self._sitk_class = sitk_class
+        self._sitk_args = sitk_args
+        self._itk_name = name
+        self._itk_args = itk_args
+        self._itk_class = None
+
+    ##
+    # Gets the type string as used in ITK transform files, e.g.
+    # "Euler3DTransform_double_3_3"
+    # \date       2026-10-17 14:09:50+0100
+    #
+    def get_file_type(self):
+        return "%s_%s_%d_%d" % (
+            self.name, self.precision, self.dimension, self.dimension)
+
+    ##
+    # Create new sitk transform of this type initialized as identity
+    # \date       2026-10-17 14:10:27+0100
+    #
+    def new_sitk(self):
+        return self._sitk_class(*self._sitk_args)
+
+    ##
+    # Get sitk transform of this type from a (generic) sitk transform, i.e.
+    # copy or downcast it.
+    # \date       2026-10-17 14:11:42+0100
+    #
+    # \param      self            The object
+    # \param      transform_sitk  sitk transform
+    #
+    def get_sitk(self, transform_sitk):
+        if self.name != "MatrixOffsetTransformBase":
+            return self._sitk_class(transform_sitk)
+
+        # MatrixOffsetTransformBase is represented by AffineTransform
+        transform_sitk_ = self.new_sitk()
+        transform_sitk_.SetParameters(transform_sitk.GetParameters())
+        transform_sitk_.SetFixedParameters(transform_sitk.GetFixedParameters())
+        return transform_sitk_
+
+    ##
+    # Gets the ITK class of this type, e.g. itk.Euler3DTransform[itk.D]
+    # \date       2026-10-17 14:13:04+0100
+    #
+    def get_itk_class(self):
+        if self._itk_class is None:
+            pixel_type = itk.F if self.precision == "float" else itk.D
+            try:
+                self._itk_class = getattr(itk, self._itk_name)[
+                    (pixel_type,) + self._itk_args]
+            except (AttributeError, KeyError, TypeError):
+                raise ValueError(
+                    "Transform type '%s' not wrapped by ITK" %
+                    self.get_file_type())
+        return self._itk_class
+
+    ##
+    # Create new itk transform of this type initialized as identity
+    # \date       2026-10-17 14:14:36+0100
+    #
+    def new_itk(self):
+        return self.get_itk_class().New()
+
+
+##
+# Build the registry of all supported transform types
+# \date       2026-10-17 14:18:23+0100
+#
+# \return     dictionary with (name, dimension, precision) keys and
+#             TransformType values
+#
+def _build_transform_types():
+    # (name, dimension, sitk class, default sitk args, itk template args)
+    specifications = [
+        ("Euler2DTransform", 2, sitk.Euler2DTransform, (), ()),
+        ("Euler3DTransform", 3, sitk.Euler3DTransform, (), ()),
+        ("Similarity2DTransform", 2, sitk.Similarity2DTransform, (), ()),
+        ("Similarity3DTransform", 3, sitk.Similarity3DTransform, (), ()),
+        ("VersorTransform", 3, sitk.VersorTransform, (), ()),
+        ("VersorRigid3DTransform", 3, sitk.VersorRigid3DTransform, (), ()),
+        ("ScaleVersor3DTransform", 3, sitk.ScaleVersor3DTransform, (), ()),
+        ("ScaleSkewVersor3DTransform", 3,
+         sitk.ScaleSkewVersor3DTransform, (), ()),
+    ]
+    for dim in [2, 3]:
+        specifications.extend([
+            ("AffineTransform", dim, sitk.AffineTransform, (dim,), (dim,)),
+            # SimpleITK has no MatrixOffsetTransformBase; it is represented
+            # by the equivalent AffineTransform
+            ("MatrixOffsetTransformBase", dim,
+             sitk.AffineTransform, (dim,), (dim, dim)),
+            ("TranslationTransform", dim,
+             sitk.TranslationTransform, (dim,), (dim,)),
+            ("ScaleTransform", dim, sitk.ScaleTransform, (dim,), (dim,)),
+            ("BSplineTransform", dim, sitk.BSplineTransform, (dim,), (dim, 3)),
+            ("DisplacementFieldTransform", dim,
+             sitk.DisplacementFieldTransform, (dim,), (dim,)),
+            ("CompositeTransform", dim,
+             sitk.CompositeTransform, (dim,), (dim,)),
+        ])
+
+    transform_types = {}
+    for name, dim, sitk_class, sitk_args, itk_args in specifications:
+        for precision in ["double", "float"]:
+            transform_types[(name, dim, precision)] = TransformType(
+                name, dim, precision, sitk_class, sitk_args, itk_args)
+
+    return transform_types
+
+
+TRANSFORM_TYPES = _build_transform_types()
+
+# Transform types which are fully described by matrix, center and
+# translation, i.e. expose GetMatrix, GetCenter and GetTranslation in sitk
+AFFINE_TRANSFORM_NAMES = [
+    "Euler2DTransform",
+    "Euler3DTransform",
+    "Similarity2DTransform",
+    "Similarity3DTransform",
+    "VersorTransform",
+    "VersorRigid3DTransform",
+    "ScaleVersor3DTransform",
+    "ScaleSkewVersor3DTransform",
+    "AffineTransform",
+    "MatrixOffsetTransformBase",
+]
+
+
+##
+# Gets the registered transform type.
+# \date       2026-10-17 14:23:50+0100
+#
+# \param      name       ITK class name, e.g. "Euler3DTransform"
+# \param      dimension  dimension of transform
+# \param      precision  "double" or "float"
+#
+# \return     TransformType object
+#
+def get_transform_type(name, dimension, precision="double"):
+    try:
+        return TRANSFORM_TYPES[(name, dimension, precision)]
+    except KeyError:
+        raise ValueError(
+            "Transform type '%s' (dimension %s, %s) not supported" % (
+                name, dimension, precision))
+
+
+##
+# Gets the registered transform type of a sitk transform.
+# \date       2026-10-17 14:25:12+0100
+#
+# \param      transform_sitk  sitk transform
+#
+# \return     TransformType object
+#
+def get_transform_type_of_sitk(transform_sitk):
+    name = transform_sitk.GetName()
+
+    # Generic sitk.Transform objects report their actual type only after
+    # downcasting in SimpleITK >= 2.0
+    if name == "Transform" and hasattr(transform_sitk, "Downcast"):
+        name = transform_sitk.Downcast().GetName()
+
+    return get_transform_type(name, transform_sitk.GetDimension())
+
+
+##
+# Gets the registered transform type of an itk transform.
+# \date       2026-10-17 14:26:40+0100
+#
+# \param      transform_itk  itk transform
+#
+# \return     TransformType object
+#
+def get_transform_type_of_itk(transform_itk):
+    try:
+        pixel_type = itk.template(transform_itk)[1][0]
+    except (KeyError, IndexError, TypeError):
+        pixel_type = itk.D
+    precision = "float" if pixel_type == itk.F else "double"
+
+    return get_transform_type(
+        transform_itk.GetNameOfClass(),
+        transform_itk.GetInputSpaceDimension(),
+        precision)
+
+
+##
+# Gets the registered transform type from the type string used in ITK
+# transform files.
+# \date       2026-10-17 14:28:55+0100
+#
+# \param      file_type  type string, e.g. "Euler3DTransform_double_3_3"
+#
+# \return     TransformType object
+#
+def get_transform_type_from_file_type(file_type):
+    try:
+        name, precision, dim_in, dim_out = file_type.strip().rsplit("_", 3)
+        dimension = int(dim_in)
+    except ValueError:
+        raise ValueError("Transform type '%s' not supported" % file_type)
+
+    return get_transform_type(name, dimension, precision)
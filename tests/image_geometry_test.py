@@ -0,0 +1,78 @@
+# \file image_geometry_test.py
+#  \brief  Class containing unit tests for module ImageGeometry
+#
+#  \author Michael Ebner (michael.ebner.14@ucl.ac.uk)
+#  \date October 2026
+
+
+# Import libraries
+import SimpleITK as sitk
+import numpy as np
+import unittest
+import os
+
+# Import modules
+import pysitk.simple_itk_helper as sitkh
+from pysitk.image_geometry import ImageGeometry
+
+from pysitk.definitions import DIR_TEST
+
+
+class ImageGeometryTest(unittest.TestCase):
+
+    def setUp(self):
+        self.accuracy = 8
+        self.image_sitk = sitk.ReadImage(os.path.join(
+            DIR_TEST, "BrainWeb", "t1_icbm_normal_5mm_pn0_rf0.nii.gz"))
+        self.image_sitk = sitkh.get_transformed_sitk_image(
+            self.image_sitk,
+            sitk.Euler3DTransform((0, 0, 0), 0.3, -0.2, 0.5, (10, -4, 3)))
+
+    def test_hash_and_equality(self):
+        geometry = ImageGeometry.from_sitk(self.image_sitk)
+        geometry_2 = sitkh.get_image_geometry(sitk.Image(self.image_sitk))
+
+        self.assertEqual(geometry, geometry_2)
+        self.assertEqual(hash(geometry), hash(geometry_2))
+        self.assertIs(sitkh.get_image_geometry(geometry), geometry)
+
+        cache = {geometry: 1}
+        self.assertEqual(cache[geometry_2], 1)
+
+        image_sitk = sitk.Image(self.image_sitk)
+        image_sitk.SetOrigin((1, 2, 3))
+        self.assertNotEqual(geometry, ImageGeometry.from_sitk(image_sitk))
+        self.assertFalse(ImageGeometry.from_sitk(image_sitk) in cache)
+
+        self.assertRaises(ValueError, geometry.get_affine().fill, 0)
+
+    def test_geometry_helpers(self):
+        geometry = ImageGeometry.from_sitk(self.image_sitk)
+
+        self.assertEqual(geometry.GetSize(), self.image_sitk.GetSize())
+        self.assertEqual(geometry.GetDimension(),
+                         self.image_sitk.GetDimension())
+
+        for image in [self.image_sitk, geometry]:
+            np.testing.assert_array_almost_equal(
+                sitkh.get_sitk_affine_matrix_from_sitk_image(image),
+                np.array(self.image_sitk.GetDirection()).reshape(3, 3).dot(
+                    np.diag(self.image_sitk.GetSpacing())).flatten(),
+                decimal=self.accuracy)
+
+            transform_sitk = sitkh.get_sitk_affine_transform_from_sitk_image(
+                image)
+            indices = [(0, 0, 0), (1, 2, 3), (5, 3, 1)]
+            points = sitkh.transform_indices_to_physical_points_sitk(
+                indices, image)
+            for index, point in zip(indices, points):
+                np.testing.assert_array_almost_equal(
+                    self.image_sitk.TransformIndexToPhysicalPoint(index),
+                    point, decimal=self.accuracy)
+                np.testing.assert_array_almost_equal(
+                    transform_sitk.TransformPoint(index),
+                    point, decimal=self.accuracy)
+
+            np.testing.assert_array_almost_equal(
+                sitkh.transform_physical_points_to_indices_sitk(
+                    points, image), indices, decimal=self.accuracy)
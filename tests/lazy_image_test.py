@@ -0,0 +1,120 @@
+# \file lazy_image_test.py
+#  \brief  Class containing unit tests for module LazyImage
+#
+#  \author Michael Ebner (michael.ebner.14@ucl.ac.uk)
+#  \date October 2026
+
+
+# Import libraries
+import SimpleITK as sitk
+import numpy as np
+import unittest
+import os
+
+# Import modules
+import pysitk.simple_itk_helper as sitkh
+from pysitk.lazy_image import LazyImage
+from pysitk.lru_cache import LRUCache
+
+from pysitk.definitions import DIR_TEST, DIR_TMP
+
+
+class LazyImageTest(unittest.TestCase):
+
+    def setUp(self):
+        self.accuracy = 8
+        self.path_to_file = os.path.join(
+            DIR_TEST, "BrainWeb", "t1_icbm_normal_5mm_pn0_rf0.nii.gz")
+        self.image_sitk = sitk.ReadImage(self.path_to_file)
+
+    def test_header(self):
+        image = LazyImage(self.path_to_file)
+
+        self.assertFalse(image.is_loaded())
+        self.assertEqual(image.GetSize(), self.image_sitk.GetSize())
+        self.assertEqual(image.GetPixelID(), self.image_sitk.GetPixelID())
+        self.assertEqual(image.GetNumberOfComponentsPerPixel(), 1)
+        self.assertEqual(image.GetMetaData("qform_code"),
+                         self.image_sitk.GetMetaData("qform_code"))
+        self.assertTrue(sitkh.same_physical_space(image, self.image_sitk))
+
+        # Geometry helpers accept proxies
+        self.assertEqual(sitkh.get_image_geometry(image),
+                         sitkh.get_image_geometry(self.image_sitk))
+        np.testing.assert_array_almost_equal(
+            sitkh.transform_indices_to_physical_points_sitk(
+                [(1, 2, 3)], image)[0],
+            self.image_sitk.TransformIndexToPhysicalPoint((1, 2, 3)),
+            decimal=self.accuracy)
+        np.testing.assert_array_almost_equal(
+            sitkh.get_physical_corners_sitk(image),
+            sitkh.get_physical_corners_sitk(self.image_sitk),
+            decimal=self.accuracy)
+        self.assertFalse(image.is_loaded())
+
+        # Pixel type conversion
+        image = LazyImage(self.path_to_file, pixel_type=sitk.sitkUInt8)
+        self.assertEqual(image.GetPixelID(), sitk.sitkUInt8)
+        self.assertEqual(image.get_sitk().GetPixelID(), sitk.sitkUInt8)
+
+    def test_get_sitk(self):
+        image = LazyImage(self.path_to_file)
+        image_sitk = image.get_sitk()
+        self.assertTrue(image.is_loaded())
+        self.assertEqual(np.round(np.linalg.norm(
+            sitk.GetArrayFromImage(image_sitk) -
+            sitk.GetArrayFromImage(self.image_sitk)),
+            decimals=self.accuracy), 0)
+
+        # Header changes of returned images do not alter the proxy
+        image_sitk.SetOrigin((0, 0, 0))
+        self.assertEqual(image.get_sitk().GetOrigin(),
+                         self.image_sitk.GetOrigin())
+
+        image.unload()
+        self.assertFalse(image.is_loaded())
+
+        # Images are read by resampling threads
+        image_resampled_sitk = sitkh.resample_images_to_reference(
+            [LazyImage(self.path_to_file)], image)[0]
+        self.assertEqual(np.round(np.linalg.norm(
+            sitk.GetArrayFromImage(image_resampled_sitk) -
+            sitk.GetArrayFromImage(self.image_sitk)),
+            decimals=self.accuracy), 0)
+
+    def test_cache(self):
+        nbytes = sitk.GetArrayViewFromImage(self.image_sitk).nbytes
+        cache = LRUCache(max_bytes=nbytes)
+
+        image = LazyImage(self.path_to_file, cache=cache)
+        image_2 = LazyImage(self.path_to_file,
+                            pixel_type=sitk.sitkFloat64,
+                            cache=cache)
+
+        image.get_sitk()
+        self.assertTrue(image.is_loaded())
+        self.assertEqual(len(cache), 1)
+
+        # Float64 image does not fit into cache
+        image_2.get_sitk()
+        self.assertFalse(image_2.is_loaded())
+        self.assertTrue(image.is_loaded())
+
+        # Rewritten files must not be served from the cache, even if size
+        # and modification time (in seconds) are unchanged
+        path_to_file = os.path.join(DIR_TMP, "lazy_image_test.nii")
+        sitk.WriteImage(self.image_sitk, path_to_file)
+        image = LazyImage(path_to_file, cache=cache)
+        image.get_sitk()
+
+        stat = os.stat(path_to_file)
+        sitk.WriteImage(self.image_sitk + 1, path_to_file)
+        os.utime(path_to_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+        self.assertEqual(os.stat(path_to_file).st_size, stat.st_size)
+
+        image = LazyImage(path_to_file, cache=cache)
+        self.assertFalse(image.is_loaded())
+        self.assertEqual(np.linalg.norm(
+            sitk.GetArrayFromImage(image.get_sitk()) -
+            sitk.GetArrayFromImage(self.image_sitk + 1)), 0)
+        os.remove(path_to_file)
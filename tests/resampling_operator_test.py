@@ -0,0 +1,105 @@
+# \file resampling_operator_test.py
+#  \brief  Class containing unit tests for module ResamplingOperator
+#
+#  \author Michael Ebner (michael.ebner.14@ucl.ac.uk)
+#  \date October 2026
+
+
+# Import libraries
+import SimpleITK as sitk
+import numpy as np
+import unittest
+import os
+
+# Import modules
+import pysitk.simple_itk_helper as sitkh
+import pysitk.resampling_operator as ro
+from pysitk.resampling_operator import ResamplingOperator
+from pysitk.transform_chain import TransformChain
+
+from pysitk.definitions import DIR_TEST
+
+
+class ResamplingOperatorTest(unittest.TestCase):
+
+    def setUp(self):
+        self.accuracy = 6
+        np.random.seed(1)
+        self.image_sitk = sitk.Cast(sitk.ReadImage(os.path.join(
+            DIR_TEST, "BrainWeb", "t1_icbm_normal_5mm_pn0_rf0.nii.gz")),
+            sitk.sitkFloat64)[::3, ::3, :]
+        self.image_ref_sitk = sitkh.get_reference_grid_sitk(
+            self.image_sitk, spacing=(2.3, 1.7, 4.), direction=np.eye(3))
+        self.transform_sitk = sitk.Euler3DTransform(
+            (0, 0, 0), 0.1, -0.05, 0.2, (3, -4, 5))
+
+    def test_apply(self):
+        for interpolator in ["NearestNeighbor", "Linear", "BSpline"]:
+            operator = ResamplingOperator(
+                self.image_sitk, self.image_ref_sitk, self.transform_sitk,
+                interpolator)
+            image_resampled_sitk = sitk.Resample(
+                self.image_sitk, self.image_ref_sitk, self.transform_sitk,
+                getattr(sitk, "sitk" + interpolator), 0.0, sitk.sitkFloat64)
+
+            image_operator_sitk = operator.apply(self.image_sitk)
+            self.assertEqual(image_operator_sitk.GetSize(),
+                             self.image_ref_sitk.GetSize())
+            self.assertEqual(np.round(np.linalg.norm(
+                sitk.GetArrayFromImage(image_operator_sitk) -
+                sitk.GetArrayFromImage(image_resampled_sitk)),
+                decimals=self.accuracy), 0)
+
+            # Adjoint: <A x, y> = <x, A^T y>
+            x = np.random.rand(*self.image_sitk.GetSize()[::-1])
+            y = np.random.rand(*self.image_ref_sitk.GetSize()[::-1])
+            self.assertAlmostEqual(
+                np.sum(operator.apply(x) * y),
+                np.sum(x * operator.apply_adjoint(y)),
+                places=self.accuracy)
+
+    def test_vector_image_2d(self):
+        image_sitk = self.image_sitk[:, :, 5]
+        image_ref_sitk = sitkh.get_reference_grid_sitk(image_sitk, spacing=2)
+        transform_sitk = sitk.Euler2DTransform((0, 0), 0.2, (1, 2))
+
+        image_vector_sitk = sitk.Compose(image_sitk, image_sitk * 2)
+        image_resampled_sitk = sitk.Resample(
+            image_vector_sitk, image_ref_sitk, transform_sitk)
+
+        operator = ResamplingOperator(
+            image_sitk, image_ref_sitk, transform_sitk)
+        image_operator_sitk = operator.apply(image_vector_sitk)
+        self.assertEqual(image_operator_sitk.GetNumberOfComponentsPerPixel(),
+                         2)
+        self.assertEqual(np.round(np.linalg.norm(
+            sitk.GetArrayFromImage(image_operator_sitk) -
+            sitk.GetArrayFromImage(image_resampled_sitk)),
+            decimals=self.accuracy), 0)
+
+        self.assertRaises(ValueError, operator.apply, image_ref_sitk)
+
+    def test_cache(self):
+        ro.RESAMPLING_OPERATOR_CACHE.clear()
+
+        operator = ResamplingOperator.get_cached(
+            self.image_sitk, self.image_ref_sitk, self.transform_sitk)
+        operator_2 = ResamplingOperator.get_cached(
+            sitkh.get_image_geometry(self.image_sitk),
+            self.image_ref_sitk,
+            TransformChain([self.transform_sitk]))
+        self.assertIs(operator, operator_2)
+
+        transform_sitk = sitk.Euler3DTransform(self.transform_sitk)
+        transform_sitk.SetTranslation((0, 0, 0))
+        operator_3 = ResamplingOperator.get_cached(
+            self.image_sitk, self.image_ref_sitk, transform_sitk)
+        self.assertIsNot(operator, operator_3)
+
+        # Eviction by memory size
+        ro.RESAMPLING_OPERATOR_CACHE.set_max_bytes(
+            operator_3.get_nbytes() + 1)
+        self.assertEqual(len(ro.RESAMPLING_OPERATOR_CACHE), 1)
+        self.assertIs(operator_3, ResamplingOperator.get_cached(
+            self.image_sitk, self.image_ref_sitk, transform_sitk))
+        ro.RESAMPLING_OPERATOR_CACHE.set_max_bytes(2 * 1024 ** 3)
@@ -16,6 +16,12 @@ import os
 
 # Import modules for unit testing
 from simple_itk_helper_test import *
+from transform_batch_test import *
+from transform_bulk_file_test import *
+from transform_chain_test import *
+from image_geometry_test import *
+from resampling_operator_test import *
+from lazy_image_test import *
 
 if __name__ == '__main__':
 
@@ -9,12 +9,15 @@
 import SimpleITK as sitk
 import itk
 import numpy as np
+import nibabel as nib
 import unittest
 import os
 import sys
 
 # Import modules
 import pysitk.simple_itk_helper as sitkh
+from pysitk.transform_batch import TransformBatch
+from pysitk.transform_chain import TransformChain
 
 from pysitk.definitions import DIR_TEST, DIR_TMP
 
@@ -193,6 +196,149 @@ class SimpleItkHelperTest(unittest.TestCase):
         error = np.linalg.norm(nda)
         self.assertAlmostEqual(error, 0, places=self.accuracy)
 
+    def test_write_nifti_image_header(self):
+        image_sitk = sitkh.get_transformed_sitk_image(
+            self.image_sitk,
+            sitk.Euler3DTransform((0, 0, 0), 0.3, -0.2, 0.5, (10, -4, 3)))
+        path_to_file = os.path.join(DIR_TMP, "foo.nii.gz")
+
+        for image in [image_sitk,
+                      self.image_sitk[:, :, 3],
+                      image_sitk[:, :, 3:4],
+                      sitk.Compose(image_sitk, image_sitk)]:
+            sitkh.write_nifti_image_sitk(
+                image, path_to_file, header_update={"descrip": "foo"})
+
+            header = nib.load(path_to_file).header
+            self.assertEqual(header["descrip"], b"foo")
+            self.assertEqual(header["qform_code"], 1)
+            self.assertEqual(header["sform_code"], 1)
+            np.testing.assert_array_almost_equal(
+                header.get_qform(), header.get_sform(), decimal=4)
+
+            image_2_sitk = sitk.ReadImage(path_to_file)
+            self.assertTrue(sitkh.same_physical_space(
+                image, image_2_sitk, tol=1e-5))
+            self.assertEqual(np.round(np.linalg.norm(
+                sitk.GetArrayFromImage(image) -
+                sitk.GetArrayFromImage(image_2_sitk)),
+                decimals=self.accuracy), 0)
+
+        # Only s-form given
+        image_nib = nib.Nifti1Image(
+            np.zeros((3, 4, 5), dtype=np.float32), np.diag([2., 3., 4., 1.]))
+        sitkh.write_nifti_image_nib(image_nib, path_to_file)
+        header = nib.load(path_to_file).header
+        self.assertEqual(header["qform_code"], header["sform_code"])
+        np.testing.assert_array_almost_equal(
+            header.get_qform(), np.diag([2., 3., 4., 1.]))
+
+        sitkh.apply_header_update(path_to_file, header_update={"descrip": "x"})
+        self.assertEqual(nib.load(path_to_file).header["descrip"], b"x")
+
+    def test_nib_sitk_conversion(self):
+        image_sitk = sitkh.get_transformed_sitk_image(
+            self.image_sitk,
+            sitk.Euler3DTransform((0, 0, 0), 0.3, -0.2, 0.5, (10, -4, 3)))
+        path_to_file = os.path.join(DIR_TMP, "foo.nii.gz")
+
+        for image in [image_sitk,
+                      self.image_sitk[:, :, 3],
+                      sitk.Compose(image_sitk, image_sitk * 2),
+                      sitk.JoinSeries([image_sitk, image_sitk * 2], 0, 2.5)]:
+            image_nib = sitkh.get_nib_from_sitk_image(image)
+
+            # Data array of NIfTI image is a view of the sitk data array
+            self.assertTrue(np.shares_memory(
+                np.asanyarray(image_nib.dataobj),
+                sitk.GetArrayViewFromImage(image)))
+
+            nib.save(image_nib, path_to_file)
+            for image_2_sitk in [
+                    sitkh.get_sitk_from_nib_image(image_nib),
+                    sitkh.get_sitk_from_nib_image(nib.load(path_to_file)),
+                    sitk.ReadImage(path_to_file)]:
+                self.assertEqual(image_2_sitk.GetPixelID(),
+                                 image.GetPixelID())
+                self.assertTrue(sitkh.same_physical_space(
+                    image, image_2_sitk, tol=1e-5))
+                self.assertEqual(np.round(np.linalg.norm(
+                    sitk.GetArrayFromImage(image) -
+                    sitk.GetArrayFromImage(image_2_sitk)),
+                    decimals=self.accuracy), 0)
+
+        # Vector images with components in fourth dimension
+        image = sitk.Compose(image_sitk, image_sitk * 2, image_sitk * 3)
+        sitkh.write_sitk_vector_image(image, path_to_file, verbose=False)
+        self.assertEqual(nib.load(path_to_file).shape,
+                         image.GetSize() + (3,))
+        image_2_sitk = sitkh.read_sitk_vector_image(path_to_file)
+        self.assertEqual(image_2_sitk.GetPixelID(), image.GetPixelID())
+        self.assertTrue(sitkh.same_physical_space(
+            image, image_2_sitk, tol=1e-5))
+        self.assertEqual(np.round(np.linalg.norm(
+            sitk.GetArrayFromImage(image) -
+            sitk.GetArrayFromImage(image_2_sitk)),
+            decimals=self.accuracy), 0)
+
+    def test_read_nifti_image_mmap(self):
+        image_sitk = sitkh.get_transformed_sitk_image(
+            self.image_sitk,
+            sitk.Euler3DTransform((0, 0, 0), 0.3, -0.2, 0.5, (10, -4, 3)))
+
+        for filename in ["foo_mmap.nii", "foo_mmap_compressed.nii.gz"]:
+            path_to_file = os.path.join(DIR_TMP, filename)
+            sitkh.write_nifti_image_sitk(image_sitk, path_to_file)
+
+            nda, geometry = sitkh.read_nifti_image_mmap(path_to_file)
+            self.assertEqual(isinstance(nda, np.memmap),
+                             filename.endswith(".nii"))
+            self.assertFalse(nda.flags.writeable)
+            self.assertTrue(sitkh.same_physical_space(
+                geometry, image_sitk, tol=1e-5))
+            self.assertEqual(np.round(np.linalg.norm(
+                nda[10] - sitk.GetArrayViewFromImage(image_sitk)[10]),
+                decimals=self.accuracy), 0)
+
+            image_2_sitk = sitkh.get_sitk_from_array_and_geometry(
+                nda, geometry)
+            self.assertEqual(np.round(np.linalg.norm(
+                sitk.GetArrayFromImage(image_2_sitk) -
+                sitk.GetArrayFromImage(image_sitk)),
+                decimals=self.accuracy), 0)
+            del nda
+            os.remove(path_to_file)
+
+    def test_read_nifti_images_sitk(self):
+        paths = []
+        for i in range(4):
+            paths.append(os.path.join(DIR_TMP, "foo_batch_%d.nii.gz" % i))
+            sitkh.write_nifti_image_sitk(self.image_sitk * i, paths[-1])
+        images_sitk = [sitkh.read_nifti_image_sitk(p) for p in paths]
+
+        images_2_sitk = sitkh.read_nifti_images_sitk(paths, n_workers=2)
+        images_3_sitk = list(sitkh.read_nifti_images_sitk(
+            paths, n_workers=2, prefetch=1))
+        for image_sitk, image_2_sitk, image_3_sitk in zip(
+                images_sitk, images_2_sitk, images_3_sitk):
+            for image in [image_2_sitk, image_3_sitk]:
+                self.assertEqual(np.round(np.linalg.norm(
+                    sitk.GetArrayFromImage(image_sitk) -
+                    sitk.GetArrayFromImage(image)),
+                    decimals=self.accuracy), 0)
+
+        # Per-file error reporting
+        paths.insert(2, os.path.join(DIR_TMP, "foo_missing.nii.gz"))
+        self.assertRaises(IOError, sitkh.read_nifti_images_sitk, paths)
+        images_sitk = sitkh.read_nifti_images_sitk(paths, raise_errors=False)
+        self.assertEqual([image is None for image in images_sitk],
+                         [False, False, True, False, False])
+
+        iterator = sitkh.read_nifti_images_sitk(paths, prefetch=2)
+        next(iterator)
+        next(iterator)
+        self.assertRaises(IOError, next, iterator)
+
     def test_get_correct_itk_orientation_from_sitk_image(self):
 
         # Read image via itk
@@ -389,6 +535,641 @@ class SimpleItkHelperTest(unittest.TestCase):
         self.assertEqual(np.round(np.linalg.norm(
             nda_diff_affine), decimals=self.accuracy), 0)
 
+    def test_get_transformed_sitk_images(self):
+        np.random.seed(8)
+        slices_sitk = [self.image_sitk[:, :, i:i + 1] for i in range(10)]
+        transforms_sitk = [sitk.Euler3DTransform(
+            np.random.rand(3) * 10, *np.random.rand(3)) for i in range(10)]
+        for transform_sitk in transforms_sitk:
+            transform_sitk.SetTranslation(np.random.rand(3) * 10)
+
+        slices_transformed_sitk = sitkh.get_transformed_sitk_images(
+            slices_sitk, TransformBatch.from_sitk(transforms_sitk))
+        for slice_sitk, slice_transformed_sitk, transform_sitk in zip(
+                slices_sitk, slices_transformed_sitk, transforms_sitk):
+            self.assertIsNot(slice_sitk, slice_transformed_sitk)
+            for index in [(0, 0, 0), (5, 10, 0)]:
+                self.assertEqual(np.round(np.linalg.norm(
+                    np.array(transform_sitk.TransformPoint(
+                        slice_sitk.TransformIndexToPhysicalPoint(index))) -
+                    slice_transformed_sitk.TransformIndexToPhysicalPoint(
+                        index)), decimals=self.accuracy), 0)
+
+        # Update headers in place
+        slices_transformed_inplace_sitk = sitkh.get_transformed_sitk_images(
+            slices_sitk, transforms_sitk, inplace=True)
+        for slice_sitk, slice_transformed_sitk, slice_inplace_sitk in zip(
+                slices_sitk,
+                slices_transformed_sitk,
+                slices_transformed_inplace_sitk):
+            self.assertIs(slice_sitk, slice_inplace_sitk)
+            self.assertEqual(np.round(np.linalg.norm(
+                np.array(slice_sitk.GetOrigin()) -
+                slice_transformed_sitk.GetOrigin()),
+                decimals=self.accuracy), 0)
+            self.assertEqual(np.round(np.linalg.norm(
+                np.array(slice_sitk.GetDirection()) -
+                slice_transformed_sitk.GetDirection()),
+                decimals=self.accuracy), 0)
+
+    def test_get_composite_sitk_affine_transforms(self):
+        np.random.seed(0)
+        transform_chains = []
+        for i in range(10):
+            chain = []
+            for j in range(1 + i % 5):
+                chain.append(sitk.Euler3DTransform(
+                    np.random.rand(3) * 10,
+                    *np.random.rand(3)))
+                chain[-1].SetTranslation(np.random.rand(3) * 10)
+            if i % 3 == 0:
+                affine = sitk.AffineTransform(3)
+                affine.SetMatrix((np.eye(3) + np.random.rand(3, 3)).flatten())
+                affine.SetTranslation(np.random.rand(3))
+                chain.append(affine)
+            transform_chains.append(chain)
+
+        transforms_sitk = sitkh.get_composite_sitk_affine_transforms(
+            transform_chains)
+
+        point = (1.5, -20.3, 7.1)
+        for chain, transform_sitk in zip(transform_chains, transforms_sitk):
+            transform_ref = chain[-1]
+            for transform_outer in chain[-2::-1]:
+                transform_ref = sitkh.get_composite_sitk_affine_transform(
+                    transform_outer, transform_ref)
+
+            self.assertEqual(transform_ref.GetName(), transform_sitk.GetName())
+            self.assertAlmostEqual(np.linalg.norm(
+                np.array(transform_ref.TransformPoint(point)) -
+                transform_sitk.TransformPoint(point)), 0,
+                places=self.accuracy)
+
+        # Chains of generic transforms and of transforms without translation
+        transform_chains = [
+            [sitk.Transform(sitk.Euler3DTransform(
+                np.random.rand(3) * 10, *np.random.rand(3)))
+             for j in range(3)],
+            [sitk.VersorTransform(
+                np.random.rand(3) - 0.5, np.random.rand(),
+                np.random.rand(3) * 10)
+             for j in range(3)],
+        ]
+        transforms_sitk = sitkh.get_composite_sitk_affine_transforms(
+            transform_chains)
+        self.assertEqual(transforms_sitk[0].GetName(), "Euler3DTransform")
+        self.assertEqual(transforms_sitk[1].GetName(), "AffineTransform")
+        for chain, transform_sitk in zip(transform_chains, transforms_sitk):
+            point_ref = point
+            for transform in chain[::-1]:
+                point_ref = transform.TransformPoint(point_ref)
+            self.assertAlmostEqual(np.linalg.norm(
+                np.array(point_ref) - transform_sitk.TransformPoint(point)),
+                0, places=self.accuracy)
+
+        self.assertRaises(
+            ValueError, sitkh.get_composite_sitk_affine_transforms, [])
+        self.assertRaises(
+            ValueError, sitkh.get_composite_sitk_affine_transforms,
+            transform_chains + [[]])
+
+    def test_get_inverse_of_sitk_rigid_registration_transforms(self):
+        np.random.seed(0)
+        transforms_sitk = {
+            "Euler2DTransform": [
+                sitk.Euler2DTransform(
+                    np.random.rand(2), np.random.rand(), np.random.rand(2))
+                for i in range(5)],
+            "Euler3DTransform": [
+                sitk.Euler3DTransform(
+                    np.random.rand(3), *np.random.rand(3))
+                for i in range(5)],
+            "AffineTransform": [
+                sitk.AffineTransform(
+                    (np.eye(3) + np.random.rand(3, 3)).flatten(),
+                    np.random.rand(3), np.random.rand(3))
+                for i in range(5)],
+        }
+        for transform_sitk in transforms_sitk["Euler3DTransform"][0:2]:
+            transform_sitk.SetComputeZYX(True)
+
+        for transform_type, transforms in transforms_sitk.items():
+            transforms_inv = \
+                sitkh.get_inverse_of_sitk_rigid_registration_transforms(
+                    transforms)
+            for transform_sitk, transform_inv in zip(
+                    transforms, transforms_inv):
+                self.assertEqual(transform_inv.GetName(), transform_type)
+
+                transform_inv_ref = getattr(sitk, transform_type)(
+                    transform_sitk.GetInverse())
+                self.assertAlmostEqual(np.linalg.norm(
+                    np.array(transform_inv_ref.GetParameters()) -
+                    transform_inv.GetParameters()), 0,
+                    places=self.accuracy)
+                self.assertAlmostEqual(np.linalg.norm(
+                    np.array(transform_inv_ref.GetFixedParameters()) -
+                    transform_inv.GetFixedParameters()), 0,
+                    places=self.accuracy)
+
+        # Generic sitk.Transform objects as returned by registration
+        transforms = [sitk.Transform(t)
+                      for t in transforms_sitk["Euler3DTransform"]]
+        parameters_inv, fixed_parameters_inv = \
+            sitkh.get_inverse_of_sitk_rigid_registration_transforms(
+                transforms, as_sitk=False)
+        for i, transform_sitk in enumerate(
+                transforms_sitk["Euler3DTransform"]):
+            transform_inv_ref = sitk.Euler3DTransform(
+                transform_sitk.GetInverse())
+            self.assertAlmostEqual(np.linalg.norm(
+                np.array(transform_inv_ref.GetParameters()) -
+                parameters_inv[i]), 0, places=self.accuracy)
+            self.assertAlmostEqual(np.linalg.norm(
+                np.array(transform_inv_ref.GetFixedParameters()) -
+                fixed_parameters_inv[i]), 0, places=self.accuracy)
+
+        # Mixed types are inverted as affine transforms
+        transforms = transforms_sitk["Euler3DTransform"] + \
+            transforms_sitk["AffineTransform"]
+        transforms_inv = \
+            sitkh.get_inverse_of_sitk_rigid_registration_transforms(
+                transforms)
+        point = (1.5, -20.3, 7.1)
+        for transform_sitk, transform_inv in zip(transforms, transforms_inv):
+            self.assertEqual(transform_inv.GetName(), "AffineTransform")
+            self.assertAlmostEqual(np.linalg.norm(
+                np.array(transform_inv.TransformPoint(
+                    transform_sitk.TransformPoint(point))) - point), 0,
+                places=self.accuracy)
+
+        self.assertRaises(
+            ValueError,
+            sitkh.get_inverse_of_sitk_rigid_registration_transforms, [])
+
+    def test_copy_transform_sitk(self):
+        transforms_sitk = [
+            sitk.Euler2DTransform((1, 2), 0.3, (4, 5)),
+            sitk.Similarity3DTransform(),
+            sitk.VersorRigid3DTransform(),
+            sitk.AffineTransform(3),
+        ]
+        for transform_sitk in transforms_sitk:
+            transform_sitk_copy = sitkh.copy_transform_sitk(
+                sitk.Transform(transform_sitk))
+            self.assertEqual(
+                transform_sitk_copy.GetName(), transform_sitk.GetName())
+            self.assertEqual(
+                transform_sitk_copy.GetParameters(),
+                transform_sitk.GetParameters())
+
+        # Unsupported transform types fail fast
+        self.assertRaises(ValueError, sitkh.copy_transform_sitk,
+                          sitk.Transform())
+
+    def test_read_transform_sitk(self):
+        transforms_sitk = [
+            sitk.Euler2DTransform((1, 2), 0.3, (4, 5)),
+            sitk.Euler3DTransform((1, 2, 3), 0.1, 0.2, 0.3, (4, 5, 6)),
+            sitk.AffineTransform(
+                np.arange(1., 10.), (1., 2., 3.), (4., 5., 6.)),
+        ]
+        paths_to_files = [None] * len(transforms_sitk)
+        for i, transform_sitk in enumerate(transforms_sitk):
+            paths_to_files[i] = os.path.join(DIR_TMP, "transform%d.tfm" % i)
+            sitk.WriteTransform(transform_sitk, paths_to_files[i])
+
+        transforms_read_sitk = sitkh.read_transforms_sitk(paths_to_files)
+        for transform_sitk, transform_read_sitk in zip(
+                transforms_sitk, transforms_read_sitk):
+            self.assertEqual(
+                transform_sitk.GetName(), transform_read_sitk.GetName())
+            self.assertEqual(transform_sitk.GetParameters(),
+                             transform_read_sitk.GetParameters())
+            self.assertEqual(transform_sitk.GetFixedParameters(),
+                             transform_read_sitk.GetFixedParameters())
+
+        # Cached transforms must not be returned for modified files, even if
+        # size and modification time (in seconds) are unchanged
+        stat = os.stat(paths_to_files[0])
+        transform_sitk = sitk.Euler2DTransform((1, 2), 0.4, (4, 5))
+        sitk.WriteTransform(transform_sitk, paths_to_files[0])
+        self.assertEqual(os.stat(paths_to_files[0]).st_size, stat.st_size)
+        os.utime(paths_to_files[0],
+                 ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+        transform_read_sitk = sitkh.read_transform_sitk(paths_to_files[0])
+        self.assertEqual(transform_sitk.GetParameters(),
+                         transform_read_sitk.GetParameters())
+
+    def test_transform_points_sitk(self):
+        np.random.seed(7)
+        points = np.random.rand(100, 3) * 100
+
+        bspline_sitk = sitk.BSplineTransformInitializer(
+            self.image_sitk, (3, 3, 3))
+        bspline_sitk.SetParameters(
+            np.random.rand(bspline_sitk.GetNumberOfParameters()) * 5)
+        chain = [
+            sitk.Euler3DTransform((1, 2, 3), 0.1, 0.2, 0.3, (4, 5, 6)),
+            sitk.TranslationTransform(3, (1, -2, 3)),
+            bspline_sitk,
+            sitk.ScaleTransform(3, (1.1, 0.9, 1.2)),
+            sitk.AffineTransform(
+                np.eye(3).flatten() + 0.1, (1., 2., 3.), (4., 5., 6.)),
+        ]
+        composite_sitk = sitk.CompositeTransform(chain[0:3])
+        composite_sitk.AddTransform(sitk.CompositeTransform(chain[3:]))
+
+        points_transformed = sitkh.transform_points_sitk(points, chain)
+        points_transformed_composite = sitkh.transform_points_sitk(
+            points, composite_sitk, chunk_size=7)
+        for i, point in enumerate(points):
+            point_transformed = composite_sitk.TransformPoint(point)
+            self.assertEqual(np.round(
+                np.linalg.norm(points_transformed[i] - point_transformed),
+                decimals=self.accuracy), 0)
+            self.assertEqual(np.round(
+                np.linalg.norm(
+                    points_transformed_composite[i] - point_transformed),
+                decimals=self.accuracy), 0)
+
+        # Image index to physical space mapping and back
+        indices = np.random.randint(0, 10, (100, 3))
+        points = sitkh.transform_indices_to_physical_points_sitk(
+            indices, self.image_sitk)
+        for i, index in enumerate(indices.tolist()):
+            self.assertEqual(np.round(np.linalg.norm(
+                points[i] - self.image_sitk.TransformIndexToPhysicalPoint(
+                    index)), decimals=self.accuracy), 0)
+        self.assertEqual(
+            sitkh.transform_physical_points_to_indices_sitk(
+                points, self.image_sitk, continuous=False).tolist(),
+            indices.tolist())
+
+    def test_get_displacement_field_transform_sitk(self):
+        np.random.seed(5)
+        bspline_sitk = sitk.BSplineTransformInitializer(
+            self.image_sitk, (3, 3, 3))
+        bspline_sitk.SetParameters(
+            np.random.rand(bspline_sitk.GetNumberOfParameters()) * 5)
+        chain = [
+            sitk.Euler3DTransform((1, 2, 3), 0.1, 0.2, 0.3, (4, 5, 6)),
+            bspline_sitk,
+        ]
+
+        # Small memory budget to enforce evaluation in multiple slabs
+        transform_sitk = sitkh.get_displacement_field_transform_sitk(
+            chain, self.image_sitk, max_bytes=100000)
+        self.assertEqual(transform_sitk.GetName(),
+                         "DisplacementFieldTransform")
+
+        field_sitk = sitk.TransformToDisplacementField(
+            sitk.CompositeTransform(chain),
+            sitk.sitkVectorFloat64,
+            self.image_sitk.GetSize(),
+            self.image_sitk.GetOrigin(),
+            self.image_sitk.GetSpacing(),
+            self.image_sitk.GetDirection())
+        self.assertTrue(sitkh.same_physical_space(
+            transform_sitk.GetDisplacementField(), field_sitk))
+        self.assertEqual(np.round(np.linalg.norm(
+            sitk.GetArrayFromImage(transform_sitk.GetDisplacementField()) -
+            sitk.GetArrayFromImage(field_sitk)), decimals=self.accuracy), 0)
+
+    def test_flirt_transforms(self):
+        np.random.seed(6)
+
+        # FLIRT translation along FSL x-axis corresponds to a translation
+        # along physical x-axis for both neurological and radiological
+        # orientation since FSL flips the x-axis of the former
+        matrix = np.eye(4)
+        matrix[0, 3] = 2.5
+        for direction in [(1, 0, 0, 0, 1, 0, 0, 0, 1),
+                          (-1, 0, 0, 0, 1, 0, 0, 0, 1)]:
+            image_sitk = sitk.Image(self.image_sitk)
+            image_sitk.SetDirection(direction)
+            transform_sitk = \
+                sitkh.get_sitk_affine_transforms_from_flirt_matrices(
+                    matrix, image_sitk, image_sitk)[0]
+            self.assertEqual(np.round(np.linalg.norm(
+                np.array(transform_sitk.TransformPoint((1, 2, 3))) -
+                np.array((3.5, 2, 3))), decimals=self.accuracy), 0)
+
+        # Write and read transforms for different image geometries
+        image_src_sitk = sitkh.get_transformed_sitk_image(
+            self.image_2_sitk,
+            sitk.Euler3DTransform((0, 0, 0), 0.3, -0.2, 0.5, (10, -4, 3)))
+        transforms_sitk = [sitk.AffineTransform(
+            np.eye(3).flatten() + np.random.rand(9) * 0.1,
+            np.random.rand(3) * 10) for i in range(5)]
+        paths_to_files = [os.path.join(DIR_TMP, "flirt%d.mat" % i)
+                          for i in range(len(transforms_sitk))]
+        sitkh.write_transforms_flirt_sitk(
+            transforms_sitk, paths_to_files, image_src_sitk, self.image_sitk)
+        transforms_read_sitk = sitkh.read_transforms_flirt_sitk(
+            paths_to_files, [image_src_sitk] * 5, self.image_sitk)
+        for transform_sitk, transform_read_sitk in zip(
+                transforms_sitk, transforms_read_sitk):
+            self.assertEqual(np.round(np.linalg.norm(
+                sitkh.get_homogeneous_matrix_from_sitk_transform(
+                    transform_sitk) -
+                sitkh.get_homogeneous_matrix_from_sitk_transform(
+                    transform_read_sitk)), decimals=self.accuracy), 0)
+
+    def test_get_sitk_from_itk_transforms(self):
+        np.random.seed(9)
+        bspline_sitk = sitk.BSplineTransformInitializer(
+            self.image_sitk, (3, 4, 5))
+        bspline_sitk.SetParameters(
+            np.random.rand(bspline_sitk.GetNumberOfParameters()))
+        transforms_sitk = [
+            sitk.Euler3DTransform((1, 2, 3), 0.1, 0.2, 0.3, (4, 5, 6)),
+            sitk.AffineTransform(
+                np.arange(1., 10.), (1., 2., 3.), (4., 5., 6.)),
+            sitk.Similarity2DTransform(2, 0.3, (1, 2), (3, 4)),
+            bspline_sitk,
+            sitk.Euler3DTransform((3, 2, 1), 0.3, 0.2, 0.1, (6, 5, 4)),
+        ]
+
+        transforms_itk = sitkh.get_itk_from_sitk_transforms(transforms_sitk)
+        for transform_sitk, transform_itk in zip(
+                transforms_sitk, transforms_itk):
+            self.assertEqual(transform_sitk.GetName(),
+                             transform_itk.GetNameOfClass())
+            self.assertEqual(
+                np.round(np.linalg.norm(
+                    np.array(transform_sitk.TransformPoint((1, 2, 3)[
+                        0:transform_sitk.GetDimension()])) -
+                    np.array(transform_itk.TransformPoint((1, 2, 3)[
+                        0:transform_sitk.GetDimension()]))),
+                    decimals=self.accuracy), 0)
+
+        transforms_sitk_2 = sitkh.get_sitk_from_itk_transforms(transforms_itk)
+        for transform_sitk, transform_sitk_2 in zip(
+                transforms_sitk, transforms_sitk_2):
+            self.assertEqual(transform_sitk.GetName(),
+                             transform_sitk_2.GetName())
+            self.assertEqual(transform_sitk.GetParameters(),
+                             transform_sitk_2.GetParameters())
+            self.assertEqual(transform_sitk.GetFixedParameters(),
+                             transform_sitk_2.GetFixedParameters())
+
+        # Single precision
+        transform_itk = sitkh.get_itk_from_sitk_transform(
+            transforms_sitk[1], pixel_type=itk.F)
+        self.assertEqual(itk.template(transform_itk)[1][0], itk.F)
+        self.assertEqual(np.round(np.linalg.norm(
+            np.array(sitkh.get_sitk_from_itk_AffineTransform(
+                transform_itk).GetParameters()) -
+            np.array(transforms_sitk[1].GetParameters())), decimals=5), 0)
+
+    def test_iterate_voxel_coordinates_sitk(self):
+        image_sitk = sitkh.get_transformed_sitk_image(
+            self.image_sitk,
+            sitk.Euler3DTransform((0, 0, 0), 0.3, -0.2, 0.5, (10, -4, 3)))
+        indices = sitkh.get_indices_array_to_flattened_sitk_image_data_array(
+            image_sitk)
+        self.assertEqual(indices.dtype, np.int64)
+        self.assertTrue(indices.flags["C_CONTIGUOUS"])
+        self.assertEqual(
+            sitkh.get_indices_array_to_flattened_sitk_image_data_array(
+                image_sitk, dtype=None).dtype, np.int16)
+        points = sitkh.transform_indices_to_physical_points_sitk(
+            indices.T, image_sitk)
+
+        # Small memory budget to enforce multiple chunks
+        N_voxels = 0
+        for chunk, indices_chunk in sitkh.iterate_voxel_coordinates_sitk(
+                image_sitk, max_bytes=10000):
+            self.assertEqual(indices_chunk.tolist(),
+                             indices[:, chunk].T.tolist())
+            N_voxels += indices_chunk.shape[0]
+        self.assertEqual(N_voxels, indices.shape[1])
+
+        for chunk, points_chunk in sitkh.iterate_voxel_coordinates_sitk(
+                image_sitk, physical=True, max_bytes=10000):
+            self.assertEqual(np.round(
+                np.linalg.norm(points_chunk - points[chunk]),
+                decimals=self.accuracy), 0)
+
+        # Jacobian evaluated on streamed points
+        image_sitk = image_sitk[::8, ::8, ::4]
+        indices = sitkh.get_indices_array_to_flattened_sitk_image_data_array(
+            image_sitk)
+        points = sitkh.transform_indices_to_physical_points_sitk(
+            indices.T, image_sitk)
+        transform_itk = sitkh.get_itk_from_sitk_transform(
+            sitk.Euler3DTransform((1, 2, 3), 0.1, 0.2, 0.3))
+        jacobian_nda = sitkh.\
+            get_numpy_array_of_jacobian_itk_transform_applied_on_sitk_image(
+                transform_itk, image_sitk)
+        jacobian_2_nda = sitkh.\
+            get_numpy_array_of_jacobian_itk_transform_applied_on_sitk_image(
+                transform_itk, image_sitk, points=points.T)
+        self.assertEqual(np.round(
+            np.linalg.norm(jacobian_nda - jacobian_2_nda),
+            decimals=self.accuracy), 0)
+
+    def test_get_altered_field_of_view_sitk_image(self):
+        image_sitk = self.image_sitk[::2, ::2, :]
+
+        for boundary, unit in [
+                ((2, 1, 3), "voxel"),
+                ((-2, 3, -1), "voxel"),
+                ((2 * image_sitk.GetSpacing()[0], 0, 0), "mm"),
+                ((2.3, -1.7, 3.1), "mm")]:
+            image_fov_sitk = sitkh.get_altered_field_of_view_sitk_image(
+                image_sitk, *boundary, unit=unit)
+
+            # Reference obtained by resampling on the altered grid
+            boundary_voxel = np.array(boundary, dtype=np.float64)
+            if unit == "mm":
+                boundary_voxel /= np.array(image_sitk.GetSpacing())
+            size = np.array(image_sitk.GetSize()) + \
+                2 * np.round(boundary_voxel).astype(int)
+            origin = image_sitk.TransformContinuousIndexToPhysicalPoint(
+                list(-boundary_voxel))
+            image_ref_sitk = sitk.Resample(
+                image_sitk, [int(s) for s in size], sitk.Euler3DTransform(),
+                sitk.sitkNearestNeighbor, origin, image_sitk.GetSpacing(),
+                image_sitk.GetDirection())
+
+            self.assertEqual(image_fov_sitk.GetSize(),
+                             image_ref_sitk.GetSize())
+            self.assertEqual(np.round(
+                np.linalg.norm(np.array(image_fov_sitk.GetOrigin()) -
+                               image_ref_sitk.GetOrigin()),
+                decimals=self.accuracy), 0)
+            self.assertEqual(np.round(
+                np.linalg.norm(sitk.GetArrayFromImage(image_fov_sitk) -
+                               sitk.GetArrayFromImage(image_ref_sitk)),
+                decimals=self.accuracy), 0)
+
+    def test_build_image_pyramid(self):
+        image_sitk = self.image_sitk[0:100, 0:100, 0:30]
+        nda = sitk.GetArrayFromImage(image_sitk)
+
+        # Block mean
+        image_level_sitk = sitkh.build_image_pyramid(
+            image_sitk, [(2, 3, 1)], use_cache=False)[0]
+        self.assertEqual(image_level_sitk.GetSize(), (50, 33, 30))
+        nda_level = sitk.GetArrayFromImage(image_level_sitk)
+        self.assertAlmostEqual(
+            nda_level[4, 5, 6], nda[4, 15:18, 12:14].mean(), places=4)
+        np.testing.assert_array_almost_equal(
+            image_level_sitk.GetOrigin(),
+            image_sitk.TransformContinuousIndexToPhysicalPoint(
+                (0.5, 1, 0)),
+            decimal=self.accuracy)
+
+        # Gaussian smoothing results in same geometry
+        image_gaussian_sitk = sitkh.build_image_pyramid(
+            image_sitk, [(2, 3, 1)], sigmas=[1], use_cache=False)[0]
+        self.assertEqual(image_gaussian_sitk.GetSize(),
+                         image_level_sitk.GetSize())
+        np.testing.assert_array_almost_equal(
+            image_gaussian_sitk.GetOrigin(), image_level_sitk.GetOrigin(),
+            decimal=self.accuracy)
+
+        # Majority vote
+        label_sitk = sitk.Cast(sitk.Round(image_sitk / 100.), sitk.sitkUInt8)
+        nda_label = sitk.GetArrayFromImage(label_sitk)
+        label_level_sitk = sitkh.build_image_pyramid(
+            label_sitk, [2], is_label=True, use_cache=False)[0]
+        self.assertEqual(label_level_sitk.GetPixelID(), sitk.sitkUInt8)
+        nda_label_level = sitk.GetArrayFromImage(label_level_sitk)
+        for k, j, i in [(0, 0, 0), (7, 20, 31), (14, 49, 12)]:
+            self.assertEqual(
+                nda_label_level[k, j, i],
+                np.bincount(nda_label[2 * k:2 * k + 2,
+                                      2 * j:2 * j + 2,
+                                      2 * i:2 * i + 2].flatten()).argmax())
+
+        # Cached levels are reused but not shared
+        images_sitk = sitkh.build_image_pyramid(image_sitk, [4, 2])
+        images_2_sitk = sitkh.build_image_pyramid(image_sitk, [2, 1.5])
+        self.assertEqual(np.round(np.linalg.norm(
+            sitk.GetArrayFromImage(images_sitk[1]) -
+            sitk.GetArrayFromImage(images_2_sitk[0])),
+            decimals=self.accuracy), 0)
+        images_2_sitk[0].SetOrigin((0, 0, 0))
+        self.assertNotEqual(images_sitk[1].GetOrigin(), (0, 0, 0))
+
+    def test_resample_images_to_reference(self):
+        images_sitk = [self.image_sitk,
+                       sitk.Cast(self.image_sitk, sitk.sitkUInt8),
+                       self.image_sitk[::2, ::2, :]]
+        image_ref_sitk = self.image_sitk[10:150, 20:200, 5:30]
+        transforms_sitk = [
+            sitk.Euler3DTransform((0, 0, 0), 0.1, -0.2, 0.05, (3, -2, 4)),
+            sitk.AffineTransform(3),
+            TransformChain([
+                sitk.Euler3DTransform((0, 0, 0), 0.1, 0, 0, (0, 0, 0)),
+                sitk.Euler3DTransform((10, 0, 0), 0, 0.2, 0, (1, 2, 3))]),
+        ]
+
+        for n_workers in [1, 2]:
+            images_resampled_sitk = sitkh.resample_images_to_reference(
+                images_sitk,
+                sitkh.get_image_geometry(image_ref_sitk),
+                transforms_sitk,
+                n_workers=n_workers)
+
+            for i, image_sitk in enumerate(images_sitk):
+                transform_sitk = transforms_sitk[i]
+                if isinstance(transform_sitk, TransformChain):
+                    transform_sitk = transform_sitk.get_sitk_transform()
+                image_resampled_sitk = sitk.Resample(
+                    image_sitk, image_ref_sitk, transform_sitk,
+                    sitk.sitkLinear)
+
+                self.assertEqual(images_resampled_sitk[i].GetPixelID(),
+                                 image_sitk.GetPixelID())
+                self.assertEqual(images_resampled_sitk[i].GetSize(),
+                                 image_ref_sitk.GetSize())
+                self.assertEqual(np.round(np.linalg.norm(
+                    sitk.GetArrayFromImage(images_resampled_sitk[i]) -
+                    sitk.GetArrayFromImage(image_resampled_sitk)),
+                    decimals=self.accuracy), 0)
+
+    def test_get_reference_grid_sitk(self):
+        image_sitk = self.image_sitk
+        image_2_sitk = sitkh.get_transformed_sitk_image(
+            image_sitk,
+            sitk.Euler3DTransform((0, 0, 0), 0.3, -0.2, 0.5, (10, -4, 3)))
+
+        # Corners
+        corners = sitkh.get_physical_corners_sitk(
+            [image_sitk, sitkh.get_image_geometry(image_2_sitk)])
+        self.assertEqual(corners.shape, (2, 8, 3))
+        size = np.array(image_2_sitk.GetSize())
+        for corner in corners[1]:
+            index = np.array(
+                image_2_sitk.TransformPhysicalPointToContinuousIndex(corner))
+            self.assertEqual(np.round(np.linalg.norm(
+                np.minimum(np.abs(index + 0.5), np.abs(index - size + 0.5))),
+                decimals=self.accuracy), 0)
+
+        # Bounding boxes
+        lower, upper = sitkh.get_bounding_box_sitk([image_sitk, image_2_sitk])
+        lower_i, upper_i = sitkh.get_bounding_box_sitk(
+            [image_sitk, image_2_sitk], mode="intersection")
+        self.assertTrue(np.all(lower <= lower_i) and np.all(upper_i <= upper))
+        self.assertRaises(ValueError, sitkh.get_bounding_box_sitk,
+                          [image_sitk, image_sitk[0:10, 0:10, 0:10],
+                           image_sitk[-10:, -10:, -10:]],
+                          None, "intersection")
+
+        # Reference grid of single image is its own grid
+        image_ref_sitk = sitkh.get_reference_grid_sitk(image_2_sitk)
+        self.assertEqual(image_ref_sitk.GetSize(), image_2_sitk.GetSize())
+        np.testing.assert_array_almost_equal(
+            image_ref_sitk.GetOrigin(), image_2_sitk.GetOrigin(),
+            decimal=self.accuracy)
+
+        # Union grid covers all images
+        image_ref_sitk = sitkh.get_reference_grid_sitk(
+            [image_sitk, image_2_sitk], spacing=2, direction=np.eye(3))
+        self.assertEqual(image_ref_sitk.GetSpacing(), (2, 2, 2))
+        lower_ref, upper_ref = sitkh.get_bounding_box_sitk(image_ref_sitk)
+        self.assertTrue(np.all(lower_ref <= lower + 1e-6) and
+                        np.all(upper <= upper_ref + 1e-6))
+        self.assertTrue(np.all(upper_ref - lower_ref < upper - lower + 2))
+
+    def test_same_physical_space(self):
+        image_sitk = self.image_sitk
+        geometry = sitkh.get_image_geometry(image_sitk)
+
+        self.assertTrue(sitkh.same_physical_space(image_sitk, geometry))
+        self.assertTrue(sitkh.same_physical_space(
+            sitk.Cast(image_sitk, sitk.sitkUInt8), image_sitk))
+        self.assertFalse(sitkh.same_physical_space(
+            image_sitk, image_sitk[:, :, 1:]))
+        self.assertFalse(sitkh.same_physical_space(
+            image_sitk, image_sitk[:, :, 0]))
+
+        # Origin within and beyond tolerance
+        image_2_sitk = sitk.Image(image_sitk)
+        origin = np.array(image_sitk.GetOrigin())
+        image_2_sitk.SetOrigin(origin + 1e-8)
+        self.assertTrue(sitkh.same_physical_space(image_sitk, image_2_sitk))
+        image_2_sitk.SetOrigin(origin + 1e-3)
+        self.assertFalse(sitkh.same_physical_space(image_sitk, image_2_sitk))
+        self.assertTrue(sitkh.same_physical_space(
+            image_sitk, image_2_sitk, tol=1e-2))
+
+        image_2_sitk = sitkh.get_transformed_sitk_image(
+            image_sitk, sitk.Euler3DTransform((0, 0, 0), 0.01, 0, 0))
+        self.assertFalse(sitkh.same_physical_space(image_sitk, image_2_sitk))
+
+        # Images on the reference grid are not resampled
+        image_resampled_sitk = sitkh.resample_images_to_reference(
+            [image_sitk], geometry)[0]
+        self.assertEqual(np.round(np.linalg.norm(
+            sitk.GetArrayFromImage(image_resampled_sitk) -
+            sitk.GetArrayFromImage(image_sitk)),
+            decimals=self.accuracy), 0)
+
     def test_get_indices_array_to_flattened_sitk_image(self):
 
         # 3D
@@ -0,0 +1,139 @@
+# \file transform_batch_test.py
+#  \brief  Class containing unit tests for module TransformBatch
+#
+#  \author Michael Ebner (michael.ebner.14@ucl.ac.uk)
+#  \date October 2026
+
+
+# Import libraries
+import SimpleITK as sitk
+import numpy as np
+import unittest
+
+# Import modules
+import pysitk.simple_itk_helper as sitkh
+from pysitk.transform_batch import TransformBatch
+
+
+def get_random_euler_transforms(N, dim=3):
+    transforms_sitk = [None] * N
+    for i in range(N):
+        if dim == 3:
+            transforms_sitk[i] = sitk.Euler3DTransform(
+                np.random.rand(3) * 10, *np.random.rand(3))
+        else:
+            transforms_sitk[i] = sitk.Euler2DTransform(
+                np.random.rand(2) * 10, np.random.rand())
+        transforms_sitk[i].SetTranslation(np.random.rand(dim) * 10)
+    return transforms_sitk
+
+
+class TransformBatchTest(unittest.TestCase):
+
+    def setUp(self):
+        self.accuracy = 8
+        np.random.seed(1)
+        self.points = np.random.rand(5, 3) * 100
+
+    def test_sitk_round_trip(self):
+        transforms_sitk = get_random_euler_transforms(20)
+        transform_batch = TransformBatch.from_sitk(transforms_sitk)
+        self.assertEqual(len(transform_batch), 20)
+
+        for transform_sitk, transform_batch_sitk in zip(
+                transforms_sitk, transform_batch.get_sitk_transforms()):
+            self.assertEqual(transform_batch_sitk.GetName(),
+                             "Euler3DTransform")
+            self.assertAlmostEqual(np.linalg.norm(
+                np.array(transform_sitk.GetParameters()) -
+                transform_batch_sitk.GetParameters()), 0,
+                places=self.accuracy)
+            self.assertAlmostEqual(np.linalg.norm(
+                np.array(transform_sitk.GetFixedParameters()) -
+                transform_batch_sitk.GetFixedParameters()), 0,
+                places=self.accuracy)
+
+    def test_compose_inverse_and_transform_points(self):
+        transforms_outer_sitk = get_random_euler_transforms(10)
+        transforms_inner_sitk = get_random_euler_transforms(10)
+        transform_batch = TransformBatch.from_sitk(
+            transforms_outer_sitk).compose(
+            TransformBatch.from_sitk(transforms_inner_sitk))
+        transform_batch_inv = transform_batch.get_inverse()
+
+        points_mapped = transform_batch.transform_points(self.points)
+        points_mapped_inv = transform_batch_inv.transform_points(
+            points_mapped)
+
+        for i in range(len(transform_batch)):
+            transform_sitk = sitkh.get_composite_sitk_affine_transform(
+                transforms_outer_sitk[i], transforms_inner_sitk[i])
+            for j, point in enumerate(self.points):
+                self.assertAlmostEqual(np.linalg.norm(
+                    points_mapped[i, j] -
+                    transform_sitk.TransformPoint(point)), 0,
+                    places=self.accuracy)
+            self.assertAlmostEqual(np.linalg.norm(
+                points_mapped_inv[i] - self.points), 0,
+                places=self.accuracy)
+
+    def test_from_sitk_mixed_types(self):
+        transform_affine_sitk = sitk.AffineTransform(3)
+        transform_affine_sitk.SetMatrix(
+            (np.eye(3) + np.random.rand(3, 3) * 0.1).flatten())
+        transform_affine_sitk.SetTranslation(np.random.rand(3) * 10)
+        transform_affine_sitk.SetCenter(np.random.rand(3) * 10)
+        transforms_sitk = [transform_affine_sitk] + \
+            get_random_euler_transforms(3)
+
+        transform_batch = TransformBatch.from_sitk(transforms_sitk)
+        self.assertEqual(transform_batch.get_transform_type(),
+                         "AffineTransform")
+
+        points_mapped = transform_batch.transform_points(self.points)
+        for i, transform_sitk in enumerate(transforms_sitk):
+            for j, point in enumerate(self.points):
+                self.assertAlmostEqual(np.linalg.norm(
+                    points_mapped[i, j] -
+                    transform_sitk.TransformPoint(point)), 0,
+                    places=self.accuracy)
+
+    def test_versor_transform(self):
+        transforms_sitk = [
+            sitk.VersorTransform(
+                np.random.rand(3) - 0.5, np.random.rand(),
+                np.random.rand(3) * 10)
+            for i in range(5)]
+
+        transform_batch = TransformBatch.from_sitk(transforms_sitk)
+        self.assertEqual(transform_batch.get_transform_type(),
+                         "VersorTransform")
+        self.assertEqual(np.linalg.norm(transform_batch.get_translation()), 0)
+
+        transforms_batch_sitk = transform_batch.get_inverse(
+        ).get_inverse().get_sitk_transforms()
+        for transform_sitk, transform_batch_sitk in zip(
+                transforms_sitk, transforms_batch_sitk):
+            self.assertEqual(transform_batch_sitk.GetName(),
+                             "VersorTransform")
+            self.assertAlmostEqual(np.linalg.norm(
+                np.array(transform_sitk.GetParameters()) -
+                transform_batch_sitk.GetParameters()), 0,
+                places=self.accuracy)
+            self.assertAlmostEqual(np.linalg.norm(
+                np.array(transform_sitk.GetFixedParameters()) -
+                transform_batch_sitk.GetFixedParameters()), 0,
+                places=self.accuracy)
+
+        # Composition of rotations about different centers requires a
+        # translation
+        transform_batch_composite = transform_batch.compose(transform_batch[
+            ::-1])
+        self.assertEqual(transform_batch_composite.get_transform_type(),
+                         "AffineTransform")
+        transform_batch_composite.get_sitk_transforms()
+
+        transform_batch = TransformBatch.from_homogeneous_matrices(
+            transform_batch_composite.get_homogeneous_matrices(),
+            transform_type="VersorTransform")
+        self.assertRaises(ValueError, transform_batch.get_sitk_transforms)
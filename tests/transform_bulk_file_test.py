@@ -0,0 +1,84 @@
+# \file transform_bulk_file_test.py
+#  \brief  Class containing unit tests for module TransformBulkFile
+#
+#  \author Michael Ebner (michael.ebner.14@ucl.ac.uk)
+#  \date October 2026
+
+
+# Import libraries
+import SimpleITK as sitk
+import numpy as np
+import unittest
+import os
+
+# Import modules
+import pysitk.simple_itk_helper as sitkh
+from pysitk.transform_bulk_file import TransformBulkFile
+
+from pysitk.definitions import DIR_TMP
+
+
+class TransformBulkFileTest(unittest.TestCase):
+
+    def setUp(self):
+        np.random.seed(2)
+        self.path_to_file = os.path.join(DIR_TMP, "transforms.bin")
+
+        self.transforms_sitk = []
+        for i in range(50):
+            self.transforms_sitk.append(sitk.Euler3DTransform(
+                np.random.rand(3), *np.random.rand(3)))
+        self.transforms_sitk.append(sitk.Euler2DTransform(
+            np.random.rand(2), np.random.rand(), np.random.rand(2)))
+        self.transforms_sitk.append(sitk.AffineTransform(
+            np.random.rand(9), np.random.rand(3), np.random.rand(3)))
+        self.transforms_sitk.append(sitk.Similarity3DTransform())
+        self.keys = ["slice%d" % i for i in range(len(self.transforms_sitk))]
+
+    def assertEqualTransforms(self, transform_sitk, transform_read_sitk):
+        self.assertEqual(
+            transform_sitk.GetName(), transform_read_sitk.GetName())
+        self.assertEqual(
+            transform_sitk.GetParameters(),
+            transform_read_sitk.GetParameters())
+        self.assertEqual(
+            transform_sitk.GetFixedParameters(),
+            transform_read_sitk.GetFixedParameters())
+
+    def test_write_read_transforms_bulk_sitk(self):
+        sitkh.write_transforms_bulk_sitk(
+            self.transforms_sitk, self.keys, self.path_to_file)
+
+        transforms_read_sitk = sitkh.read_transforms_bulk_sitk(
+            self.path_to_file)
+        self.assertEqual(list(transforms_read_sitk.keys()), self.keys)
+        for key, transform_sitk in zip(self.keys, self.transforms_sitk):
+            self.assertEqualTransforms(
+                transform_sitk, transforms_read_sitk[key])
+
+        # Random access by key
+        transform_bulk_file = TransformBulkFile(self.path_to_file)
+        self.assertEqualTransforms(
+            self.transforms_sitk[7], transform_bulk_file["slice7"])
+        self.assertRaises(KeyError, transform_bulk_file.get_transform_sitk,
+                          "foo")
+
+    def test_append(self):
+        sitkh.write_transforms_bulk_sitk(
+            self.transforms_sitk[0:10], self.keys[0:10], self.path_to_file)
+
+        # Append new transforms and overwrite an existing one
+        transform_sitk = sitk.Euler3DTransform()
+        sitkh.write_transforms_bulk_sitk(
+            self.transforms_sitk[10:] + [transform_sitk],
+            self.keys[10:] + ["slice3"],
+            self.path_to_file,
+            append=True)
+
+        transform_bulk_file = TransformBulkFile(self.path_to_file)
+        self.assertEqual(len(transform_bulk_file), len(self.keys) + 1)
+        self.assertEqual(transform_bulk_file.keys(), self.keys)
+        self.assertEqualTransforms(
+            transform_sitk, transform_bulk_file["slice3"])
+        self.assertEqualTransforms(
+            self.transforms_sitk[-1], transform_bulk_file[self.keys[-1]])
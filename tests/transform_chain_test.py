@@ -0,0 +1,114 @@
+# \file transform_chain_test.py
+#  \brief  Class containing unit tests for module TransformChain
+#
+#  \author Michael Ebner (michael.ebner.14@ucl.ac.uk)
+#  \date October 2026
+
+
+# Import libraries
+import SimpleITK as sitk
+import numpy as np
+import unittest
+
+# Import modules
+import pysitk.simple_itk_helper as sitkh
+from pysitk.transform_chain import TransformChain
+
+from transform_batch_test import get_random_euler_transforms
+
+
+class TransformChainTest(unittest.TestCase):
+
+    def setUp(self):
+        self.accuracy = 8
+        np.random.seed(3)
+        self.points = np.random.rand(5, 3) * 100
+
+    def get_composite_transform(self, transforms_sitk):
+        transform_sitk = transforms_sitk[0]
+        for transform_inner_sitk in transforms_sitk[1:]:
+            transform_sitk = sitkh.get_composite_sitk_affine_transform(
+                transform_sitk, transform_inner_sitk)
+        return transform_sitk
+
+    def assertEqualPoints(self, points, transform_sitk, points_transformed):
+        for point, point_transformed in zip(points, points_transformed):
+            self.assertEqual(np.round(np.linalg.norm(
+                transform_sitk.TransformPoint(point) - point_transformed),
+                decimals=self.accuracy), 0)
+
+    def test_transform_chain(self):
+        transforms_sitk = get_random_euler_transforms(10)
+        transform_chain = TransformChain(transforms_sitk)
+
+        transform_sitk = self.get_composite_transform(transforms_sitk)
+        self.assertEqualPoints(
+            self.points, transform_sitk,
+            transform_chain.transform_points(self.points))
+
+        # Flattened chain keeps the transform type and innermost center
+        transform_chain_sitk = transform_chain.get_sitk_transform()
+        self.assertEqual(transform_chain_sitk.GetName(), "Euler3DTransform")
+        self.assertEqual(transform_chain_sitk.GetCenter(),
+                         transforms_sitk[-1].GetCenter())
+        self.assertEqualPoints(
+            self.points, transform_chain_sitk,
+            transform_chain.transform_points(self.points))
+
+        # Repeatedly change single operands
+        for i in [4, 4, 0, 9, 4]:
+            transforms_sitk[i] = get_random_euler_transforms(1)[0]
+            transform_chain.set_transform(i, transforms_sitk[i])
+            transform_sitk = self.get_composite_transform(transforms_sitk)
+            self.assertEqualPoints(
+                self.points, transform_sitk,
+                sitkh.transform_points_sitk(self.points, transform_chain))
+
+        # Operand modified in place
+        transforms_sitk[2].SetTranslation((1, 2, 3))
+        transform_chain.invalidate(2)
+        transform_sitk = self.get_composite_transform(transforms_sitk)
+        self.assertEqualPoints(
+            self.points, transform_sitk,
+            transform_chain.transform_points(self.points))
+
+        # Mixed transform types result in affine transforms
+        transforms_sitk.append(sitk.AffineTransform(
+            np.eye(3).flatten() + 0.1, (1., 2., 3.), (4., 5., 6.)))
+        transform_chain.append(transforms_sitk[-1])
+        transform_sitk = self.get_composite_transform(transforms_sitk)
+        transform_chain_sitk = transform_chain.get_sitk_transform()
+        self.assertEqual(transform_chain_sitk.GetName(), "AffineTransform")
+        self.assertEqualPoints(
+            self.points, transform_sitk,
+            transform_chain.transform_points(self.points))
+
+    def test_transform_chain_versor(self):
+        transforms_sitk = [
+            sitk.VersorTransform(
+                np.random.rand(3) - 0.5, np.random.rand(),
+                np.random.rand(3) * 10)
+            for i in range(2)]
+
+        # Rotations about different centers result in an affine transform
+        transform_chain_sitk = TransformChain(
+            transforms_sitk).get_sitk_transform()
+        self.assertEqual(transform_chain_sitk.GetName(), "AffineTransform")
+        points_transformed = np.array([
+            transforms_sitk[0].TransformPoint(
+                transforms_sitk[1].TransformPoint(point))
+            for point in self.points])
+        self.assertEqualPoints(
+            self.points, transform_chain_sitk, points_transformed)
+
+        # Rotations about the same center remain a VersorTransform
+        transforms_sitk[0].SetCenter(transforms_sitk[1].GetCenter())
+        transform_chain_sitk = TransformChain(
+            transforms_sitk).get_sitk_transform()
+        self.assertEqual(transform_chain_sitk.GetName(), "VersorTransform")
+        points_transformed = np.array([
+            transforms_sitk[0].TransformPoint(
+                transforms_sitk[1].TransformPoint(point))
+            for point in self.points])
+        self.assertEqualPoints(
+            self.points, transform_chain_sitk, points_transformed)